@@ -6,10 +6,15 @@ import io
 from threading import Timer
 from datetime import datetime
 import uuid
+import time
 
 from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, send_file
 import mysql.connector
 from mysql.connector import Error
+import assets
+import portal_metrics
+from portal_metrics import metrics
+from models import ballot_queue, ballot_journal
 
 
 # --- FIX PATHS FOR PYINSTALLER (.exe support) ---
@@ -44,13 +49,50 @@ def get_db_connection():
     Self-Healing Connection:
     Tries to connect and returns None if XAMPP is offline.
     """
+    start = time.perf_counter()
+    conn = None
     try:
         conn = mysql.connector.connect(**db_config)
-        if conn.is_connected():
-            return conn
-    except:
-        return None
-    return None
+        if not conn.is_connected(): conn = None
+    except Exception as e:
+        metrics.record_error("db_connect", e)
+        conn = None
+    metrics.record_connect(time.perf_counter() - start, conn is not None)
+    return portal_metrics.TimedConnection(conn, metrics) if conn else None
+
+
+def count_active_sessions():
+    conn = get_db_connection()
+    if not conn: return None
+    try:
+        cursor = conn.cursor(buffered=True)
+        cursor.execute("SELECT COUNT(*) FROM `users` WHERE `last_active` > DATE_SUB(NOW(), INTERVAL 15 SECOND)")
+        return cursor.fetchone()[0]
+    finally:
+        conn.close()
+
+
+# Every ballot is fsynced to this local journal before it commits; replay it with
+# python -m models.ballot_journal if the database loses votes
+journal = ballot_journal.shared(ballot_journal.journal_path("portal.journal"))
+
+# Ballots from a burst of voters are committed together by one thread (see models/ballot_queue.py);
+# VOTESPHERE_GROUP_COMMIT=0 writes each ballot in its own transaction instead
+ballots = None
+if os.environ.get("VOTESPHERE_GROUP_COMMIT", "1") != "0":
+    ballots = ballot_queue.BallotQueue(lambda: mysql.connector.connect(**db_config), journal,
+                                       max_batch=int(os.environ.get("VOTESPHERE_GROUP_COMMIT_SIZE", ballot_queue.MAX_BATCH)),
+                                       max_delay=float(os.environ.get("VOTESPHERE_GROUP_COMMIT_MS", ballot_queue.MAX_DELAY * 1000)) / 1000)
+
+SUBMIT_ERRORS = {
+    "voted": "You have already voted.",
+    "invalid": "Your ballot did not match the current candidates. Please reload the page.",
+    "busy": "The server is busy. Please submit again.",
+    "error": "Could not record your vote. Please try again.",
+}
+
+portal_metrics.init_app(app, active_sessions=count_active_sessions)
+assets.init_app(app)
 
 
 def is_election_active(conn):
@@ -74,6 +116,7 @@ def is_election_active(conn):
                 return False, "Election time has ended."
         return True, "Active"
     except Exception as e:
+        metrics.record_error("election_check", e)
         return False, "Database check error."
 
 
@@ -131,7 +174,8 @@ def get_candidate_image(candidate_id):
         if row and row[0]:
             return send_file(io.BytesIO(row[0]), mimetype='image/png')
         return send_file(resource_path('static/default.png'), mimetype='image/png')
-    except:
+    except Exception as e:
+        metrics.record_error("candidate_image", e)
         return ""
     finally:
         if 'cursor' in locals(): cursor.close()
@@ -156,25 +200,19 @@ def vote():
             if not active:
                 return jsonify({"status": "error", "message": msg})
 
-            # Check if user already voted
-            cursor.execute("SELECT voted FROM users WHERE id = %s", (session['user_id'],))
-            check = cursor.fetchone()
-            if check and check['voted']:
-                return jsonify({"status": "error", "message": "You have already voted."})
-
-            # Process the votes
-            for position, candidate_id in request.form.items():
-                cursor.execute("INSERT INTO `votes` (`voter_id`, `candidate_id`, `position`) VALUES (%s, %s, %s)",
-                               (session['user_id'], candidate_id, position))
-                cursor.execute("UPDATE `candidates` SET `votes` = `votes` + 1 WHERE `id` = %s", (candidate_id,))
-
-            cursor.execute("UPDATE `users` SET `voted` = 1 WHERE `id` = %s", (session['user_id'],))
-            cursor.execute("INSERT INTO `audit_trail` (user, module, action, description) VALUES (%s, %s, %s, %s)",
-                           (session['full_name'], 'Election', 'Mobile Vote', f"Voted successfully"))
+            # Same key on every retry of one submission (see vote.js)
+            key = request.headers.get('X-Idempotency-Key', '')[:64] or None
+            audit = (session['full_name'], 'Election', 'Mobile Vote', "Voted successfully")
+            if ballots:
+                status, receipt = ballots.submit(session['user_id'], request.form.to_dict(), key, audit)
+            else:
+                status, receipt = ballot_queue.submit_one(conn, session['user_id'], request.form.to_dict(), key, audit, journal)
+            if status != "ok":
+                if status != "voted": metrics.record_error(f"vote_{status}")
+                return jsonify({"status": "error", "message": SUBMIT_ERRORS[status]})
 
-            conn.commit()
             session.clear()
-            return jsonify({"status": "success", "message": "Vote Submitted!"})
+            return jsonify({"status": "success", "message": "Vote Submitted!", "receipt": receipt})
 
         # FETCH DATA FOR UI
         cursor.execute("SELECT DISTINCT `position` FROM `candidates` ORDER BY `position` ASC")
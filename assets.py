@@ -0,0 +1,62 @@
+import os
+import json
+import mimetypes
+from flask import request, send_file, abort, url_for
+from werkzeug.security import safe_join
+
+ROUTE = "/assets"
+SOURCE_DIR = "src"        # un-built css/js inside the static folder
+DIST_DIR = "dist"         # output of build_assets.py inside the static folder
+LONG_CACHE = "public, max-age=31536000, immutable"
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class AssetManifest:
+    def __init__(self, static_folder):
+        self.static_folder = static_folder
+        self.dist = os.path.join(static_folder, DIST_DIR)
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(os.path.join(self.dist, "manifest.json"), encoding="utf-8") as f: self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+            print("[assets] No built assets found, serving sources. Run: python build_assets.py")
+
+    def url(self, name, fmt="file", width=None):
+        entry = self.entries.get(name)
+        if entry is None:
+            # Not built yet: css/js come from static/src, images straight from static/
+            source = f"{SOURCE_DIR}/{name}" if name.endswith((".css", ".js")) else name
+            return url_for("static", filename=source)
+        if "variants" in entry:
+            variants = entry["variants"]
+            entry = variants.get(str(width)) or variants[str(max(int(w) for w in variants))]
+        return url_for("hashed_asset", filename=entry.get(fmt) or entry.get("fallback") or entry["file"])
+
+
+def init_app(app):
+    manifest = AssetManifest(app.static_folder)
+    app.jinja_env.globals["asset"] = manifest.url
+
+    @app.route(ROUTE + "/<path:filename>")
+    def hashed_asset(filename):
+        path = safe_join(manifest.dist, filename)
+        if path is None or not os.path.isfile(path): abort(404)
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        accepted = request.headers.get("Accept-Encoding", "")
+        encoding = None
+        for name, ext in ENCODINGS:
+            if name in accepted and os.path.isfile(path + ext):
+                path, encoding = path + ext, name
+                break
+        response = send_file(path, mimetype=mimetype, conditional=True, etag=True)
+        if encoding: response.headers["Content-Encoding"] = encoding
+        response.headers["Vary"] = "Accept-Encoding"
+        # Names carry a content hash, so a file at a given URL never changes
+        response.headers["Cache-Control"] = LONG_CACHE
+        return response
+
+    return manifest
\ No newline at end of file
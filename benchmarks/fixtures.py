@@ -0,0 +1,60 @@
+import os
+import zlib
+import struct
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+SCHEMA = [
+    "CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE, password TEXT, role TEXT, full_name TEXT, grade TEXT, section TEXT, voted INTEGER DEFAULT 0, session_token TEXT, last_active DATETIME)",
+    "CREATE TABLE candidates (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, position TEXT, grade TEXT, votes INTEGER DEFAULT 0, image BLOB)",
+    "CREATE TABLE votes (id INTEGER PRIMARY KEY AUTOINCREMENT, voter_id INTEGER, candidate_id INTEGER, position TEXT, timestamp DATETIME DEFAULT CURRENT_TIMESTAMP)",
+    "CREATE TABLE ballot_receipts (voter_id INTEGER PRIMARY KEY, idempotency_key TEXT, receipt TEXT, created_at DATETIME DEFAULT CURRENT_TIMESTAMP)",
+    "CREATE TABLE system_config (`key` TEXT PRIMARY KEY, value TEXT)",
+    "CREATE TABLE audit_trail (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp DATETIME DEFAULT CURRENT_TIMESTAMP, user TEXT, module TEXT, action TEXT, description TEXT)",
+    "CREATE TABLE deleted_users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT, full_name TEXT, grade TEXT, section TEXT, deleted_at DATETIME DEFAULT CURRENT_TIMESTAMP)",
+    "CREATE TABLE deleted_candidates (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, position TEXT, grade TEXT, image BLOB, deleted_at DATETIME DEFAULT CURRENT_TIMESTAMP)",
+]
+POSITIONS = ["President", "Vice President", "Secretary", "Treasurer", "Auditor", "PIO", "Peace Officer", "Grade Representative"]
+GRADES = ["Grade 7", "Grade 8", "Grade 9", "Grade 10", "Grade 11", "Grade 12"]
+VOTER_PASSWORD = "pass123"
+
+
+def make_png(size, rgb, rng=None):
+    """RGB PNG built with the standard library only; rng adds noise so the file is photo-sized."""
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff)
+    base = bytes(rgb) * size
+    rows = []
+    for _ in range(size):
+        px = bytes(b ^ (rng.getrandbits(8) & 0x3f) for b in base) if rng else base
+        rows.append(b"\x00" + px)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(b"".join(rows))) + chunk(b"IEND", b""))
+
+
+def voter_username(i):
+    return f"S{i:05d}"
+
+
+def create_database(path, voters, positions=6, per_position=3, image_size=160, seed=7):
+    if os.path.exists(path): os.remove(path)
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    for q in SCHEMA: conn.execute(q)
+    conn.execute("INSERT INTO users (username, password, role, full_name) VALUES ('admin', 'admin123', 'admin', 'System Administrator')")
+    conn.executemany("INSERT INTO users (username, password, role, full_name, grade, section) VALUES (?, ?, 'voter', ?, ?, ?)",
+                     [(voter_username(i), VOTER_PASSWORD, f"Student {i}", rng.choice(GRADES), f"S-{i % 12}") for i in range(voters)])
+    for pos in POSITIONS[:positions]:
+        for c in range(per_position):
+            img = make_png(image_size, (rng.randrange(256), rng.randrange(256), rng.randrange(256)), rng)
+            conn.execute("INSERT INTO candidates (name, position, grade, image) VALUES (?, ?, ?, ?)",
+                         (f"{pos} Candidate {c + 1}", pos, rng.choice(GRADES), img))
+    target = (datetime.now() + timedelta(hours=6)).isoformat(timespec="seconds")
+    conn.executemany("INSERT INTO system_config (`key`, value) VALUES (?, ?)", [
+        ("election_name", "Benchmark Election"), ("election_status", "active"),
+        ("election_target_time", target), ("election_duration", "21600"), ("min_app_version", "2.3")])
+    conn.commit()
+    conn.close()
+    return path
\ No newline at end of file
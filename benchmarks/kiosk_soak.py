@@ -0,0 +1,243 @@
+"""
+Soak test for the desktop kiosk: cycles voters through the real controllers
+on Qt's offscreen platform and watches for anything that grows per voter.
+
+Every cycle types a voter's credentials into the LoginController window,
+opens every position on the VoterController dashboard, picks a candidate
+for each, submits (VoterModel.submit_ballot) and lands back on the login
+window. Modal popups are answered automatically. Every --sample cycles it
+records RSS, live widgets / QObjects, QGraphicsDropShadowEffects, QTimer
+wrappers, animation-clock tickers and the cycle latency:
+
+    python -m benchmarks.kiosk_soak --cycles 5000 --json soak.json
+    python -m benchmarks.kiosk_soak --mode recreate --cycles 1000    # no kiosk reuse
+
+After the warm-up the object counts must stay flat and RSS must grow less
+than --rss-limit MB per 1000 voters, otherwise it exits with status 1.
+Voters are reset to "not voted" whenever the seeded list wraps around.
+"""
+import os
+import gc
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks import fixtures
+from benchmarks.model_bench import open_database, seed, git_revision
+
+COUNTERS = ["widgets", "top_level", "qobjects", "shadow_effects", "qtimers", "active_qtimers", "tickers", "py_objects"]
+
+
+def rss_kb():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss // 1024
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f: return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+class Soak:
+    def __init__(self, app, db, voters, opts):
+        from PyQt6.QtCore import QTimer
+        from controllers import login_controller
+        from controllers.voter.voter_controller import VoterController
+        from view.common import animation_clock
+        login_controller.KIOSK = opts.mode == "kiosk"
+        VoterController.SUBMIT_DELAY = 0
+        if opts.low_power: animation_clock.set_low_power(True)
+        self.app, self.db, self.voters, self.opts = app, db, voters, opts
+        self.rng = random.Random(opts.seed)
+        self.clock = animation_clock.clock()
+        self.login = login_controller.LoginController(db)
+        # Answers whatever modal is up (confirm, receipt, error) the way a voter clicking OK would
+        self.dismisser = QTimer()
+        self.dismisser.timeout.connect(self.dismiss_modal)
+        self.dismisser.start(5)
+        self.next_voter = 0
+
+    def dismiss_modal(self):
+        from PyQt6.QtWidgets import QApplication, QDialog
+        w = QApplication.activeModalWidget()
+        if isinstance(w, QDialog): w.accept()
+
+    def wait_until(self, condition, what, timeout=10.0):
+        from PyQt6.QtTest import QTest
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            if time.perf_counter() > deadline: raise RuntimeError(f"timed out waiting for {what}")
+            QTest.qWait(1)   # also runs deferred deletes, unlike a bare processEvents()
+
+    def take_voter(self):
+        if self.next_voter == len(self.voters):
+            cursor = self.db.get_connection().cursor()
+            cursor.execute("DELETE FROM votes")
+            cursor.execute("DELETE FROM ballot_receipts")
+            cursor.execute("UPDATE users SET voted=0, last_active=NULL, session_token=NULL WHERE role='voter'")
+            self.db.get_connection().commit()
+            cursor.close()
+            self.next_voter = 0
+        voter = self.voters[self.next_voter]
+        self.next_voter += 1
+        return voter
+
+    def cycle(self):
+        from PyQt6.QtTest import QTest
+        from PyQt6.QtCore import Qt
+        _, username = self.take_voter()
+        view = self.login.view
+        start = time.perf_counter()
+        view.username_input.setText(username)
+        view.password_input.setText(fixtures.VOTER_PASSWORD)
+        view.login_btn.click()
+        vc = self.login.voter_ctrl
+        if vc is None or view.isVisible(): raise RuntimeError(f"login failed for {username}")
+        logged_in = time.perf_counter()
+        for btn in list(vc.pos_group):
+            btn.click()
+            cards = list(vc.cand_panels[btn.text()][1].values())
+            QTest.mouseClick(self.rng.choice(cards), Qt.MouseButton.LeftButton)
+        if len(vc.selected_candidates) != len(vc.ballot): raise RuntimeError(f"incomplete ballot for {username}")
+        selected = time.perf_counter()
+        vc.view.btn_submit.click()
+        self.wait_until(lambda: view.isVisible() and not vc.is_submitting, f"{username} to return to the login window")
+        end = time.perf_counter()
+        return {"login_ms": (logged_in - start) * 1000, "ballot_ms": (selected - logged_in) * 1000,
+                "submit_ms": (end - selected) * 1000, "cycle_ms": (end - start) * 1000}
+
+    def counters(self):
+        from PyQt6.QtCore import QObject, QTimer
+        from PyQt6.QtWidgets import QGraphicsDropShadowEffect
+        from PyQt6.QtTest import QTest
+        QTest.qWait(20)   # let pending deleteLater()s land before counting
+        gc.collect()
+        tops = self.app.topLevelWidgets()
+        py_objects = gc.get_objects()
+        timers = [o for o in py_objects if isinstance(o, QTimer)]
+        return {
+            "widgets": len(self.app.allWidgets()),
+            "top_level": len(tops),
+            "qobjects": sum(len(w.findChildren(QObject)) + 1 for w in tops),
+            "shadow_effects": sum(len(w.findChildren(QGraphicsDropShadowEffect)) for w in tops),
+            "qtimers": len(timers),
+            "active_qtimers": sum(1 for t in timers if t.isActive()),
+            "tickers": len(self.clock.tickers),
+            "py_objects": len(py_objects),
+        }
+
+    def sample(self, done, window):
+        point = {"cycle": done, "rss_kb": rss_kb(), **self.counters()}
+        if window:
+            point["cycle_median_ms"] = round(statistics.median(window), 3)
+            point["cycle_p95_ms"] = round(percentile(window, 0.95), 3)
+        return point
+
+
+def print_point(point):
+    rss = f"{point['rss_kb'] / 1024:8.1f}" if point["rss_kb"] is not None else "     n/a"
+    latency = f"{point.get('cycle_median_ms', 0):9.2f}{point.get('cycle_p95_ms', 0):9.2f}"
+    print(f"{point['cycle']:>7}{rss}{point['widgets']:>9}{point['qobjects']:>10}{point['shadow_effects']:>9}"
+          f"{point['qtimers']:>8}{point['tickers']:>9}{latency}")
+
+
+def verdict(baseline, final, cycles, opts):
+    leaks = []
+    print(f"\n{'counter':<18}{'after warmup':>14}{'final':>10}{'growth':>10}")
+    for name in COUNTERS:
+        growth = final[name] - baseline[name]
+        # py_objects drifts with caches and interned strings; it is reported, not judged
+        flag = "  LEAK" if name != "py_objects" and growth > opts.tolerance else ""
+        if flag: leaks.append(name)
+        print(f"{name:<18}{baseline[name]:>14}{final[name]:>10}{growth:>+10}{flag}")
+    if baseline["rss_kb"] is not None and cycles:
+        per_1000 = (final["rss_kb"] - baseline["rss_kb"]) / 1024 / cycles * 1000
+        flag = "  LEAK" if per_1000 > opts.rss_limit else ""
+        if flag: leaks.append("rss")
+        print(f"{'rss MB / 1000':<18}{baseline['rss_kb'] / 1024:>14.1f}{final['rss_kb'] / 1024:>10.1f}{per_1000:>+10.2f}{flag}")
+    return leaks
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--backend", choices=["sqlite", "mysql"], default="sqlite")
+    ap.add_argument("--db", help="sqlite file to use (default: temp file)")
+    ap.add_argument("--mode", choices=["kiosk", "recreate"], default="kiosk",
+                    help="kiosk reuses one login window and dashboard (VOTESPHERE_KIOSK=1); recreate builds a dashboard per voter")
+    ap.add_argument("--cycles", type=int, default=2000, help="voter sessions to run")
+    ap.add_argument("--warmup", type=int, default=50, help="cycles before the baseline sample")
+    ap.add_argument("--sample", type=int, default=100, help="cycles between samples")
+    ap.add_argument("--voters", type=int, default=500, help="seeded voters, recycled when exhausted")
+    ap.add_argument("--positions", type=int, default=6)
+    ap.add_argument("--candidates", type=int, default=4, help="candidates per position")
+    ap.add_argument("--image-size", type=int, default=160, help="candidate photo edge in pixels")
+    ap.add_argument("--low-power", action="store_true", help="run with the animation clock in low-power mode")
+    ap.add_argument("--tolerance", type=int, default=5, help="object count growth tolerated after warm-up")
+    ap.add_argument("--rss-limit", type=float, default=20.0, help="RSS growth (MB per 1000 voters) reported as a leak")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", help="write the samples to this file")
+    opts = ap.parse_args(argv)
+    if opts.warmup < 1: ap.error("--warmup must be at least 1")
+    opts.audit_rows = opts.archived = 0
+
+    from PyQt6.QtWidgets import QApplication
+    from view.common import theme
+    app = QApplication(sys.argv[:1])
+    theme.install(app)
+    db = open_database(opts)
+    voters, _ = seed(db, opts, random.Random(opts.seed))
+    soak = Soak(app, db, voters, opts)
+
+    print(f"{'cycle':>7}{'rss MB':>8}{'widgets':>9}{'qobjects':>10}{'effects':>9}{'timers':>8}{'tickers':>9}{'med ms':>9}{'p95 ms':>9}")
+    samples, window, phases = [], [], {"login_ms": [], "ballot_ms": [], "submit_ms": [], "cycle_ms": []}
+    baseline = None
+    start = time.perf_counter()
+    for done in range(1, opts.warmup + opts.cycles + 1):
+        timing = soak.cycle()
+        window.append(timing["cycle_ms"])
+        if done > opts.warmup:
+            for k, v in timing.items(): phases[k].append(v)
+        if done == opts.warmup or (done > opts.warmup and (done - opts.warmup) % opts.sample == 0) or done == opts.warmup + opts.cycles:
+            point = soak.sample(done, window)
+            window = []
+            samples.append(point)
+            print_point(point)
+            if baseline is None: baseline = point
+    elapsed = time.perf_counter() - start
+
+    leaks = verdict(baseline, samples[-1], opts.cycles, opts)
+    summary = {k: {"median_ms": round(statistics.median(v), 3), "p95_ms": round(percentile(v, 0.95), 3),
+                   "max_ms": round(max(v), 3)} for k, v in phases.items() if v}
+    for k, r in summary.items(): print(f"{k:<12} median {r['median_ms']:>8.2f} ms   p95 {r['p95_ms']:>8.2f} ms   max {r['max_ms']:>8.2f} ms")
+    print(f"{opts.warmup + opts.cycles} sessions in {elapsed:.1f}s" + (f"; leaks: {', '.join(leaks)}" if leaks else "; no growth"))
+
+    if opts.json:
+        report = {
+            "meta": {"timestamp": datetime.now().isoformat(timespec="seconds"), "git": git_revision(),
+                     "python": platform.python_version(), "platform": platform.platform(), "backend": opts.backend,
+                     "qpa": os.environ.get("QT_QPA_PLATFORM"), "seconds": round(elapsed, 1)},
+            "config": {k: getattr(opts, k) for k in ("mode", "cycles", "warmup", "sample", "voters", "positions", "candidates", "image_size", "low_power", "seed")},
+            "samples": samples,
+            "latency": summary,
+            "leaks": leaks,
+        }
+        with open(opts.json, "w") as f: json.dump(report, f, indent=2)
+    return 1 if leaks else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
\ No newline at end of file
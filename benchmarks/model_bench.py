@@ -0,0 +1,208 @@
+"""
+Micro-benchmarks for the models/ hot paths.
+
+Seeds a synthetic election of the requested size, then times each model
+call in isolation and writes the numbers as JSON, so two releases can be
+compared call by call:
+
+    python -m benchmarks.model_bench --voters 5000 --audit-rows 20000 --json before.json
+    python -m benchmarks.model_bench --voters 5000 --audit-rows 20000 --json after.json --compare before.json
+
+The default backend is benchmarks.sqlite_backend. Pass --backend mysql to
+run against a local MySQL server; the data goes into a separate
+votesphere_bench database, which is recreated on every run.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime
+
+from benchmarks import fixtures
+from benchmarks.sqlite_backend import install_as_mysql_connector
+
+BENCH_DB = "votesphere_bench"
+SEED_TABLES = ["votes", "ballot_receipts", "audit_trail", "deleted_users", "deleted_candidates", "candidates", "users", "system_config"]
+AUDIT_MODULES = ["Security", "Election", "Voters", "Candidates", "System"]
+
+
+def open_database(opts):
+    # Ballot journals go to a scratch directory, not the working directory
+    os.environ.setdefault("VOTESPHERE_BALLOT_JOURNAL", os.path.join(tempfile.mkdtemp(prefix="votesphere-bench-"), "ballots.journal"))
+    if opts.backend == "sqlite":
+        path = opts.db or os.path.join(tempfile.mkdtemp(prefix="votesphere-bench-"), "models.db")
+        if os.path.exists(path): os.remove(path)
+        install_as_mysql_connector(path)
+    from models.database import Database
+
+    class BenchDatabase(Database):
+        def first_time_setup(self):
+            self.db_name = BENCH_DB
+            super().first_time_setup()
+
+    db = BenchDatabase()
+    if db.conn is None: sys.exit("Could not connect to the database backend.")
+    return db
+
+
+def seed(db, opts, rng):
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    for table in SEED_TABLES: cursor.execute(f"DELETE FROM {table}")
+    cursor.execute("INSERT INTO users (username, password, role, full_name) VALUES ('admin', 'admin123', 'admin', 'System Administrator')")
+    cursor.executemany("INSERT INTO users (username, password, role, full_name, grade, section) VALUES (%s, %s, 'voter', %s, %s, %s)",
+                       [(fixtures.voter_username(i), fixtures.VOTER_PASSWORD, f"Student {i}", rng.choice(fixtures.GRADES), f"S-{i % 12}")
+                        for i in range(opts.voters)])
+    positions = fixtures.POSITIONS[:opts.positions]
+    for pos in positions:
+        for c in range(opts.candidates):
+            img = fixtures.make_png(opts.image_size, (rng.randrange(256), rng.randrange(256), rng.randrange(256)), rng)
+            cursor.execute("INSERT INTO candidates (name, position, grade, votes, image) VALUES (%s, %s, %s, %s, %s)",
+                           (f"{pos} Candidate {c + 1}", pos, rng.choice(fixtures.GRADES), rng.randrange(opts.voters + 1), img))
+    cursor.executemany("INSERT INTO audit_trail (user, module, action, description) VALUES (%s, %s, %s, %s)",
+                       [("admin", rng.choice(AUDIT_MODULES), "Seed", f"Synthetic audit row {i}") for i in range(opts.audit_rows)])
+    cursor.executemany("INSERT INTO deleted_users (username, full_name, grade, section) VALUES (%s, %s, %s, %s)",
+                       [(f"X{i:05d}", f"Archived {i}", rng.choice(fixtures.GRADES), "S-0") for i in range(opts.archived)])
+    cursor.executemany("INSERT INTO deleted_candidates (name, position, grade) VALUES (%s, %s, %s)",
+                       [(f"Archived Candidate {i}", rng.choice(positions), rng.choice(fixtures.GRADES)) for i in range(opts.archived)])
+    for key, value in [("election_name", "Benchmark Election"), ("election_status", "active"), ("min_app_version", "2.3")]:
+        cursor.execute("INSERT INTO system_config (`key`, value) VALUES (%s, %s)", (key, value))
+    conn.commit()
+    cursor.execute("SELECT id, username FROM users WHERE role = 'voter' ORDER BY id")
+    voters = cursor.fetchall()
+    cursor.execute("SELECT id, position FROM candidates")
+    ballot = {}
+    for cid, pos in cursor.fetchall(): ballot.setdefault(pos, []).append(cid)
+    cursor.close()
+    return voters, ballot
+
+
+def build_cases(db, voters, ballot, rng):
+    from models.login_model import LoginModel
+    from models.voter.voter_model import VoterModel
+    from models.admin.results_model import ResultsModel
+    from models.admin.audit_model import AuditModel
+    from models.admin.candidate_model import CandidateModel
+    from models.admin.settings_model import SettingsModel
+    from models import ballot_journal
+    login, voter, results = LoginModel(db), VoterModel(db), ResultsModel(db)
+    audit, candidates, settings = AuditModel(db), CandidateModel(db), SettingsModel(db)
+    unused = iter(voters)
+
+    def submit_ballot():
+        user_id, username = next(unused)
+        status, _ = voter.submit_ballot(user_id, username, {pos: rng.choice(ids) for pos, ids in ballot.items()})
+        if status != "ok": raise RuntimeError(f"submit_ballot returned {status}")
+
+    # A full election's journal (one ballot per seeded voter) for the replay case
+    replay_path = os.path.join(tempfile.mkdtemp(prefix="votesphere-bench-"), "replay.journal")
+    with open(replay_path, "wb") as f:
+        f.write(b"".join(ballot_journal.pack(user_id, [rng.choice(ids) for ids in ballot.values()]) for user_id, _ in voters))
+
+    return {
+        "LoginModel.authenticate": lambda: login.authenticate(rng.choice(voters)[1], fixtures.VOTER_PASSWORD),
+        "VoterModel.submit_ballot": submit_ballot,
+        "VoterModel.get_trends": voter.get_trends,
+        "ResultsModel.get_standings": results.get_standings,
+        "AuditModel.fetch_logs": audit.fetch_logs,
+        "CandidateModel.fetch_candidates": candidates.fetch_candidates,
+        "SettingsModel.get_archive_data[voters]": lambda: settings.get_archive_data("voters"),
+        "SettingsModel.get_archive_data[candidates]": lambda: settings.get_archive_data("candidates"),
+        "ballot_journal.replay": lambda: ballot_journal.tally(ballot_journal.scan([replay_path])[0]),
+    }
+
+
+def time_case(fn, repeat, warmup):
+    for _ in range(warmup): fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "runs": repeat,
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "min_ms": round(samples[0], 4),
+        "max_ms": round(samples[-1], 4),
+        "stdev_ms": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def compare(results, baseline_path, threshold):
+    with open(baseline_path) as f: baseline = json.load(f)["results"]
+    regressions = []
+    print(f"\n{'call':<44}{'base ms':>10}{'now ms':>10}{'change':>9}")
+    for name, r in results.items():
+        if name not in baseline: continue
+        before, now = baseline[name]["median_ms"], r["median_ms"]
+        change = (now - before) / before * 100 if before else 0.0
+        flag = "  REGRESSION" if change > threshold else ""
+        if flag: regressions.append(name)
+        print(f"{name:<44}{before:>10.3f}{now:>10.3f}{change:>+8.1f}%{flag}")
+    return regressions
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--backend", choices=["sqlite", "mysql"], default="sqlite")
+    ap.add_argument("--db", help="sqlite file to use (default: temp file)")
+    ap.add_argument("--voters", type=int, default=2000)
+    ap.add_argument("--positions", type=int, default=6)
+    ap.add_argument("--candidates", type=int, default=4, help="candidates per position")
+    ap.add_argument("--audit-rows", type=int, default=5000)
+    ap.add_argument("--archived", type=int, default=200, help="rows in each archive table")
+    ap.add_argument("--image-size", type=int, default=160, help="candidate photo edge in pixels")
+    ap.add_argument("--repeat", type=int, default=50)
+    ap.add_argument("--warmup", type=int, default=3)
+    ap.add_argument("--only", action="append", help="run only calls containing this text (repeatable)")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", help="write results to this file")
+    ap.add_argument("--compare", help="baseline JSON from an earlier run")
+    ap.add_argument("--threshold", type=float, default=15.0, help="median slowdown (%%) reported as a regression")
+    opts = ap.parse_args(argv)
+    if opts.voters < opts.repeat + opts.warmup: ap.error("--voters must cover --repeat + --warmup ballot submissions")
+
+    rng = random.Random(opts.seed)
+    db = open_database(opts)
+    seed_start = time.perf_counter()
+    voters, ballot = seed(db, opts, rng)
+    seed_time = time.perf_counter() - seed_start
+
+    results = {}
+    for name, fn in build_cases(db, voters, ballot, rng).items():
+        if opts.only and not any(o in name for o in opts.only): continue
+        results[name] = time_case(fn, opts.repeat, opts.warmup)
+        r = results[name]
+        print(f"{name:<44} median {r['median_ms']:>9.3f} ms   p95 {r['p95_ms']:>9.3f} ms   max {r['max_ms']:>9.3f} ms")
+
+    report = {
+        "meta": {"timestamp": datetime.now().isoformat(timespec="seconds"), "git": git_revision(),
+                 "python": platform.python_version(), "platform": platform.platform(), "backend": opts.backend,
+                 "seed_seconds": round(seed_time, 3)},
+        "config": {k: getattr(opts, k) for k in ("voters", "positions", "candidates", "audit_rows", "archived", "image_size", "repeat", "warmup", "seed")},
+        "results": results,
+    }
+    if opts.json:
+        with open(opts.json, "w") as f: json.dump(report, f, indent=2)
+    if opts.compare and compare(results, opts.compare, opts.threshold): return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
\ No newline at end of file
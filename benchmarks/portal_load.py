@@ -0,0 +1,216 @@
+"""
+Load test for the voter web portal (app.py on MySQL, server.py on SQLite).
+
+Spins the chosen portal up in-process on a werkzeug server and replays a
+school rush: every simulated voter opens the login page, signs in through
+"/", loads "/vote", downloads each candidate photo, sends a heartbeat every
+--heartbeat-interval seconds while "reading" the ballot and then submits it.
+
+    python -m benchmarks.portal_load --voters 2000 --concurrency 200
+    python -m benchmarks.portal_load --portal server --voters 500 --json out.json
+    python -m benchmarks.portal_load --backend mysql --voters 10000   # real MySQL, seeded separately
+    python -m benchmarks.portal_load --heartbeats 0 --group-commit off  # ballot ingestion without group commit
+
+With the default sqlite backend the database is generated from
+benchmarks.fixtures and app.py's mysql.connector calls are served by
+benchmarks.sqlite_backend, which also counts lock waits.
+"""
+import os
+import re
+import sys
+import json
+import html
+import time
+import random
+import argparse
+import threading
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import fixtures
+from benchmarks.sqlite_backend import install_as_mysql_connector, connect_sqlite, lock_stats
+
+ROUTES = ["GET /", "POST /", "GET /vote", "GET /candidate_image", "POST /heartbeat", "POST /vote"]
+RADIO = re.compile(r'<input type="radio" name="([^"]+)" value="(\d+)"')
+IMAGE = re.compile(r"/candidate_image/(\d+)")
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values: return 0.0
+    k = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[k]
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latency = {r: [] for r in ROUTES}
+        self.errors = {r: 0 for r in ROUTES}
+        self.samples = []
+
+    def call(self, route, fn, *args, expect=None, **kwargs):
+        start = time.perf_counter()
+        try:
+            resp = fn(*args, **kwargs)
+            ok = resp.status_code < 400 and (expect is None or expect(resp))
+            detail = f"{resp.status_code} {resp.text[:120]!r}"
+        except Exception as e:
+            resp, ok, detail = None, False, repr(e)
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.latency[route].append(elapsed)
+            if not ok:
+                self.errors[route] += 1
+                if len(self.samples) < 20: self.samples.append(f"{route}: {detail}")
+        return resp if ok else None
+
+    def summary(self, wall):
+        routes = {}
+        total = errors = 0
+        for route in ROUTES:
+            values = sorted(self.latency[route])
+            if not values: continue
+            total += len(values); errors += self.errors[route]
+            routes[route] = {
+                "requests": len(values),
+                "errors": self.errors[route],
+                "error_rate": round(self.errors[route] / len(values), 4),
+                "p50_ms": round(percentile(values, 50) * 1000, 2),
+                "p95_ms": round(percentile(values, 95) * 1000, 2),
+                "p99_ms": round(percentile(values, 99) * 1000, 2),
+                "max_ms": round(values[-1] * 1000, 2),
+                "rps": round(len(values) / wall, 2),
+            }
+        return {"routes": routes, "requests": total, "errors": errors,
+                "error_rate": round(errors / total, 4) if total else 0.0,
+                "throughput_rps": round(total / wall, 2), "error_samples": self.samples}
+
+
+def run_voter(base, index, opts, rec, rng):
+    import requests
+    s = requests.Session()
+    rec.call("GET /", s.get, base + "/")
+    login = rec.call("POST /", s.post, base + "/", allow_redirects=False,
+                     data={"username": fixtures.voter_username(index), "password": fixtures.VOTER_PASSWORD},
+                     expect=lambda r: r.status_code in (302, 303) and "/vote" in r.headers.get("Location", ""))
+    if login is None: return False
+    page = rec.call("GET /vote", s.get, base + "/vote", expect=lambda r: 'type="radio"' in r.text)
+    if page is None: return False
+    choices = {}
+    for pos, cid in RADIO.findall(page.text): choices.setdefault(html.unescape(pos), []).append(cid)
+    for cid in sorted(set(IMAGE.findall(page.text))):
+        rec.call("GET /candidate_image", s.get, base + f"/candidate_image/{cid}", expect=lambda r: len(r.content) > 0)
+    for _ in range(opts.heartbeats):
+        time.sleep(opts.heartbeat_interval * rng.uniform(0.8, 1.2))
+        rec.call("POST /heartbeat", s.post, base + "/heartbeat")
+    ballot = {pos: rng.choice(ids) for pos, ids in choices.items()}
+    headers = {"X-Requested-With": "XMLHttpRequest", "X-Idempotency-Key": f"load-{index}-{rng.getrandbits(32):08x}"}
+    done = rec.call("POST /vote", s.post, base + "/vote", data=ballot, headers=headers,
+                    expect=lambda r: r.json().get("status") == "success")
+    return done is not None
+
+
+def load_portal(opts, db_path):
+    if opts.portal == "server":
+        import server
+        server.get_db_connection = lambda: connect_sqlite(db_path)
+        return server.app
+    if opts.backend == "sqlite": install_as_mysql_connector(db_path)
+    os.environ["VOTESPHERE_GROUP_COMMIT"] = "1" if opts.group_commit == "on" else "0"
+    os.environ.setdefault("VOTESPHERE_BALLOT_JOURNAL", db_path + ".journal")
+    import app
+    if opts.backend == "mysql":
+        app.db_config.update(host=opts.mysql_host, user=opts.mysql_user, password=opts.mysql_password, database=opts.mysql_db)
+    return app.app
+
+
+def verify(opts, db_path):
+    if opts.backend != "sqlite": return {}
+    conn = connect_sqlite(db_path)
+    voted = conn.execute("SELECT COUNT(*) FROM users WHERE voted = 1").fetchone()[0]
+    tallied = conn.execute("SELECT COALESCE(SUM(votes), 0) FROM candidates").fetchone()[0]
+    rows = conn.execute("SELECT COUNT(*) FROM votes").fetchone()[0]
+    conn.close()
+    return {"voters_marked_voted": voted, "vote_rows": rows, "tallied_votes": tallied,
+            "tally_consistent": rows == tallied and rows == voted * opts.positions}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--portal", choices=["app", "server"], default="app", help="app.py (MySQL) or server.py (SQLite)")
+    ap.add_argument("--backend", choices=["sqlite", "mysql"], default="sqlite", help="database behind app.py")
+    ap.add_argument("--voters", type=int, default=500, help="simulated voters (up to 10000)")
+    ap.add_argument("--concurrency", type=int, default=100, help="voters in flight at once")
+    ap.add_argument("--positions", type=int, default=6)
+    ap.add_argument("--candidates", type=int, default=3, help="candidates per position")
+    ap.add_argument("--heartbeats", type=int, default=2, help="heartbeats sent while filling the ballot")
+    ap.add_argument("--heartbeat-interval", type=float, default=5.0)
+    ap.add_argument("--group-commit", choices=["on", "off"], default="on", help="app.py ballot ingestion queue (VOTESPHERE_GROUP_COMMIT)")
+    ap.add_argument("--db", help="sqlite file to create (default: temp file)")
+    ap.add_argument("--mysql-host", default="127.0.0.1")
+    ap.add_argument("--mysql-user", default="root")
+    ap.add_argument("--mysql-password", default="")
+    ap.add_argument("--mysql-db", default="votesphere")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", help="write the report to this file as well")
+    opts = ap.parse_args(argv)
+    if not 1 <= opts.voters <= 10000: ap.error("--voters must be between 1 and 10000")
+    if opts.portal == "server" and opts.backend == "mysql": ap.error("server.py only runs on SQLite")
+
+    db_path = opts.db or os.path.join(tempfile.mkdtemp(prefix="votesphere-bench-"), "portal.db")
+    if opts.backend == "sqlite":
+        fixtures.create_database(db_path, opts.voters, opts.positions, opts.candidates, seed=opts.seed)
+
+    from werkzeug.serving import make_server
+    portal = load_portal(opts, db_path)
+    httpd = make_server("127.0.0.1", 0, portal, threaded=True)
+    httpd.socket.listen(1024)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{httpd.server_port}"
+
+    rec = Recorder()
+    lock_stats.reset()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=opts.concurrency) as pool:
+        results = list(pool.map(lambda i: run_voter(base, i, opts, rec, random.Random(opts.seed + i)), range(opts.voters)))
+    wall = time.perf_counter() - start
+    httpd.shutdown()
+
+    report = {"portal": opts.portal, "backend": opts.backend, "voters": opts.voters, "concurrency": opts.concurrency,
+              "wall_seconds": round(wall, 2), "ballots_submitted": sum(results),
+              "ballots_per_second": round(sum(results) / wall, 2)}
+    report.update(rec.summary(wall))
+    report.update(lock_stats.snapshot() if opts.backend == "sqlite" else {"lock_waits": None})
+    report.update(verify(opts, db_path))
+    if opts.portal == "app":
+        import app
+        report["group_commit"] = app.ballots.stats() if app.ballots else None
+    print_report(report)
+    if opts.json:
+        with open(opts.json, "w") as f: json.dump(report, f, indent=2)
+    return report
+
+
+def print_report(report):
+    print(f"\n{report['portal']}.py on {report['backend']}: {report['voters']} voters, "
+          f"{report['concurrency']} concurrent, {report['wall_seconds']}s")
+    print(f"{'route':<22}{'reqs':>8}{'err%':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'rps':>9}")
+    for route, r in report["routes"].items():
+        print(f"{route:<22}{r['requests']:>8}{r['error_rate'] * 100:>7.2f}%{r['p50_ms']:>10}{r['p95_ms']:>10}"
+              f"{r['p99_ms']:>10}{r['max_ms']:>10}{r['rps']:>9}")
+    print(f"throughput {report['throughput_rps']} req/s, {report['ballots_per_second']} ballots/s, "
+          f"errors {report['errors']}/{report['requests']} ({report['error_rate'] * 100:.2f}%)")
+    if report.get("lock_waits") is not None:
+        print(f"lock waits {report['lock_waits']} ({report['lock_wait_seconds']}s total)")
+    if report.get("group_commit"):
+        g = report["group_commit"]
+        print(f"group commit: {g['ballots']} ballots in {g['groups']} groups (mean {g['mean_group']}, "
+              f"largest {g['largest_group']}, failed {g['failed_groups']})")
+    if "tally_consistent" in report:
+        print(f"tally: {report['vote_rows']} vote rows, {report['tallied_votes']} counted, "
+              f"{report['voters_marked_voted']} voters marked voted, consistent={report['tally_consistent']}")
+    for line in report["error_samples"]: print(f"  ! {line}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
\ No newline at end of file
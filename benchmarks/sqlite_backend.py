@@ -0,0 +1,215 @@
+"""
+MySQL-compatible stand-in backed by SQLite, for benchmarks only.
+
+Implements the slice of the mysql.connector API the portal and models use
+(connect, cursor(dictionary=, buffered=), commit/rollback, start_transaction,
+ping, is_connected) and rewrites the MySQL-only SQL they send. Connections
+never block inside SQLite (timeout=0); "database is locked" is retried here
+so every wait can be counted in lock_stats.
+"""
+import re
+import sys
+import time
+import types
+import sqlite3
+import hashlib
+import threading
+from functools import lru_cache
+
+BUSY_TIMEOUT = 30.0
+
+
+class Error(Exception):
+    pass
+
+
+class LockStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.waits = 0
+        self.wait_time = 0.0
+
+    def add(self, waited):
+        with self.lock:
+            self.waits += 1
+            self.wait_time += waited
+
+    def snapshot(self):
+        with self.lock:
+            return {"lock_waits": self.waits, "lock_wait_seconds": round(self.wait_time, 4)}
+
+
+lock_stats = LockStats()
+
+
+def retry_busy(fn, *args):
+    start = None
+    delay = 0.0005
+    while True:
+        try:
+            result = fn(*args)
+        except sqlite3.OperationalError as e:
+            msg = str(e)
+            if "locked" not in msg and "busy" not in msg: raise
+            now = time.perf_counter()
+            if start is None: start = now
+            elif now - start > BUSY_TIMEOUT: raise
+            time.sleep(delay)
+            delay = min(delay * 2, 0.01)
+            continue
+        if start is not None: lock_stats.add(time.perf_counter() - start)
+        return result
+
+
+_RULES = [
+    (re.compile(r"^\s*CREATE\s+DATABASE\b.*$", re.I | re.S), "SELECT 1"),
+    (re.compile(r"\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b", re.I), "INTEGER PRIMARY KEY AUTOINCREMENT"),
+    (re.compile(r"\)\s*ENGINE\s*=\s*\w+", re.I), ")"),
+    (re.compile(r"\bINSERT\s+IGNORE\b", re.I), "INSERT OR IGNORE"),
+    (re.compile(r"DATE_SUB\(\s*NOW\(\)\s*,\s*INTERVAL\s+(\d+)\s+(\w+?)S?\s*\)", re.I),
+     lambda m: f"datetime('now', 'localtime', '-{m.group(1)} {m.group(2).lower()}s')"),
+    (re.compile(r"\bNOW\(\)", re.I), "datetime('now', 'localtime')"),
+    (re.compile(r"\s+(LOCK\s+IN\s+SHARE\s+MODE|FOR\s+UPDATE)\b", re.I), ""),
+    (re.compile(r"%s"), "?"),
+]
+_WRITE = re.compile(r"^\s*(INSERT|UPDATE|DELETE|REPLACE|CREATE|DROP|ALTER)\b", re.I)
+
+
+@lru_cache(maxsize=512)
+def translate(sql):
+    for pattern, repl in _RULES:
+        sql = pattern.sub(repl, sql)
+    return sql
+
+
+def _md5(value):
+    if value is None: return None
+    if isinstance(value, str): value = value.encode()
+    return hashlib.md5(value).hexdigest()
+
+
+def open_sqlite(path, factory=sqlite3.Connection):
+    conn = sqlite3.connect(path, timeout=0, isolation_level=None, check_same_thread=False, factory=factory)
+    conn.create_function("MD5", 1, _md5, deterministic=True)
+    return conn
+
+
+class LockCountingConnection(sqlite3.Connection):
+    """Plain sqlite3 connection (for server.py) whose statements go through retry_busy."""
+
+    def execute(self, sql, params=()):
+        if _WRITE.match(sql) and not self.in_transaction:
+            retry_busy(super().execute, "BEGIN IMMEDIATE")
+        return retry_busy(super().execute, sql, params)
+
+    def commit(self):
+        if self.in_transaction: retry_busy(super().execute, "COMMIT")
+
+    def rollback(self):
+        if self.in_transaction: super().execute("ROLLBACK")
+
+
+def connect_sqlite(path):
+    conn = open_sqlite(path, LockCountingConnection)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+class MySQLiteCursor:
+    def __init__(self, connection, dictionary=False):
+        self.connection = connection
+        self.dictionary = dictionary
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+        self._rows = []
+        self._pos = 0
+
+    def _run(self, sql, params):
+        cur = self.connection._conn.execute(sql, params)
+        return cur, cur.fetchall() if cur.description else []
+
+    def execute(self, sql, params=()):
+        sql = translate(sql)
+        if _WRITE.match(sql): self.connection._before_write()
+        try:
+            cur, rows = retry_busy(self._run, sql, tuple(params or ()))
+        except sqlite3.Error as e:
+            raise Error(str(e)) from e
+        self.description = cur.description
+        self.rowcount = cur.rowcount if cur.description is None else len(rows)
+        self.lastrowid = cur.lastrowid
+        self._rows, self._pos = rows, 0
+
+    def executemany(self, sql, seq_params):
+        for params in seq_params: self.execute(sql, params)
+
+    def _shape(self, row):
+        if not self.dictionary: return tuple(row)
+        return {col[0]: val for col, val in zip(self.description, row)}
+
+    def fetchone(self):
+        if self._pos >= len(self._rows): return None
+        self._pos += 1
+        return self._shape(self._rows[self._pos - 1])
+
+    def fetchall(self):
+        rows = [self._shape(r) for r in self._rows[self._pos:]]
+        self._pos = len(self._rows)
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def close(self):
+        self._rows = []
+
+
+class MySQLiteConnection:
+    def __init__(self, path, autocommit=False):
+        self._conn = open_sqlite(path)
+        self.autocommit = autocommit
+        self.open = True
+
+    def cursor(self, dictionary=False, buffered=False, **kwargs):
+        return MySQLiteCursor(self, dictionary)
+
+    def _before_write(self):
+        if not self.autocommit and not self._conn.in_transaction: self.start_transaction()
+
+    def start_transaction(self, **kwargs):
+        retry_busy(self._conn.execute, "BEGIN IMMEDIATE")
+
+    def commit(self):
+        if self._conn.in_transaction: retry_busy(self._conn.execute, "COMMIT")
+
+    def rollback(self):
+        if self._conn.in_transaction: self._conn.execute("ROLLBACK")
+
+    def is_connected(self):
+        return self.open
+
+    def ping(self, reconnect=False, attempts=1, delay=0):
+        if not self.open: raise Error("Connection closed")
+
+    def close(self):
+        if self.open:
+            self.rollback()
+            self._conn.close()
+            self.open = False
+
+
+def install_as_mysql_connector(path):
+    """Register this backend as mysql.connector so app.py / models import it unchanged."""
+    module = types.ModuleType("mysql.connector")
+    module.Error = Error
+    module.errorcode = types.SimpleNamespace(ER_ACCESS_DENIED_ERROR=1045, ER_BAD_DB_ERROR=1049)
+    module.connect = lambda **config: MySQLiteConnection(path, autocommit=config.get("autocommit", False))
+    package = types.ModuleType("mysql")
+    package.connector = module
+    sys.modules["mysql"] = package
+    sys.modules["mysql.connector"] = module
+    return module
\ No newline at end of file
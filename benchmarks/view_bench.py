@@ -0,0 +1,261 @@
+"""
+Benchmarks for the Qt views: how long it takes to fill tables, cards and
+graphs from a seeded election, on Qt's offscreen platform.
+
+    python -m benchmarks.view_bench --json before.json
+    python -m benchmarks.view_bench --json after.json --compare before.json
+    python -m benchmarks.view_bench --only ManageVoters --voter-sizes 500,5000,50000
+
+Each case builds its view once (untimed), then times the population call
+plus one processEvents(), so the layout and paint work Qt defers to the
+event loop is counted too. After timing, one more run is traced to report
+Python allocations (tracemalloc peak and retained KB, net allocated
+blocks) and the RSS it added. The process peak RSS is recorded after
+every case.
+
+Cases: ManageVoters.load_voters at each --voter-sizes (larger sizes repeat
+fewer times), ManageCandidates.load_candidates, AuditLogController.update_logs
+over --audit-rows rows (the view shows the newest 500),
+ResultsController.refresh_display, VoterController.load_candidates with
+candidate photos (cold and warm avatar cache), and the paintEvent of both
+TopCandidatesGraph widgets.
+"""
+import os
+import gc
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+import tracemalloc
+from types import SimpleNamespace
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks.model_bench import open_database, seed, git_revision, compare
+from benchmarks.kiosk_soak import rss_kb
+
+WINDOW = (1366, 768)
+
+
+def peak_rss_kb():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset // 1024
+    except (ImportError, AttributeError):
+        return None
+
+
+def settle():
+    from PyQt6.QtTest import QTest
+    QTest.qWait(1)   # flushes deferred deletes as well as posted events
+
+
+def seed_dataset(db, opts, voters, audit_rows):
+    config = SimpleNamespace(voters=voters, positions=opts.positions, candidates=opts.candidates,
+                             image_size=opts.image_size, audit_rows=audit_rows, archived=0)
+    return seed(db, config, random.Random(opts.seed))
+
+
+def shown(widget):
+    widget.resize(*WINDOW)
+    widget.show()
+    settle()
+    return widget
+
+
+def graph_rows(db):
+    cursor = db.get_connection().cursor()
+    cursor.execute("SELECT name, votes, position FROM candidates ORDER BY votes DESC")
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def build_cases(db, voters, opts):
+    """name -> (before, run); `before` resets state outside the timed region."""
+    from PyQt6.QtGui import QImage
+    from PyQt6.QtWidgets import QApplication
+    from view.admin.admin_candidates import ManageCandidates
+    from view.admin import admin_view, admin_dashboard
+    from controllers.admin.audit_controller import AuditLogController
+    from controllers.admin.results_controller import ResultsController
+    from controllers.voter import voter_controller
+    from view.common.avatar_cache import AvatarCache
+    app = QApplication.instance()
+    cases = {}
+
+    candidates_view = shown(ManageCandidates(db))
+    cases["ManageCandidates.load_candidates"] = (None, candidates_view.load_candidates)
+
+    audit = AuditLogController(db)
+    audit.refresh_timer.stop(); audit.blink_timer.stop()
+    shown(audit.view)
+    # update_logs skips the rebuild when the row count is unchanged
+    cases[f"AuditLogController.update_logs[{opts.audit_rows}]"] = (lambda: audit.view.table.setRowCount(0), audit.update_logs)
+
+    results = ResultsController(db)
+    results.timer.stop()
+    shown(results.view)
+    cases["ResultsController.refresh_display"] = (None, results.refresh_display)
+
+    vc = voter_controller.VoterController(db, voters[0][0], "ADMIN_SESSION")
+    vc.timer.stop()
+    shown(vc.view)
+    positions = list(vc.ballot)
+
+    def reset_panels(cold):
+        for panel, _ in vc.cand_panels.values(): panel.deleteLater()
+        vc.cand_panels = {}
+        if cold: voter_controller.avatar_cache = AvatarCache()
+        settle()
+
+    def load_all_positions():
+        for pos in positions: vc.load_candidates(pos)
+
+    cases["VoterController.load_candidates[cold avatars]"] = (lambda: reset_panels(True), load_all_positions)
+    cases["VoterController.load_candidates[warm avatars]"] = (lambda: reset_panels(False), load_all_positions)
+
+    rows = graph_rows(db)
+    target = QImage(900, 400, QImage.Format.Format_ARGB32_Premultiplied)
+    graph = admin_view.TopCandidatesGraph()
+    graph.resize(900, 400)
+    graph.update_data(rows)
+    graph.animated_votes = {k: float(v) for k, v in graph.target_votes.items()}
+    cases["TopCandidatesGraph.paintEvent[admin_view]"] = (None, lambda: graph.render(target))
+
+    legacy = admin_dashboard.TopCandidatesGraph(db)
+    legacy.resize(900, 400)
+    legacy.update_data()
+    legacy.animated_votes = {k: float(v) for k, v in legacy.target_votes.items()}
+    cases["TopCandidatesGraph.paintEvent[admin_dashboard]"] = (None, lambda: legacy.render(target))
+
+    def with_events(fn):
+        def run():
+            fn()
+            app.processEvents()
+        return run
+
+    return {name: (before, with_events(run)) for name, (before, run) in cases.items()}
+
+
+def time_case(before, fn, repeat, warmup):
+    for _ in range(warmup):
+        if before: before()
+        fn()
+    samples = []
+    for _ in range(repeat):
+        if before: before()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "runs": repeat,
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "min_ms": round(samples[0], 4),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+def memory_case(before, fn):
+    if before: before()
+    gc.collect()
+    rss_before = rss_kb()
+    fn()
+    rss_after = rss_kb()
+    if before: before()
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "py_peak_kb": peak // 1024,
+        "py_retained_kb": current // 1024,
+        "net_blocks": sys.getallocatedblocks() - blocks,
+        "rss_delta_kb": rss_after - rss_before if rss_before is not None else None,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def run_case(results, name, before, fn, repeat, warmup):
+    r = time_case(before, fn, repeat, warmup)
+    r.update(memory_case(before, fn))
+    results[name] = r
+    print(f"{name:<52} median {r['median_ms']:>10.3f} ms   p95 {r['p95_ms']:>10.3f} ms   "
+          f"py peak {r['py_peak_kb']:>8,} KB   rss {r['rss_delta_kb'] if r['rss_delta_kb'] is not None else 'n/a':>8} KB")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--backend", choices=["sqlite", "mysql"], default="sqlite")
+    ap.add_argument("--db", help="sqlite file to use (default: temp file)")
+    ap.add_argument("--voters", type=int, default=2000, help="voters in the dataset for the non-sweep cases")
+    ap.add_argument("--voter-sizes", default="500,5000,50000", help="comma-separated sizes for ManageVoters.load_voters")
+    ap.add_argument("--positions", type=int, default=6)
+    ap.add_argument("--candidates", type=int, default=4, help="candidates per position")
+    ap.add_argument("--audit-rows", type=int, default=100000)
+    ap.add_argument("--image-size", type=int, default=160, help="candidate photo edge in pixels")
+    ap.add_argument("--repeat", type=int, default=10)
+    ap.add_argument("--warmup", type=int, default=2)
+    ap.add_argument("--only", action="append", help="run only cases containing this text (repeatable)")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", help="write results to this file")
+    ap.add_argument("--compare", help="baseline JSON from an earlier run")
+    ap.add_argument("--threshold", type=float, default=15.0, help="median slowdown (%%) reported as a regression")
+    opts = ap.parse_args(argv)
+    sizes = [int(n) for n in opts.voter_sizes.split(",") if n.strip()]
+    wanted = lambda name: not opts.only or any(o in name for o in opts.only)
+
+    from PyQt6.QtWidgets import QApplication
+    from view.common import theme
+    app = QApplication(sys.argv[:1])
+    theme.install(app)
+    db = open_database(opts)
+
+    results = {}
+    seed_start = time.perf_counter()
+    voters, _ = seed_dataset(db, opts, opts.voters, opts.audit_rows)
+    seed_time = time.perf_counter() - seed_start
+    for name, (before, fn) in build_cases(db, voters, opts).items():
+        if wanted(name): run_case(results, name, before, fn, opts.repeat, opts.warmup)
+
+    from view.admin.admin_voters import ManageVoters
+    for n in sizes:
+        name = f"ManageVoters.load_voters[{n}]"
+        if not wanted(name): continue
+        seed_dataset(db, opts, n, 0)
+        view = shown(ManageVoters(db))
+        run_case(results, name, None, lambda: (view.load_voters(), app.processEvents()),
+                 max(3, min(opts.repeat, opts.repeat * 5000 // n)), min(opts.warmup, 1))
+        view.deleteLater()
+        settle()
+
+    report = {
+        "meta": {"timestamp": datetime.now().isoformat(timespec="seconds"), "git": git_revision(),
+                 "python": platform.python_version(), "platform": platform.platform(), "backend": opts.backend,
+                 "qpa": os.environ.get("QT_QPA_PLATFORM"), "seed_seconds": round(seed_time, 3), "peak_rss_kb": peak_rss_kb()},
+        "config": {k: getattr(opts, k) for k in ("voters", "voter_sizes", "positions", "candidates", "audit_rows", "image_size", "repeat", "warmup", "seed")},
+        "results": results,
+    }
+    if opts.json:
+        with open(opts.json, "w") as f: json.dump(report, f, indent=2)
+    if opts.compare and compare(results, opts.compare, opts.threshold): return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""
+Build the voter portal's static assets into static/dist.
+
+    python build_assets.py            # needs Pillow; brotli is optional
+    python build_assets.py --check    # list what would be built and the byte savings
+
+For every image it writes resized WebP, AVIF (when Pillow has AVIF support)
+and JPEG/PNG fallback variants. The css/js bundles from static/src are
+copied with light whitespace/comment stripping. Every output gets a
+content hash in its name plus .gz/.br siblings for the text files, and
+manifest.json maps the logical names used by the templates
+({{ asset('vote.css') }}) to the hashed files. Run it before packaging
+the app or after editing anything under static/.
+"""
+import os
+import io
+import re
+import sys
+import gzip
+import json
+import shutil
+import hashlib
+import argparse
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC = os.path.join(ROOT, "static")
+SOURCE = os.path.join(STATIC, "src")
+DIST = os.path.join(STATIC, "dist")
+
+# name -> (widths, fallback format). Photos fall back to JPEG, anything with alpha to PNG.
+IMAGES = {
+    "background1.png": ((720, 1280), "jpeg"),
+    "background2.png": ((720, 1280), "jpeg"),
+    "logo.png": ((192,), "png"),
+}
+BUNDLES = ["login.css", "vote.css", "vote.js"]
+EXT = {"jpeg": ".jpg", "png": ".png", "webp": ".webp", "avif": ".avif"}
+
+
+def content_name(name, data, ext=None):
+    stem, orig_ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext or orig_ext}"
+
+
+def minify_css(text):
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip()) + "\n"
+
+
+def minify_js(text):
+    # Only indentation and blank lines: the ballot script has template literals, so nothing riskier
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip()) + "\n"
+
+
+def compress(data):
+    out = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+        out[".br"] = brotli.compress(data, quality=11)
+    except ImportError:
+        pass
+    return out
+
+
+def encode_image(img, fmt):
+    buf = io.BytesIO()
+    if fmt == "jpeg":
+        img.convert("RGB").save(buf, "JPEG", quality=80, optimize=True, progressive=True)
+    elif fmt == "png":
+        img.save(buf, "PNG", optimize=True)
+    elif fmt == "webp":
+        img.save(buf, "WEBP", quality=78, method=6)
+    elif fmt == "avif":
+        img.save(buf, "AVIF", quality=60)
+    return buf.getvalue()
+
+
+def avif_supported():
+    try:
+        import pillow_avif  # noqa: F401  (registers the AVIF plugin on older Pillow)
+    except ImportError:
+        pass
+    from PIL import features
+    try: return features.check("avif")
+    except ValueError: return False
+
+
+def build_images(outputs, manifest):
+    from PIL import Image
+    formats = ["webp"] + (["avif"] if avif_supported() else [])
+    if "avif" not in formats: print("  AVIF not available in this Pillow build, skipping .avif variants")
+    for name, (widths, fallback) in IMAGES.items():
+        src = Image.open(os.path.join(STATIC, name))
+        src.load()
+        variants = {}
+        for width in widths:
+            width = min(width, src.width)
+            img = src if width == src.width else src.resize((width, round(src.height * width / src.width)), Image.LANCZOS)
+            variant = {}
+            for fmt in formats + ["fallback"]:
+                real = fallback if fmt == "fallback" else fmt
+                data = encode_image(img, real)
+                stem = os.path.splitext(name)[0] + f"-{width}"
+                variant[fmt] = content_name(stem, data, EXT[real])
+                outputs[variant[fmt]] = data
+            variants[str(width)] = variant
+        manifest[name] = {"variants": variants}
+
+
+def build_bundles(outputs, manifest):
+    for name in BUNDLES:
+        with open(os.path.join(SOURCE, name), encoding="utf-8") as f: text = f.read()
+        data = (minify_css(text) if name.endswith(".css") else minify_js(text)).encode("utf-8")
+        hashed = content_name(name, data)
+        outputs[hashed] = data
+        for ext, packed in compress(data).items(): outputs[hashed + ext] = packed
+        manifest[name] = {"file": hashed}
+
+
+def source_size(name):
+    path = os.path.join(SOURCE if name in BUNDLES else STATIC, name)
+    return os.path.getsize(path)
+
+
+def report(outputs, manifest):
+    print(f"{'asset':<20}{'source':>12}{'smallest served':>18}")
+    for name, entry in manifest.items():
+        if "variants" in entry:
+            files = [f for v in entry["variants"].values() for f in v.values()]
+        else:
+            files = [entry["file"]] + [entry["file"] + ext for ext in (".gz", ".br") if entry["file"] + ext in outputs]
+        print(f"{name:<20}{source_size(name):>12,}{min(len(outputs[f]) for f in files):>18,}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--check", action="store_true", help="build in memory and report sizes only")
+    opts = ap.parse_args(argv)
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        sys.exit("Pillow is required to build the image variants: pip install pillow (and optionally brotli)")
+
+    outputs, manifest = {}, {}
+    build_images(outputs, manifest)
+    build_bundles(outputs, manifest)
+    report(outputs, manifest)
+    if opts.check: return
+
+    if os.path.isdir(DIST): shutil.rmtree(DIST)
+    os.makedirs(DIST)
+    for name, data in outputs.items():
+        with open(os.path.join(DIST, name), "wb") as f: f.write(data)
+    with open(os.path.join(DIST, "manifest.json"), "w", encoding="utf-8") as f: json.dump(manifest, f, indent=2)
+    print(f"Wrote {len(outputs)} files to {os.path.relpath(DIST, ROOT)}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
\ No newline at end of file
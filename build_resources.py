@@ -0,0 +1,78 @@
+"""
+Compile the desktop app's images into a Qt resource bundle (assets/votesphere.rcc).
+
+    python build_resources.py
+
+Backgrounds are downscaled to the kiosk widths in
+view.common.pixmap_cache.BACKGROUND_WIDTHS and re-encoded as JPEG; logos are
+capped at LOGO_SIZE pixels. The scaled files and ui/image.qrc are written
+first and then compiled with Qt's rcc (pyside6-rcc or rcc on PATH) in binary
+mode, which PyQt6 loads at runtime through QResource.registerResource.
+The app falls back to the original PNGs when the bundle is missing.
+"""
+import os
+import sys
+import shutil
+import subprocess
+from PyQt6.QtGui import QImage
+from PyQt6.QtCore import Qt
+from view.common.pixmap_cache import (BACKGROUND_WIDTHS, BACKGROUNDS, LOGO_SIZE, LOGOS, RESOURCE_FILE,
+                                      RESOURCE_ROOT, variant_name)
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BUILD = os.path.join(ROOT, "ui", "build")
+QRC = os.path.join(ROOT, "ui", "image.qrc")
+
+
+def scale(image, width):
+    if image.width() <= width: return image
+    return image.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
+
+
+def write_variants():
+    files = []
+    for name in BACKGROUNDS:
+        image = QImage(os.path.join(ROOT, name))
+        if image.isNull(): print(f"  skip {name}: not found"); continue
+        for width in BACKGROUND_WIDTHS:
+            alias = variant_name(name, width)
+            scale(image, width).convertToFormat(QImage.Format.Format_RGB32).save(os.path.join(BUILD, alias), "JPG", 85)
+            files.append(alias)
+    for name in LOGOS:
+        image = QImage(os.path.join(ROOT, name))
+        if image.isNull(): print(f"  skip {name}: not found"); continue
+        alias = variant_name(name, LOGO_SIZE)
+        os.makedirs(os.path.dirname(os.path.join(BUILD, alias)), exist_ok=True)
+        scale(image, LOGO_SIZE).save(os.path.join(BUILD, alias), "PNG")
+        files.append(alias)
+    return files
+
+
+def write_qrc(files):
+    prefix = RESOURCE_ROOT.lstrip(":")
+    lines = ["<RCC>", f'  <qresource prefix="{prefix}">']
+    lines += [f'    <file alias="{alias}">build/{alias}</file>' for alias in files]
+    lines += ["  </qresource>", "</RCC>"]
+    with open(QRC, "w", encoding="utf-8") as f: f.write("\n".join(lines) + "\n")
+
+
+def find_rcc():
+    for tool in ("pyside6-rcc", "rcc"):
+        path = shutil.which(tool)
+        if path: return path
+    sys.exit("Qt's rcc was not found. Install PySide6 (pyside6-rcc) or add Qt's bin directory to PATH.")
+
+
+def main():
+    if os.path.isdir(BUILD): shutil.rmtree(BUILD)
+    os.makedirs(BUILD)
+    files = write_variants()
+    write_qrc(files)
+    out = os.path.join(ROOT, RESOURCE_FILE)
+    subprocess.run([find_rcc(), "--binary", "--no-compress", QRC, "-o", out], check=True)
+    total = sum(os.path.getsize(os.path.join(BUILD, f)) for f in files)
+    print(f"Compiled {len(files)} images ({total / 1024:.0f} KB) into {os.path.relpath(out, ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,31 +1,23 @@
+import startup_timing
 from PyQt6.QtCore import QTimer, QDateTime, Qt
-from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtWidgets import QMessageBox, QWidget
 from models.admin.admin_model import AdminModel
-from controllers.admin.candidate_controller import CandidateController
-from controllers.voter.voter_controller import VoterController
-from controllers.admin.results_controller import ResultsController
-from controllers.admin.audit_controller import AuditLogController
-from controllers.admin.settings_controller import SettingsController
 
 
 class AdminController:
-    def __init__(self, db, user_id):
+    def __init__(self, db, user_id, on_logout=None):
         self.db = db
+        self.user_id = user_id
+        self.on_logout = on_logout
         self.model = AdminModel(db)
         from view.admin.admin_view import AdminDashboard
         self.view = AdminDashboard()
 
-        self.cand_ctrl = CandidateController(db)
-        self.voter_ctrl = VoterController(db, user_id, "ADMIN_SESSION")
-        self.results_ctrl = ResultsController(db)
-        self.audit_ctrl = AuditLogController(db)
-        self.settings_ctrl = SettingsController(db)
-
-        self.view.stacked.addWidget(self.cand_ctrl.view)
-        self.view.stacked.addWidget(self.voter_ctrl.view)
-        self.view.stacked.addWidget(self.results_ctrl.view)
-        self.view.stacked.addWidget(self.audit_ctrl.view)
-        self.view.stacked.addWidget(self.settings_ctrl.view)
+        # Pages are built on first visit; placeholders keep the sidebar indices stable.
+        self.cand_ctrl = self.voter_ctrl = self.results_ctrl = self.audit_ctrl = self.settings_ctrl = None
+        self.pending_pages = {1, 2, 3, 4, 5}
+        for _ in self.pending_pages:
+            self.view.stacked.addWidget(QWidget())
 
         for i, btn in enumerate(self.view.sidebar_buttons):
             btn.clicked.connect(lambda checked, idx=i: self.switch_page(idx))
@@ -33,14 +25,49 @@ class AdminController:
         self.view.logout_btn.clicked.connect(self.handle_logout)
 
         self.timer = QTimer()
+        self.timer.setObjectName("AdminController.refresh")
         self.timer.timeout.connect(self.refresh)
         self.timer.start(2000)
 
         self.switch_page(0)
         self.refresh()
         self.view.showMaximized()
+        startup_timing.mark("admin window shown")
+        QTimer.singleShot(0, lambda: startup_timing.report("Admin startup timing"))
+        # The settings page owns the voter portal, so build it (and start Flask) once the window is up.
+        self.portal_timer = QTimer()
+        self.portal_timer.setSingleShot(True)
+        self.portal_timer.timeout.connect(lambda: self.ensure_page(5))
+        self.portal_timer.start(500)
+
+    def build_page(self, index):
+        if index == 1:
+            from controllers.admin.candidate_controller import CandidateController
+            self.cand_ctrl = CandidateController(self.db); return self.cand_ctrl.view
+        elif index == 2:
+            from controllers.voter.voter_controller import VoterController
+            self.voter_ctrl = VoterController(self.db, self.user_id, "ADMIN_SESSION"); return self.voter_ctrl.view
+        elif index == 3:
+            from controllers.admin.results_controller import ResultsController
+            self.results_ctrl = ResultsController(self.db); return self.results_ctrl.view
+        elif index == 4:
+            from controllers.admin.audit_controller import AuditLogController
+            self.audit_ctrl = AuditLogController(self.db); return self.audit_ctrl.view
+        elif index == 5:
+            from controllers.admin.settings_controller import SettingsController
+            self.settings_ctrl = SettingsController(self.db); return self.settings_ctrl.view
+
+    def ensure_page(self, index):
+        if index not in self.pending_pages: return
+        self.pending_pages.discard(index)
+        placeholder = self.view.stacked.widget(index)
+        current = self.view.stacked.currentIndex()
+        self.view.stacked.removeWidget(placeholder); placeholder.deleteLater()
+        self.view.stacked.insertWidget(index, self.build_page(index))
+        self.view.stacked.setCurrentIndex(current)
 
     def switch_page(self, index):
+        self.ensure_page(index)
         self.view.stacked.setCurrentIndex(index)
         for i, btn in enumerate(self.view.sidebar_buttons):
             btn.set_active(i == index)
@@ -76,6 +103,11 @@ class AdminController:
     def handle_logout(self):
         if QMessageBox.question(self.view, "Logout", "Confirm?") == QMessageBox.StandardButton.Yes:
             self.timer.stop()
+            self.portal_timer.stop()
+            if self.voter_ctrl: self.voter_ctrl.timer.stop()
+            if self.on_logout:
+                self.view.close(); self.view.deleteLater()
+                self.on_logout(); return
             from controllers.login_controller import LoginController
             self.login_ctrl = LoginController(self.db)
             self.view.close()
\ No newline at end of file
@@ -12,9 +12,11 @@ class AuditLogController(QObject):
         self.view = AuditLogView()
 
         self.refresh_timer = QTimer()
+        self.refresh_timer.setObjectName("AuditLogController.update_logs")
         self.refresh_timer.timeout.connect(self.update_logs)
 
         self.blink_timer = QTimer()
+        self.blink_timer.setObjectName("AuditLogController.blink")
         self.blink_timer.timeout.connect(self.handle_blink)
         self.blink_state = True
 
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import QMessageBox, QWidget, QHBoxLayout, QPushButton, QDialog
 from models.admin.candidate_model import CandidateModel
 from view.admin.candidate_view import ManageCandidatesView, AddCandidateDialog
+from view.common import theme
 
 
 class CandidateController:
@@ -47,11 +48,9 @@ class CandidateController:
         w = QWidget()
         l = QHBoxLayout(w)
         l.setContentsMargins(5, 2, 5, 2)
-        e = QPushButton("Edit")
-        e.setStyleSheet("background: #3498db; color: white; border-radius: 4px;")
+        e = theme.role(QPushButton("Edit"), "row-action", tone="blue")
         e.clicked.connect(lambda: self.edit_candidate(cid))
-        d = QPushButton("Delete")
-        d.setStyleSheet("background: #e74c3c; color: white; border-radius: 4px;")
+        d = theme.role(QPushButton("Delete"), "row-action", tone="red")
         d.clicked.connect(lambda: self.delete_candidate(cid))
         l.addWidget(e)
         l.addWidget(d)
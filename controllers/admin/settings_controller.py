@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem, QPushButton
 from models.admin.settings_model import SettingsModel
-from view.admin.settings_view import SettingsView, ArchiveViewDialog
+from view.admin.settings_view import SettingsView, ArchiveViewDialog, ProfileReportDialog
 
 class SettingsController:
     def __init__(self, db):
@@ -9,6 +9,7 @@ class SettingsController:
         self.view.btn_voter_arch.clicked.connect(lambda: self.open_archive("voters"))
         self.view.btn_cand_arch.clicked.connect(lambda: self.open_archive("candidates"))
         self.view.btn_update_pass.clicked.connect(self.handle_password_change)
+        self.view.btn_sql_profile.clicked.connect(self.show_sql_profile)
         self.init_server()
 
     def init_server(self):
@@ -28,6 +29,17 @@ class SettingsController:
             QMessageBox.information(self.view, "Success", "Password Updated.")
         else: QMessageBox.warning(self.view, "Error", "Passwords mismatch.")
 
+    def show_sql_profile(self):
+        report = self.model.get_sql_profile()
+        if report is None:
+            QMessageBox.information(self.view, "SQL Profiler", "Profiling is off. Start VoteSphere with VOTESPHERE_PROFILE_SQL=1 to record queries.")
+            return
+        dialog = ProfileReportDialog(report, self.view)
+        dialog.reset_btn.clicked.connect(lambda: (self.model.reset_sql_profile(), dialog.text.setPlainText(self.model.get_sql_profile())))
+        dialog.save_btn.clicked.connect(lambda: QMessageBox.information(dialog, "Saved", f"Report written to {self.model.save_sql_profile()}"))
+        dialog.close_btn.clicked.connect(dialog.close)
+        dialog.exec()
+
     def open_archive(self, cat):
         cols = ["ID", "Name", "Grade", "Deleted At", "Action"] if cat == "voters" else ["Name", "Pos", "Deleted At", "Action"]
         dialog = ArchiveViewDialog(cat.title(), cols, self.view)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from PyQt6.QtWidgets import QMessageBox, QFileDialog
 
 class AdminController:
@@ -9,6 +10,7 @@ class AdminController:
             name, date, duration, target_time = setup_data
             self.db.update_config('election_name', name)
             self.db.update_config('election_target_time', target_time)
+            self.db.update_config('election_started', datetime.now().isoformat(timespec="seconds"))
             self.db.update_config('election_status', 'active')
             self.db.log_audit("admin", "Started Election", "System")
         else:
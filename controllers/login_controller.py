@@ -1,17 +1,33 @@
+import os
 from models.login_model import LoginModel
 from view.common.login_view import LoginView, CustomPopup
-from controllers.admin.admin_controller import AdminController
-from controllers.voter.voter_controller import VoterController
+
+# Kiosk mode: one login window and one voter dashboard serve every voter on this machine
+KIOSK = os.environ.get("VOTESPHERE_KIOSK") == "1"
 
 
 class LoginController:
-    def __init__(self, db):
-        self.db = db
+    def __init__(self, db=None):
         self.model = LoginModel(db)
         self.view = LoginView()
         self.view.login_btn.clicked.connect(self.handle_login)
         self.admin_ctrl = None
         self.voter_ctrl = None
+        self.set_database(db)
+
+    def set_database(self, db):
+        # main.py shows the window before the database is ready and hands it over once connected
+        self.db = db
+        self.model.db = db
+        self.view.login_btn.setEnabled(db is not None)
+
+    def show_login(self):
+        # Sessions hand back to this window instead of building a new LoginController each time
+        self.admin_ctrl = None
+        if not KIOSK: self.voter_ctrl = None
+        self.view.reset()
+        self.view.showMaximized()
+        self.view.activateWindow()
 
     def handle_login(self):
         self.view.login_btn.setEnabled(False)
@@ -36,7 +52,8 @@ class LoginController:
 
             if role == "admin":
                 self.view.show_loading()
-                self.admin_ctrl = AdminController(self.db, user_id)
+                from controllers.admin.admin_controller import AdminController
+                self.admin_ctrl = AdminController(self.db, user_id, on_logout=self.show_login)
                 self.view.hide()
             elif role == "voter":
                 if status != 'active':
@@ -44,8 +61,11 @@ class LoginController:
                 elif voted:
                     CustomPopup.show_info(self.view, "Voted", "Already voted.")
                 else:
-                    self.voter_ctrl = VoterController(self.db, user_id, token)
                     self.view.hide()
+                    if self.voter_ctrl: self.voter_ctrl.start_session(user_id, token)
+                    else:
+                        from controllers.voter.voter_controller import VoterController
+                        self.voter_ctrl = VoterController(self.db, user_id, token, on_logout=self.show_login, keep_alive=KIOSK)
         else:
             CustomPopup.show_error(self.view, "Auth Failure", "Invalid credentials.")
 
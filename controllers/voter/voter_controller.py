@@ -1,39 +1,97 @@
-from PyQt6.QtWidgets import QApplication, QRadioButton, QFrame, QHBoxLayout, QVBoxLayout, QLabel
-from PyQt6.QtGui import QPixmap, QPainter, QPainterPath
+import uuid
+from PyQt6.QtWidgets import QApplication, QWidget, QFrame, QHBoxLayout, QVBoxLayout, QLabel
 from PyQt6.QtCore import QTimer, QDateTime, Qt, QObject
 from models.voter.voter_model import VoterModel
-from view.voter.voter_view import VoterDashboardView, GlowPositionButton, CustomPopup, VoteReceiptDialog
+from view.voter.voter_view import VoterDashboardView, GlowPositionButton, CandidateCard, CustomPopup, VoteReceiptDialog
+from view.common.avatar_cache import avatar_cache
+from view.common import theme
+
+SUBMIT_ERRORS = {
+    "invalid": "The candidate list changed while your ballot was open.\nIt has been reloaded; please check your selections and submit again.",
+    "error": "Could not record your vote.\nPlease try again.",
+}
 
 class VoterController(QObject):
-    def __init__(self, db, user_id, session_token):
+    SUBMIT_DELAY = 2500   # ms the ballot animation plays before the vote is written
+
+    def __init__(self, db, user_id, session_token, on_logout=None, keep_alive=False):
         super().__init__()
         self.model = VoterModel(db)
-        self.user_id = user_id
-        self.session_token = session_token
-        self.user_name = self.model.get_user_name(user_id)
-        self.view = VoterDashboardView(self.user_name)
+        # on_logout hands control back to the login window; keep_alive (kiosk mode) keeps this
+        # controller and its window for the next voter instead of destroying them
+        self.on_logout = on_logout
+        self.keep_alive = keep_alive
+        self.view = VoterDashboardView("")
         self.selected_candidates = {}
         self.clean_exit = False
         self.is_submitting = False
         self.pos_group = []
+        self.cand_panels = {}
+        self.ballot, self.ballot_images = {}, {}
         self.view.btn_submit.clicked.connect(self.handle_submit)
         self.view.btn_logout.clicked.connect(self.handle_logout)
-        self.timer = QTimer(self); self.timer.timeout.connect(self.sync_state); self.timer.start(1000)
+        self.timer = QTimer(self); self.timer.setObjectName("VoterController.sync"); self.timer.timeout.connect(self.sync_state)
+        self.start_session(user_id, session_token)
+
+    def start_session(self, user_id, session_token):
+        self.user_id = user_id
+        self.session_token = session_token
+        # Same key for every retry of this voter's ballot, so a retry after a lost reply returns the first receipt
+        self.submit_key = uuid.uuid4().hex
+        self.user_name = self.model.get_user_name(user_id)
+        self.view.set_voter(self.user_name)
+        if session_token != "ADMIN_SESSION": self.view.showMaximized()
+        self.timer.start(1000)
         self.init_data()
 
+    def end_session(self):
+        # Per-voter state only; the avatar cache is keyed by election and stays warm for the next voter
+        self.timer.stop()
+        for pos, cid in self.selected_candidates.items():
+            cards = self.cand_panels[pos][1] if pos in self.cand_panels else {}
+            if cid in cards: cards[cid].set_selected(False)
+        self.selected_candidates = {}
+        self.is_submitting = False
+        self.ballot_images = {}
+        if not self.keep_alive: self.clear_ballot()
+        self.view.reset()
+
     def init_data(self):
         if self.model.check_voted(self.user_id): return
         if self.model.get_election_status() != 'active': return
-        self.load_positions()
+        if self.load_ballot(): self.load_positions()
+        elif self.pos_group: self.pos_group[0].click()
         self.update_trends()
 
-    def load_positions(self):
+    def load_ballot(self):
+        key = self.model.get_election_key()
+        warm = avatar_cache.is_warm(key)
+        ballot, self.ballot_images = self.model.get_ballot(with_images=not warm)
+        if not warm: avatar_cache.prewarm(key, self.ballot_images.items())
+        # A kiosk keeps the previous voter's panels; rebuild only when the ballot itself changed
+        changed = ballot != self.ballot or not self.pos_group
+        self.ballot = ballot
+        return changed
+
+    def avatar_for(self, cid, img_hash):
+        if not img_hash: return None
+        px = avatar_cache.get(cid, img_hash)
+        if px is None:
+            data = self.ballot_images.get(cid) or self.model.get_candidate_image(cid)
+            px = avatar_cache.put(cid, data) if data else None
+        return px
+
+    def clear_ballot(self):
         while self.view.layout_pos.count():
             item = self.view.layout_pos.takeAt(0)
             if item.widget(): item.widget().deleteLater()
         self.pos_group = []
-        positions = self.model.get_positions()
-        for i, pos in enumerate(positions):
+        for panel, _ in self.cand_panels.values(): panel.deleteLater()
+        self.cand_panels = {}
+
+    def load_positions(self):
+        self.clear_ballot()
+        for i, pos in enumerate(self.ballot):
             btn = GlowPositionButton(pos)
             btn.clicked.connect(lambda _, p=pos: self.load_candidates(p))
             self.view.layout_pos.addWidget(btn)
@@ -44,34 +102,34 @@ class VoterController(QObject):
     def load_candidates(self, position):
         self.view.lbl_current_pos.setText(position)
         for btn in self.pos_group: btn.setChecked(btn.text() == position)
-        while self.view.layout_cand.count():
-            item = self.view.layout_cand.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-        candidates = self.model.get_candidates(position)
-        for cid, name, grade, img in candidates:
-            card = QFrame(); card.setObjectName("candCard")
-            is_sel = (self.selected_candidates.get(position) == cid)
-            self.view.apply_glow(card, is_sel)
-            card.setStyleSheet(f"QFrame#candCard {{ background-color: {'rgba(52, 152, 219, 0.1)' if is_sel else 'rgba(255, 255, 255, 0.05)'}; border: 1px solid {'#3498db' if is_sel else '#334155'}; border-radius: 12px; }}")
-            lay = QHBoxLayout(card); rb = QRadioButton(); rb.setFixedSize(0, 0); rb.setChecked(is_sel)
-            rb.toggled.connect(lambda c, p=position, i=cid: self.record_selection(c, p, i))
-            lay.addWidget(rb); card.mousePressEvent = lambda e, r=rb: r.setChecked(True)
-            img_lbl = QLabel(); img_lbl.setFixedSize(60, 60)
-            if img:
-                px = QPixmap(); px.loadFromData(img); tgt = QPixmap(60, 60); tgt.fill(Qt.GlobalColor.transparent)
-                ptr = QPainter(tgt); ptr.setRenderHint(QPainter.RenderHint.Antialiasing); path = QPainterPath(); path.addEllipse(0, 0, 60, 60); ptr.setClipPath(path)
-                ptr.drawPixmap(0, 0, px.scaled(60, 60, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)); ptr.end(); img_lbl.setPixmap(tgt)
-            else: img_lbl.setText("?"); img_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter); img_lbl.setStyleSheet("font-size:24px; color:#94a3b8; background:rgba(255,255,255,0.05); border-radius:30px;")
-            lay.addWidget(img_lbl); inf = QVBoxLayout(); n_lbl = QLabel(name); n_lbl.setStyleSheet("font-weight:bold; color:white; border:none;"); g_lbl = QLabel(grade); g_lbl.setStyleSheet("color:#94a3b8; border:none;"); inf.addWidget(n_lbl); inf.addWidget(g_lbl); lay.addLayout(inf); lay.addStretch()
-            if is_sel: chk = QLabel("✓"); chk.setStyleSheet("color:#3498db; font-weight:bold; font-size:20px; border:none;"); lay.addWidget(chk)
-            self.view.layout_cand.addWidget(card)
-
-    def record_selection(self, checked, pos, cid):
-        if checked:
-            self.selected_candidates[pos] = cid
-            self.view.lbl_summary.setText(f"{len(self.selected_candidates)} Position(s) Selected")
-            self.view.btn_submit.setText(f"SUBMIT BALLOT ({len(self.selected_candidates)})")
-            self.load_candidates(pos)
+        for pos, (panel, _) in self.cand_panels.items(): panel.setVisible(pos == position)
+        if position in self.cand_panels: return
+        panel = QWidget(); lay = QVBoxLayout(panel); lay.setContentsMargins(0, 0, 0, 0); cards = {}
+        for cid, name, grade, img_hash in self.ballot.get(position, []):
+            card = CandidateCard(cid, name, grade, self.avatar_for(cid, img_hash), lambda i, p=position: self.record_selection(p, i))
+            card.set_selected(self.selected_candidates.get(position) == cid)
+            lay.addWidget(card); cards[cid] = card
+        self.cand_panels[position] = (panel, cards)
+        self.view.layout_cand.addWidget(panel)
+
+    def reload_ballot(self):
+        # Keep only the selections that are still on the (possibly edited) ballot
+        if self.load_ballot(): self.load_positions()
+        self.selected_candidates = {p: c for p, c in self.selected_candidates.items() if any(row[0] == c for row in self.ballot.get(p, []))}
+        for pos, (_, cards) in self.cand_panels.items():
+            for cid, card in cards.items(): card.set_selected(self.selected_candidates.get(pos) == cid)
+        self.view.lbl_summary.setText(f"{len(self.selected_candidates)} Position(s) Selected")
+        self.view.btn_submit.setText(f"SUBMIT BALLOT ({len(self.selected_candidates)})")
+
+    def record_selection(self, pos, cid):
+        prev = self.selected_candidates.get(pos)
+        if prev == cid: return
+        self.selected_candidates[pos] = cid
+        cards = self.cand_panels[pos][1]
+        if prev in cards: cards[prev].set_selected(False)
+        cards[cid].set_selected(True)
+        self.view.lbl_summary.setText(f"{len(self.selected_candidates)} Position(s) Selected")
+        self.view.btn_submit.setText(f"SUBMIT BALLOT ({len(self.selected_candidates)})")
 
     def sync_state(self):
         if self.is_submitting: return
@@ -94,33 +152,48 @@ class VoterController(QObject):
             if it.widget(): it.widget().deleteLater()
         trends = self.model.get_trends()
         for pos, cands in trends.items():
-            f = QFrame(); f.setStyleSheet("background:rgba(255,255,255,0.05); border-radius:8px;"); l = QVBoxLayout(f)
-            t = QLabel(pos.upper()); t.setStyleSheet("color:#3498db; font-weight:bold; border:none;"); l.addWidget(t)
-            if not cands: l.addWidget(QLabel("Awaiting data...", styleSheet="color:#64748b; font-style:italic; border:none;"))
+            f = theme.role(QFrame(), "trend-card"); l = QVBoxLayout(f)
+            l.addWidget(theme.role(QLabel(pos.upper()), "trend-title"))
+            if not cands: l.addWidget(theme.role(QLabel("Awaiting data..."), "trend-empty"))
             else:
                 for i, (n, v) in enumerate(cands):
-                    h = QHBoxLayout(); r = QLabel(str(i+1)); r.setFixedWidth(20); r.setStyleSheet("color:white; font-weight:bold; border:none;"); nl = QLabel(n); nl.setStyleSheet("color:#cbd5e1; border:none;"); vl = QLabel(str(v)); vl.setStyleSheet("color:#3498db; font-weight:bold; border:none;"); h.addWidget(r); h.addWidget(nl, 1); h.addWidget(vl); l.addLayout(h)
+                    h = QHBoxLayout(); r = theme.role(QLabel(str(i+1)), "trend-rank"); r.setFixedWidth(20); h.addWidget(r); h.addWidget(theme.role(QLabel(n), "trend-name"), 1); h.addWidget(theme.role(QLabel(str(v)), "trend-votes")); l.addLayout(h)
             self.view.leaders_layout.addWidget(f)
 
     def handle_submit(self):
-        all_pos = self.model.get_positions()
-        missing = [p for p in all_pos if p not in self.selected_candidates]
+        if self.is_submitting: return
+        missing = [p for p in self.ballot if p not in self.selected_candidates]
         if missing:
             CustomPopup.show_warning(self.view, "Incomplete", "Required positions:\n" + "\n".join([f"• {p}" for p in missing]))
             return
         if CustomPopup.ask_question(self.view, "Confirm", "Finalize your ballot?"):
             self.is_submitting = True; self.view.btn_submit.setEnabled(False); self.timer.stop(); self.view.submit_animation.start_animation()
-            QTimer.singleShot(2500, self.execute_submission)
+            QTimer.singleShot(self.SUBMIT_DELAY, self.execute_submission)
 
     def execute_submission(self):
-        success, receipt = self.model.submit_ballot(self.user_id, self.user_name, self.selected_candidates)
-        if success: self.view.submit_animation.stop_animation(); VoteReceiptDialog(receipt, self.view).exec(); self.logout(True)
-        else: self.is_submitting = False; self.view.btn_submit.setEnabled(True); self.view.submit_animation.stop_animation(); self.timer.start(1000)
+        status, receipt = self.model.submit_ballot(self.user_id, self.user_name, self.selected_candidates, self.submit_key)
+        self.view.submit_animation.stop_animation()
+        if status == "ok":
+            receipt_dlg = VoteReceiptDialog(receipt, self.view); receipt_dlg.exec(); receipt_dlg.deleteLater()
+            self.logout(True)
+        elif status == "voted":
+            # Claimed by another session (e.g. the portal on a phone) while this ballot was open
+            CustomPopup.show_warning(self.view, "Already Voted", "A ballot was already submitted for this account.")
+            self.logout(True)
+        else:
+            self.is_submitting = False; self.view.btn_submit.setEnabled(True); self.timer.start(1000)
+            if status == "invalid": self.reload_ballot()
+            CustomPopup.show_warning(self.view, "Vote Not Recorded", SUBMIT_ERRORS[status])
 
     def handle_logout(self):
         if CustomPopup.ask_question(self.view, "Logout", "End session?"): self.logout(True)
 
     def logout(self, force=False):
-        self.timer.stop(); self.model.clear_session(self.user_id)
+        self.model.clear_session(self.user_id)
+        self.end_session()
+        if self.on_logout:
+            if self.keep_alive: self.view.hide()
+            else: self.view.close(); self.view.deleteLater()
+            self.on_logout(); return
         from controllers.login_controller import LoginController
         self.login_ctrl = LoginController(self.model.db); self.view.close()
\ No newline at end of file
@@ -1,52 +1,92 @@
+import startup_timing
 import sys
 import traceback
-import requests
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from models.database import Database
+from models.update_model import UpdateModel
+from view.common import frame_monitor, theme
 from controllers.login_controller import LoginController
 
+startup_timing.mark("imports")
+
 APP_VERSION = "2.3"
 GITHUB_VERSION_URL = "https://raw.githubusercontent.com/Zento-0616/VoteSphere-Distribution/refs/heads/main/version.txt"
 GITHUB_DOWNLOAD_URL = "https://github.com/Zento-0616/VoteSphere-Distribution/releases/latest"
 
 
-def check_for_updates():
-    try:
-        response = requests.get(GITHUB_VERSION_URL, timeout=5)
-        if response.status_code == 200:
-            latest = response.text.strip()
-            if float(latest) > float(APP_VERSION):
-                msg = QMessageBox()
-                msg.setText(f"Update available: {latest}")
-                msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-                if msg.exec() == QMessageBox.StandardButton.Yes:
-                    webbrowser.open(GITHUB_DOWNLOAD_URL)
-                    sys.exit()
-    except:
-        pass
+def open_database():
+    db = Database()
+    return db, db.is_version_valid(APP_VERSION)
+
+
+def prompt_update(latest):
+    msg = QMessageBox()
+    msg.setText(f"Update available: {latest}")
+    msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+    if msg.exec() == QMessageBox.StandardButton.Yes:
+        webbrowser.open(GITHUB_DOWNLOAD_URL)
+        QApplication.instance().exit(0)
+
+
+def show_fatal_error(e):
+    error_details = traceback.format_exc()
+    error_msg = QMessageBox()
+    error_msg.setText(f"Fatal Error: {str(e)}\n\n{error_details}")
+    error_msg.exec()
+
+
+def finish_startup(jobs, poll):
+    for name, job in list(jobs.items()):
+        if not job.done(): continue
+        del jobs[name]
+        try:
+            if name == "database":
+                db, valid = job.result()
+                startup_timing.mark("database")
+                if not valid:
+                    QApplication.instance().exit(0); return
+                controller.set_database(db)
+            else:
+                latest = job.result()
+                startup_timing.mark("update check")
+                if latest: prompt_update(latest)
+        except Exception as e:
+            show_fatal_error(e)
+            QApplication.instance().exit(1); return
+    if not jobs:
+        poll.stop()
+        startup_timing.report()
 
 
 def main():
-    app = QApplication(sys.argv)
+    app = frame_monitor.create_application(sys.argv)
     app.setApplicationName("VoteSphere")
+    theme.install(app)
+    startup_timing.mark("QApplication")
 
     try:
-        check_for_updates()
-        db = Database()
-        if not db.is_version_valid(APP_VERSION):
-            sys.exit()
-
         global controller
-        controller = LoginController(db)
+        controller = LoginController()
+        startup_timing.mark("login window shown")
+
+        # The update check and the database bootstrap both block on the network,
+        # so run them side by side while the login window is already up.
+        pool = ThreadPoolExecutor(max_workers=2)
+        jobs = {"database": pool.submit(open_database),
+                "update": pool.submit(UpdateModel(APP_VERSION, GITHUB_VERSION_URL).check)}
+        poll = QTimer()
+        poll.setObjectName("startup_poll")
+        poll.timeout.connect(lambda: finish_startup(jobs, poll))
+        poll.start(100)
 
-        sys.exit(app.exec())
+        code = app.exec()
+        pool.shutdown(wait=False)
+        sys.exit(code)
     except Exception as e:
-        error_details = traceback.format_exc()
-        error_msg = QMessageBox()
-        error_msg.setText(f"Fatal Error: {str(e)}\n\n{error_details}")
-        error_msg.exec()
+        show_fatal_error(e)
         sys.exit(1)
 
 
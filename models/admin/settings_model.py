@@ -1,5 +1,6 @@
 import socket
 import threading
+from models import query_profiler
 
 class SettingsModel:
     def __init__(self, db):
@@ -42,6 +43,16 @@ class SettingsModel:
         else:
             self.db.restore_candidate(identifier)
 
+    def get_sql_profile(self):
+        if not query_profiler.ENABLED: return None
+        return query_profiler.profiler.report()
+
+    def reset_sql_profile(self):
+        query_profiler.profiler.reset()
+
+    def save_sql_profile(self):
+        return query_profiler.profiler.dump()
+
     def start_portal_server(self, app_instance, port=5050):
         if not self.server_active:
             try:
@@ -0,0 +1,238 @@
+"""
+Append-only ballot journal, kept on local disk apart from the database.
+The kiosk and the portal each write their own file in the per-user VoteSphere
+data directory (%LOCALAPPDATA%\\VoteSphere on Windows), or wherever
+VOTESPHERE_BALLOT_JOURNAL points.
+
+Every cast ballot is written here and fsynced before its database transaction
+commits (ballots committed as a group share one fsync), so the journal holds
+every counted ballot even if MySQL loses them. Replay rebuilds the tallies
+without the database, or reconciles the database against the journal:
+
+    python -m models.ballot_journal portal.journal kiosk.journal --since 1767225600   # tallies from the journals
+    python -m models.ballot_journal portal.journal --reconcile                    # compare with the database
+    python -m models.ballot_journal portal.journal --reconcile --apply            # restore missing ballots
+
+The journals are not rotated between elections; every record carries its time
+instead. With --reconcile, --since defaults to the current election's start
+(election_started in system_config), and --apply refuses to run without one, so
+an earlier election's ballots are never restored into this one.
+
+A ballot whose database commit failed after its journal write also appears as
+"journal only". Its voter was asked to retry, and a later record for the same
+voter replaces it, so --apply only restores voters the database has no ballot for.
+"""
+import os
+import sys
+import time
+import zlib
+import struct
+import argparse
+import threading
+from datetime import datetime
+from collections import Counter
+
+MAGIC = b"VB"
+VERSION = 1
+# magic, version, selection count, voter id, unix time in ms, then `count` candidate ids and a CRC32 of
+# everything before it. Records are as long as their ballot, so any number of positions fits.
+HEAD = struct.Struct("<2sBIIQ")
+CRC = struct.Struct("<I")
+
+_journals = {}
+_journals_lock = threading.Lock()
+
+
+def pack(voter_id, candidate_ids, timestamp=None):
+    ids = list(candidate_ids)
+    body = HEAD.pack(MAGIC, VERSION, len(ids), voter_id, int((timestamp or time.time()) * 1000)) + struct.pack(f"<{len(ids)}I", *ids)
+    return body + CRC.pack(zlib.crc32(body))
+
+
+def unpack(data, off):
+    """The record at `off` as (end offset, voter id, time ms, candidate ids), or None if it is damaged or cut short."""
+    if len(data) - off < HEAD.size + CRC.size: return None
+    magic, version, count, voter, stamp = HEAD.unpack_from(data, off)
+    end = off + HEAD.size + 4 * count
+    if magic != MAGIC or version != VERSION or end + CRC.size > len(data): return None
+    if zlib.crc32(data[off:end]) != CRC.unpack_from(data, end)[0]: return None
+    return end + CRC.size, voter, stamp, list(struct.unpack_from(f"<{count}I", data, off + HEAD.size))
+
+
+def walk(data):
+    """Yield (end offset, record) through a journal image. A damaged run yields (offset, None) and
+    the walk resumes at the next magic; a damaged tail with no record after it is not yielded."""
+    off = 0
+    while off < len(data):
+        record = unpack(data, off)
+        if record:
+            off = record[0]
+            yield off, record
+            continue
+        off = data.find(MAGIC, off + 1)
+        if off < 0: return
+        yield off, None
+
+
+class BallotJournal:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = None
+
+    def open(self):
+        f = open(self.path, "ab")
+        with open(self.path, "rb") as existing: data = existing.read()
+        # A crash mid-write leaves a partial record; cut the file back to the end of the last intact one
+        good = max((end for end, record in walk(data) if record), default=0)
+        if good < len(data): f.truncate(good)
+        return f
+
+    def write(self, records):
+        """Append packed records and fsync once for all of them."""
+        with self.lock:
+            try:
+                if self.file is None: self.file = self.open()
+                self.file.write(b"".join(records))
+                self.file.flush()
+                os.fsync(self.file.fileno())
+            except OSError:
+                self.close()
+                raise
+
+    def close(self):
+        if self.file is not None:
+            try: self.file.close()
+            except OSError: pass
+        self.file = None
+
+
+def journal_path(name):
+    """VOTESPHERE_BALLOT_JOURNAL if set, else `name` in the per-user data directory. Creates the directory."""
+    path = os.environ.get("VOTESPHERE_BALLOT_JOURNAL")
+    if not path:
+        base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+        path = os.path.join(base, "VoteSphere", name)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return path
+
+
+def shared(path):
+    """One journal object per file in this process, so every writer shares its lock."""
+    path = os.path.abspath(path)
+    with _journals_lock:
+        if path not in _journals: _journals[path] = BallotJournal(path)
+        return _journals[path]
+
+
+def scan(paths, since=None):
+    """Read journals into {voter id: (time ms, candidate ids)}, keeping each voter's latest record.
+
+    Records that fail their CRC are skipped and counted; `since` (unix seconds) drops older records.
+    """
+    ballots, stats = {}, {"records": 0, "corrupt": 0, "torn_bytes": 0}
+    since_ms = int(since * 1000) if since else 0
+    for path in paths:
+        with open(path, "rb") as f: data = f.read()
+        last = 0
+        for last, record in walk(data):
+            stats["records"] += 1
+            if record is None:
+                stats["corrupt"] += 1; continue
+            _, voter, stamp, ids = record
+            if stamp < since_ms: continue
+            if voter not in ballots or ballots[voter][0] <= stamp: ballots[voter] = (stamp, ids)
+        stats["torn_bytes"] += len(data) - last
+    return ballots, stats
+
+
+def tally(ballots):
+    return Counter(cid for _, ids in ballots.values() for cid in ids)
+
+
+def election_start(conn):
+    """Unix time the current election was started, from system_config, or None."""
+    cursor = conn.cursor(buffered=True)
+    cursor.execute("SELECT value FROM system_config WHERE `key`='election_started'")
+    res = cursor.fetchall()
+    cursor.close()
+    try: return datetime.fromisoformat(res[0][0]).timestamp() if res and res[0][0] else None
+    except ValueError: return None
+
+
+def reconcile(conn, ballots, apply=False):
+    cursor = conn.cursor(buffered=True)
+    cursor.execute("SELECT voter_id, candidate_id FROM votes")
+    stored = {}
+    for voter, cid in cursor.fetchall(): stored.setdefault(voter, set()).add(cid)
+    cursor.execute("SELECT id, position, votes FROM candidates")
+    candidates = {cid: (pos, votes) for cid, pos, votes in cursor.fetchall()}
+    missing = sorted(v for v in ballots if v not in stored)
+    report = {
+        "journal_ballots": len(ballots), "db_ballots": len(stored), "journal_only": missing,
+        "different": sorted(v for v in ballots if v in stored and stored[v] != set(ballots[v][1])),
+        "db_only": sorted(v for v in stored if v not in ballots),
+        "unknown_candidates": sorted({cid for v in missing for cid in ballots[v][1] if cid not in candidates}),
+    }
+    counted = Counter(cid for cids in stored.values() for cid in cids)
+    report["tally_drift"] = {cid: (votes, counted[cid]) for cid, (_, votes) in candidates.items() if votes != counted[cid]}
+    if apply and (missing or report["tally_drift"]):
+        try:
+            conn.start_transaction()
+            for voter in missing:
+                for cid in ballots[voter][1]:
+                    if cid in candidates:
+                        cursor.execute("INSERT INTO votes (voter_id, candidate_id, position) VALUES (%s, %s, %s)", (voter, cid, candidates[cid][0]))
+                cursor.execute("UPDATE users SET voted=1 WHERE id=%s", (voter,))
+            cursor.execute("UPDATE candidates SET votes = (SELECT COUNT(*) FROM votes WHERE votes.candidate_id = candidates.id)")
+            conn.commit()
+            report["applied"] = True
+        except Exception:
+            conn.rollback()
+            raise
+    cursor.close()
+    return report
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("journals", nargs="+", help="journal files (portal and kiosk journals can be combined)")
+    ap.add_argument("--since", type=float, help="ignore records before this unix time (default with --reconcile: the current election's start)")
+    ap.add_argument("--reconcile", action="store_true", help="compare the journal with the votes table")
+    ap.add_argument("--apply", action="store_true", help="with --reconcile: insert journal-only ballots and recount tallies")
+    opts = ap.parse_args(argv)
+
+    conn = None
+    if opts.reconcile:
+        from models.database import Database
+        conn = Database().get_connection()
+        if not conn: sys.exit("Could not connect to the database.")
+        if opts.since is None: opts.since = election_start(conn)
+        if opts.since is None and opts.apply:
+            sys.exit("No election start recorded in system_config; pass --since so --apply only restores this election's ballots.")
+        if opts.since is not None: print(f"Using records since {datetime.fromtimestamp(opts.since):%Y-%m-%d %H:%M:%S}")
+    if opts.since is None: print("No --since given: the tally includes every election in these journals.")
+
+    start = time.perf_counter()
+    ballots, stats = scan(opts.journals, opts.since)
+    counts = tally(ballots)
+    print(f"{stats['records']} records, {len(ballots)} ballots, {stats['corrupt']} corrupt, "
+          f"{stats['torn_bytes']} torn bytes, replayed in {(time.perf_counter() - start) * 1000:.1f} ms")
+    for cid, votes in sorted(counts.items()): print(f"  candidate {cid:>6}: {votes}")
+    if not opts.reconcile: return 0
+
+    report = reconcile(conn, ballots, opts.apply)
+    print(f"\njournal {report['journal_ballots']} ballots, database {report['db_ballots']}")
+    for key in ("journal_only", "different", "db_only", "unknown_candidates"):
+        ids = report[key]
+        print(f"{key:<20}{len(ids):>6}  {', '.join(map(str, ids[:20]))}{' ...' if len(ids) > 20 else ''}")
+    for cid, (stored, counted) in sorted(report["tally_drift"].items()):
+        print(f"  candidate {cid}: candidates.votes={stored}, vote rows={counted}")
+    if report.get("applied"):
+        print("Restored journal-only ballots and recounted candidates.votes.")
+        return 0
+    return 1 if report["journal_only"] or report["different"] or report["tally_drift"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
\ No newline at end of file
@@ -0,0 +1,182 @@
+import json
+import time
+import queue
+import threading
+from collections import Counter
+from models import ballot_journal
+
+# A group is committed when it holds MAX_BATCH ballots or its first ballot has waited
+# MAX_DELAY seconds, whichever comes first. MAX_PENDING bounds the queue itself.
+MAX_BATCH = 64
+MAX_DELAY = 0.005
+MAX_PENDING = 2048
+
+
+def find_receipt(cursor, user_id, idempotency_key):
+    if not idempotency_key: return None
+    # A locking read sees the latest committed row. A plain SELECT would read this transaction's
+    # REPEATABLE READ snapshot, taken before a concurrent retry of the same ballot committed.
+    cursor.execute("SELECT receipt FROM ballot_receipts WHERE voter_id=%s AND idempotency_key=%s LOCK IN SHARE MODE", (user_id, idempotency_key))
+    res = cursor.fetchall()
+    return [tuple(r) for r in json.loads(res[0][0])] if res else None
+
+
+def add_tallies(cursor, counts):
+    # Always in candidate id order, so concurrent ballot transactions lock candidates rows in the same order
+    for cid, n in sorted(counts.items()):
+        cursor.execute("UPDATE candidates SET votes = votes + %s WHERE id=%s", (n, cid))
+
+
+def write_ballot(cursor, user_id, selections, idempotency_key=None, audit=None, records=None, tally=True):
+    """Validate, claim and record one ballot inside the caller's transaction.
+
+    Returns the receipt, or None if the voter already voted. A ballot already cast
+    under the same idempotency key returns its stored receipt. Raises ValueError
+    when a selection isn't a candidate for that position. A cast ballot's journal
+    record is appended to `records` for the caller to write before it commits.
+    With tally=False the caller adds the candidates' votes itself.
+    """
+    if not selections: raise ValueError("empty ballot")
+    ids = list(selections.values())
+    cursor.execute(f"SELECT id, name, position FROM candidates WHERE id IN ({', '.join(['%s'] * len(ids))})", tuple(ids))
+    found = {str(cid): (name, pos) for cid, name, pos in cursor.fetchall()}
+    if any(found.get(str(cid), (None, None))[1] != pos for pos, cid in selections.items()):
+        raise ValueError("selection does not match the ballot")
+    # The claim: only one transaction can flip voted 0 -> 1, so a double submit or a second
+    # device gets 0 rows here instead of counting twice
+    cursor.execute("UPDATE users SET voted=1 WHERE id=%s AND voted=0", (user_id,))
+    if cursor.rowcount == 0: return find_receipt(cursor, user_id, idempotency_key)
+    receipt = []
+    for pos, cid in selections.items():
+        cursor.execute("INSERT INTO votes (voter_id, candidate_id, position) VALUES (%s, %s, %s)", (user_id, cid, pos))
+        receipt.append((pos, found[str(cid)][0]))
+    if tally: add_tallies(cursor, Counter(int(cid) for cid in ids))
+    cursor.execute("INSERT INTO ballot_receipts (voter_id, idempotency_key, receipt) VALUES (%s, %s, %s)", (user_id, idempotency_key, json.dumps(receipt)))
+    if audit: cursor.execute("INSERT INTO audit_trail (user, module, action, description) VALUES (%s, %s, %s, %s)", audit)
+    if records is not None: records.append(ballot_journal.pack(user_id, [int(cid) for cid in selections.values()]))
+    return receipt
+
+
+def submit_one(conn, user_id, selections, idempotency_key=None, audit=None, journal=None):
+    """One ballot in its own transaction. Returns (status, receipt); status is ok/voted/invalid/error."""
+    cursor = conn.cursor(buffered=True)
+    records = [] if journal else None
+    try:
+        conn.start_transaction()
+        receipt = write_ballot(cursor, user_id, selections, idempotency_key, audit, records)
+        if records: journal.write(records)
+        conn.commit()
+        return ("ok" if receipt is not None else "voted"), receipt
+    except ValueError:
+        conn.rollback()
+        return "invalid", None
+    except Exception as e:
+        print(f"[ballots] submit failed: {e!r}")
+        conn.rollback()
+        return "error", None
+    finally:
+        cursor.close()
+
+
+class Ballot:
+    def __init__(self, user_id, selections, idempotency_key, audit):
+        self.user_id, self.selections, self.idempotency_key, self.audit = user_id, selections, idempotency_key, audit
+        self.status, self.receipt = "error", None
+        self.done = threading.Event()
+
+
+class BallotQueue:
+    """Group commit for ballot bursts. Submitters hand their ballot to one committer thread,
+    which writes whatever has queued up in a single transaction (one savepoint per ballot).
+    Each submitter blocks until that transaction has committed."""
+
+    def __init__(self, connect, journal=None, max_batch=MAX_BATCH, max_delay=MAX_DELAY, max_pending=MAX_PENDING):
+        self.connect = connect
+        self.journal = journal
+        self.max_batch, self.max_delay = max_batch, max_delay
+        self.pending = queue.Queue(max_pending)
+        self.conn = None
+        self.lock = threading.Lock()
+        self.groups = self.ballots = self.largest = self.failed_groups = 0
+        self.thread = threading.Thread(target=self.run, name="BallotQueue", daemon=True)
+        self.thread.start()
+
+    def submit(self, user_id, selections, idempotency_key=None, audit=None, timeout=30.0):
+        """Returns (status, receipt) like submit_one, or ("busy", None) if the queue is full or the
+        group didn't commit in time; a retry with the same key is safe either way."""
+        ballot = Ballot(user_id, selections, idempotency_key, audit)
+        try: self.pending.put(ballot, timeout=timeout)
+        except queue.Full: return "busy", None
+        if not ballot.done.wait(timeout): return "busy", None
+        return ballot.status, ballot.receipt
+
+    def run(self):
+        while True:
+            group = [self.pending.get()]
+            deadline = time.perf_counter() + self.max_delay
+            while len(group) < self.max_batch:
+                try: group.append(self.pending.get(timeout=max(0.0, deadline - time.perf_counter())))
+                except queue.Empty: break
+            self.commit(group)
+
+    def connection(self):
+        # The committer lives for the whole election; reconnect after a server restart or wait_timeout
+        if self.conn is None or not self.conn.is_connected(): self.conn = self.connect()
+        else: self.conn.ping(reconnect=True, attempts=1, delay=0)
+        return self.conn
+
+    def write_group(self, group):
+        conn = self.connection()
+        cursor = conn.cursor(buffered=True)
+        records = [] if self.journal else None
+        counts = Counter()
+        conn.start_transaction()
+        for b in group:
+            cursor.execute("SAVEPOINT ballot")
+            try:
+                b.receipt = write_ballot(cursor, b.user_id, b.selections, b.idempotency_key, b.audit, records, tally=False)
+                b.status = "ok" if b.receipt is not None else "voted"
+                cursor.execute("RELEASE SAVEPOINT ballot")
+            except Exception as e:
+                # Only this ballot is undone; if the transaction itself is gone this raises and the group is retried
+                cursor.execute("ROLLBACK TO SAVEPOINT ballot")
+                b.status, b.receipt = ("invalid" if isinstance(e, ValueError) else "error"), None
+                if b.status == "error": print(f"[ballots] ballot for voter {b.user_id} failed: {e!r}")
+                continue
+            if b.status == "ok": counts.update(int(cid) for cid in b.selections.values())
+        # The group's tallies go in last, one row each, in id order
+        add_tallies(cursor, counts)
+        # One fsync covers the whole group, and it happens before the database commit
+        if records: self.journal.write(records)
+        conn.commit()
+        cursor.close()
+
+    def commit(self, group):
+        for attempt in (1, 2):
+            try:
+                self.write_group(group)
+                break
+            except Exception as e:
+                print(f"[ballots] group of {len(group)} failed (attempt {attempt}): {e!r}")
+                self.reset()
+                if attempt == 2:
+                    for b in group: b.status, b.receipt = "error", None
+                    with self.lock: self.failed_groups += 1
+        with self.lock:
+            self.groups += 1; self.ballots += len(group); self.largest = max(self.largest, len(group))
+        for b in group: b.done.set()
+
+    def reset(self):
+        # Drop the connection after a failed group; the next group reconnects
+        try:
+            self.conn.rollback()
+            self.conn.close()
+        except Exception:
+            pass
+        self.conn = None
+
+    def stats(self):
+        with self.lock:
+            return {"groups": self.groups, "ballots": self.ballots, "largest_group": self.largest,
+                    "mean_group": round(self.ballots / self.groups, 2) if self.groups else 0.0,
+                    "failed_groups": self.failed_groups, "queued": self.pending.qsize()}
\ No newline at end of file
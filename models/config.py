@@ -14,5 +14,6 @@ DEFAULT_SYSTEM_SETTINGS = [
     ('election_status', 'inactive'),
     ('election_duration', '3600'),
     ('election_target_time', ''),
+    ('election_started', ''),
     ('min_app_version', '2.3')
 ]
\ No newline at end of file
@@ -1,5 +1,7 @@
 import mysql.connector
 from mysql.connector import Error, errorcode
+from models.schema import TABLES
+from models import query_profiler
 
 class Database:
     def __init__(self):
@@ -32,7 +34,7 @@ class Database:
         try:
             full_config = self.config.copy()
             full_config['database'] = self.db_name
-            self.conn = mysql.connector.connect(**full_config)
+            self.conn = query_profiler.wrap(mysql.connector.connect(**full_config))
             return True
         except Error:
             self.conn = None
@@ -50,13 +52,7 @@ class Database:
         if not conn: return
         try:
             cursor = conn.cursor(buffered=True)
-            tables = [
-                "CREATE TABLE IF NOT EXISTS users (id INT AUTO_INCREMENT PRIMARY KEY, username VARCHAR(255) UNIQUE, password TEXT, role VARCHAR(50), full_name VARCHAR(255), grade VARCHAR(50), section VARCHAR(50), voted TINYINT(1) DEFAULT 0, session_token VARCHAR(255), last_active DATETIME) ENGINE=InnoDB;",
-                "CREATE TABLE IF NOT EXISTS candidates (id INT AUTO_INCREMENT PRIMARY KEY, name VARCHAR(255), position VARCHAR(255), grade VARCHAR(50), votes INT DEFAULT 0, image LONGBLOB) ENGINE=InnoDB;",
-                "CREATE TABLE IF NOT EXISTS votes (id INT AUTO_INCREMENT PRIMARY KEY, voter_id INT, candidate_id INT, position VARCHAR(255), timestamp DATETIME DEFAULT CURRENT_TIMESTAMP) ENGINE=InnoDB;",
-                "CREATE TABLE IF NOT EXISTS system_config (`key` VARCHAR(100) PRIMARY KEY, value TEXT) ENGINE=InnoDB;"
-            ]
-            for q in tables: cursor.execute(q)
+            for q in TABLES.values(): cursor.execute(q)
             cursor.execute("INSERT IGNORE INTO users (username, password, role, full_name) VALUES ('admin', 'admin123', 'admin', 'System Administrator')")
             defaults = [('election_name', 'School Election 2025'), ('election_status', 'inactive'), ('min_app_version', '2.3')]
             for k, v in defaults: cursor.execute("INSERT IGNORE INTO system_config (`key`, value) VALUES (%s, %s)", (k, v))
@@ -79,6 +75,31 @@ class Database:
         cursor.execute("REPLACE INTO system_config (`key`, value) VALUES (%s, %s)", (key, str(value)))
         cursor.close()
 
+    def check_user_voted(self, user_id):
+        conn = self.get_connection()
+        if not conn: return False
+        cursor = conn.cursor(buffered=True)
+        cursor.execute("SELECT voted FROM users WHERE id=%s", (user_id,))
+        res = cursor.fetchone()
+        cursor.close()
+        return bool(res and res[0])
+
+    def log_audit(self, user, action, module="System", description=""):
+        conn = self.get_connection()
+        if not conn: return
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO audit_trail (user, module, action, description) VALUES (%s, %s, %s, %s)", (user, module, action, description))
+        cursor.close()
+
+    def get_audit_logs(self, limit=500):
+        conn = self.get_connection()
+        if not conn: return []
+        cursor = conn.cursor(buffered=True)
+        cursor.execute("SELECT timestamp, user, module, action, description FROM audit_trail ORDER BY id DESC LIMIT %s", (limit,))
+        res = cursor.fetchall()
+        cursor.close()
+        return res
+
     def is_version_valid(self, version):
         req = self.get_config('min_app_version')
         if not req: return True
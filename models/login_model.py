@@ -26,4 +26,7 @@ class LoginModel:
         cursor.execute("UPDATE users SET session_token=%s, last_active=NOW() WHERE id=%s", (token, user_id))
         self.db.conn.commit()
         cursor.close()
-        return token
\ No newline at end of file
+        return token
+
+    def get_election_status(self):
+        return self.db.get_config('election_status')
\ No newline at end of file
@@ -0,0 +1,137 @@
+import os
+import re
+import sys
+import time
+import atexit
+import threading
+
+ENABLED = os.environ.get("VOTESPHERE_PROFILE_SQL") == "1"
+REPORT_FILE = os.environ.get("VOTESPHERE_PROFILE_SQL_FILE", "sql_profile_report.txt")
+BURST_GAP = 0.25   # repeats closer together than this belong to the same refresh/loop
+N_PLUS_ONE = 5     # repeats within one burst before a statement is flagged
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%s|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def normalize(sql):
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PARAM.sub("?", sql)
+    sql = _IN_LIST.sub("(?...)", sql)
+    return _SPACE.sub(" ", sql).strip().rstrip(";")
+
+
+class StatementStats:
+    __slots__ = ("count", "total", "max", "burst", "max_burst", "last")
+
+    def __init__(self):
+        self.count = self.burst = self.max_burst = 0
+        self.total = self.max = self.last = 0.0
+
+
+class QueryProfiler:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.started = time.time()
+        self.on_record = None  # set by view.common.frame_monitor to charge SQL time to the running timer
+
+    def call_site(self):
+        f = sys._getframe(1)
+        while f and f.f_code.co_filename == __file__: f = f.f_back
+        if not f: return "?"
+        path = os.path.relpath(f.f_code.co_filename, _ROOT) if f.f_code.co_filename.startswith(_ROOT) else f.f_code.co_filename
+        return f"{path}:{f.f_lineno} {f.f_code.co_name}"
+
+    def record(self, sql, elapsed, site):
+        key = (normalize(sql), site)
+        now = time.perf_counter()
+        with self.lock:
+            s = self.stats.get(key)
+            if s is None: s = self.stats[key] = StatementStats()
+            s.count += 1
+            s.total += elapsed
+            s.max = max(s.max, elapsed)
+            s.burst = s.burst + 1 if now - s.last < BURST_GAP else 1
+            s.max_burst = max(s.max_burst, s.burst)
+            s.last = now
+        if self.on_record: self.on_record(elapsed, key[0])
+
+    def reset(self):
+        with self.lock:
+            self.stats = {}
+            self.started = time.time()
+
+    def report(self, limit=40):
+        with self.lock: rows = sorted(self.stats.items(), key=lambda kv: kv[1].total, reverse=True)
+        total = sum(s.total for _, s in rows)
+        lines = [f"SQL profile: {sum(s.count for _, s in rows)} statements, {total * 1000:.1f} ms in {time.time() - self.started:.0f}s",
+                 "", f"{'total ms':>10} {'calls':>7} {'avg ms':>8} {'max ms':>8} {'loop':>5}  call site / statement"]
+        for (sql, site), s in rows[:limit]:
+            flag = f"x{s.max_burst}" if s.max_burst >= N_PLUS_ONE else ""
+            lines.append(f"{s.total * 1000:>10.1f} {s.count:>7} {s.total / s.count * 1000:>8.2f} {s.max * 1000:>8.2f} {flag:>5}  {site}")
+            lines.append(f"{'':>43}{sql[:160]}")
+        suspects = [(k, s) for k, s in rows if s.max_burst >= N_PLUS_ONE]
+        lines += ["", f"Possible N+1 patterns (same statement repeated {N_PLUS_ONE}+ times within one refresh): {len(suspects)}"]
+        for (sql, site), s in sorted(suspects, key=lambda kv: kv[1].max_burst, reverse=True):
+            lines.append(f"  up to {s.max_burst}x per refresh  {site}")
+            lines.append(f"      {sql[:160]}")
+        return "\n".join(lines)
+
+    def dump(self, path=REPORT_FILE):
+        text = self.report()
+        print(text)
+        try:
+            with open(path, "w", encoding="utf-8") as f: f.write(text + "\n")
+        except OSError as e:
+            print(f"Could not write SQL profile: {e}")
+        return path
+
+
+class ProfiledCursor:
+    def __init__(self, cursor, profiler):
+        self._cursor = cursor
+        self._profiler = profiler
+
+    def execute(self, sql, *args, **kwargs):
+        start = time.perf_counter()
+        try: return self._cursor.execute(sql, *args, **kwargs)
+        finally: self._profiler.record(sql, time.perf_counter() - start, self._profiler.call_site())
+
+    def executemany(self, sql, *args, **kwargs):
+        start = time.perf_counter()
+        try: return self._cursor.executemany(sql, *args, **kwargs)
+        finally: self._profiler.record(sql, time.perf_counter() - start, self._profiler.call_site())
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+
+class ProfiledConnection:
+    def __init__(self, conn, profiler):
+        self._conn = conn
+        self._profiler = profiler
+
+    def cursor(self, *args, **kwargs):
+        return ProfiledCursor(self._conn.cursor(*args, **kwargs), self._profiler)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+profiler = QueryProfiler()
+
+
+def wrap(conn):
+    return ProfiledConnection(conn, profiler) if (ENABLED or profiler.on_record) and conn is not None else conn
+
+
+if ENABLED: atexit.register(profiler.dump)
\ No newline at end of file
@@ -42,6 +42,14 @@ TABLES = {
             description TEXT
         ) ENGINE=InnoDB;
     ''',
+    "ballot_receipts": '''
+        CREATE TABLE IF NOT EXISTS ballot_receipts (
+            voter_id INT PRIMARY KEY,
+            idempotency_key VARCHAR(64),
+            receipt TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB;
+    ''',
     "system_config": '''
         CREATE TABLE IF NOT EXISTS system_config (
             `key` VARCHAR(100) PRIMARY KEY,
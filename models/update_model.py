@@ -0,0 +1,53 @@
+import os
+import json
+import time
+
+CHECK_INTERVAL = 24 * 60 * 60
+CACHE_FILE = os.environ.get("VOTESPHERE_UPDATE_CACHE", os.path.join(os.path.expanduser("~"), ".votesphere_update.json"))
+
+
+class UpdateModel:
+    def __init__(self, current_version, version_url, cache_file=CACHE_FILE):
+        self.current_version = current_version
+        self.version_url = version_url
+        self.cache_file = cache_file
+        # Point VOTESPHERE_VERSION_FILE at a local version.txt to exercise the check offline
+        self.version_file = os.environ.get("VOTESPHERE_VERSION_FILE")
+
+    def load_cache(self):
+        try:
+            with open(self.cache_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_cache(self, latest):
+        try:
+            with open(self.cache_file, "w") as f:
+                json.dump({"checked_at": time.time(), "latest": latest}, f)
+        except OSError as e:
+            print(f"Update cache error: {e}")
+
+    def fetch_latest(self):
+        if self.version_file:
+            with open(self.version_file, "r") as f:
+                return f.read().strip()
+        import requests
+        response = requests.get(self.version_url, timeout=5)
+        return response.text.strip() if response.status_code == 200 else None
+
+    def is_newer(self, latest):
+        try: return float(latest) > float(self.current_version)
+        except (TypeError, ValueError): return False
+
+    def check(self, force=False):
+        cache = self.load_cache()
+        latest = cache.get("latest")
+        if force or time.time() - cache.get("checked_at", 0) >= CHECK_INTERVAL:
+            try:
+                latest = self.fetch_latest() or latest
+            except Exception as e:
+                print(f"Update check failed: {e}")
+            # Failed checks are recorded too, so an offline station only retries once a day
+            self.save_cache(latest)
+        return latest if self.is_newer(latest) else None
\ No newline at end of file
@@ -1,8 +1,10 @@
 from mysql.connector import Error
+from models import ballot_queue, ballot_journal
 
 class VoterModel:
     def __init__(self, db):
         self.db = db
+        self.journal = ballot_journal.shared(ballot_journal.journal_path("kiosk.journal"))
 
     def get_user_name(self, user_id):
         cursor = self.db.get_connection().cursor()
@@ -20,19 +22,25 @@ class VoterModel:
     def get_target_time(self):
         return self.db.get_config('election_target_time')
 
-    def get_positions(self):
+    def get_election_key(self):
+        return self.db.get_config('election_name'), self.get_target_time()
+
+    def get_ballot(self, with_images=True):
         cursor = self.db.get_connection().cursor(buffered=True)
-        cursor.execute("SELECT DISTINCT position FROM candidates ORDER BY position")
-        res = [r[0] for r in cursor.fetchall()]
+        cursor.execute(f"SELECT id, position, name, grade, MD5(image), {'image' if with_images else 'NULL'} FROM candidates ORDER BY position, id")
+        ballot, images = {}, {}
+        for cid, pos, name, grade, img_hash, img in cursor.fetchall():
+            ballot.setdefault(pos, []).append((cid, name, grade, img_hash))
+            if img: images[cid] = img
         cursor.close()
-        return res
+        return ballot, images
 
-    def get_candidates(self, position):
+    def get_candidate_image(self, cand_id):
         cursor = self.db.get_connection().cursor(buffered=True)
-        cursor.execute("SELECT id, name, grade, image FROM candidates WHERE position=%s", (position,))
-        res = cursor.fetchall()
+        cursor.execute("SELECT image FROM candidates WHERE id=%s", (cand_id,))
+        res = cursor.fetchone()
         cursor.close()
-        return res
+        return res[0] if res else None
 
     def get_trends(self):
         cursor = self.db.get_connection().cursor(buffered=True)
@@ -58,27 +66,11 @@ class VoterModel:
         cursor.close()
         return True
 
-    def submit_ballot(self, user_id, user_name, selections):
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        try:
-            conn.start_transaction()
-            receipt = []
-            for pos, cand_id in selections.items():
-                cursor.execute("INSERT INTO votes (voter_id, candidate_id, position) VALUES (%s, %s, %s)", (user_id, cand_id, pos))
-                cursor.execute("UPDATE candidates SET votes = votes + 1 WHERE id=%s", (cand_id,))
-                cursor.execute("SELECT name FROM candidates WHERE id=%s", (cand_id,))
-                n = cursor.fetchone()[0]
-                receipt.append((pos, n))
-            cursor.execute("UPDATE users SET voted=1 WHERE id=%s", (user_id,))
-            self.db.log_audit(user_name, "Ballot Finalized")
-            conn.commit()
-            return True, receipt
-        except Exception:
-            conn.rollback()
-            return False, []
-        finally:
-            cursor.close()
+    def submit_ballot(self, user_id, user_name, selections, idempotency_key=None):
+        """Returns (status, receipt); status is ok, voted, invalid or error as in ballot_queue.submit_one."""
+        status, receipt = ballot_queue.submit_one(self.db.get_connection(), user_id, selections, idempotency_key,
+                                                  (user_name, "System", "Ballot Finalized", ""), self.journal)
+        return status, receipt or []
 
     def clear_session(self, user_id):
         cursor = self.db.get_connection().cursor()
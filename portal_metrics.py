@@ -0,0 +1,239 @@
+import os
+import time
+import bisect
+import threading
+from flask import g, request, Response, abort, render_template_string, has_request_context
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+# /metrics and /admin/metrics are only served to these addresses (comma-separated override)
+ALLOWED_HOSTS = set(os.environ.get("VOTESPHERE_METRICS_ALLOW", "127.0.0.1,::1").split(","))
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        if not self.count: return 0.0
+        rank, seen, lower = q * self.count, 0, 0.0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+            lower = self.buckets[i] if i < len(self.buckets) else lower
+        return self.buckets[-1]
+
+    def lines(self, name, labels):
+        out, cumulative = [], 0
+        for le, n in zip(list(self.buckets) + ["+Inf"], self.counts):
+            cumulative += n
+            out.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+        out.append(f"{name}_sum{{{labels}}} {self.sum:.6f}")
+        out.append(f"{name}_count{{{labels}}} {self.count}")
+        return out
+
+
+class PortalMetrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = {}
+        self.latency = {}
+        self.db_time = {}
+        self.db_queries = {}
+        self.errors = {}
+        self.connect_time = Histogram(DB_BUCKETS)
+        self.connect_failures = 0
+        self.in_flight = 0
+        self.active_sessions = None
+
+    def begin(self):
+        g.metrics_start = time.perf_counter()
+        g.db_time = 0.0
+        g.db_queries = 0
+        with self.lock: self.in_flight += 1
+
+    def finish(self, status):
+        start = g.pop("metrics_start", None)
+        if start is None: return
+        elapsed = time.perf_counter() - start
+        rule = request.url_rule.rule if request.url_rule else "unmatched"
+        key = (rule, request.method, str(status))
+        with self.lock:
+            self.in_flight -= 1
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.latency.setdefault(rule, Histogram(LATENCY_BUCKETS)).observe(elapsed)
+            self.db_time.setdefault(rule, Histogram(DB_BUCKETS)).observe(g.get("db_time", 0.0))
+            self.db_queries[rule] = self.db_queries.get(rule, 0) + g.get("db_queries", 0)
+
+    def record_error(self, where, exc=None):
+        with self.lock: self.errors[where] = self.errors.get(where, 0) + 1
+        if exc is not None: print(f"[portal] {where}: {exc!r}")
+
+    def record_connect(self, seconds, ok):
+        with self.lock:
+            self.connect_time.observe(seconds)
+            if not ok: self.connect_failures += 1
+
+    def add_db_time(self, seconds):
+        if has_request_context():
+            g.db_time = g.get("db_time", 0.0) + seconds
+            g.db_queries = g.get("db_queries", 0) + 1
+
+    def render_prometheus(self):
+        with self.lock:
+            lines = ["# HELP votesphere_portal_uptime_seconds Seconds since the portal started.",
+                     "# TYPE votesphere_portal_uptime_seconds gauge",
+                     f"votesphere_portal_uptime_seconds {time.time() - self.started:.0f}",
+                     "# HELP votesphere_http_requests_in_flight Requests currently being served.",
+                     "# TYPE votesphere_http_requests_in_flight gauge",
+                     f"votesphere_http_requests_in_flight {self.in_flight}",
+                     "# HELP votesphere_http_requests_total Requests by route, method and status.",
+                     "# TYPE votesphere_http_requests_total counter"]
+            for (rule, method, status), n in sorted(self.requests.items()):
+                lines.append(f'votesphere_http_requests_total{{route="{rule}",method="{method}",status="{status}"}} {n}')
+            lines += ["# HELP votesphere_http_request_duration_seconds Request latency by route.",
+                      "# TYPE votesphere_http_request_duration_seconds histogram"]
+            for rule, h in sorted(self.latency.items()): lines += h.lines("votesphere_http_request_duration_seconds", f'route="{rule}"')
+            lines += ["# HELP votesphere_db_time_per_request_seconds Time spent in SQL per request, by route.",
+                      "# TYPE votesphere_db_time_per_request_seconds histogram"]
+            for rule, h in sorted(self.db_time.items()): lines += h.lines("votesphere_db_time_per_request_seconds", f'route="{rule}"')
+            lines += ["# HELP votesphere_db_queries_total SQL statements executed, by route.",
+                      "# TYPE votesphere_db_queries_total counter"]
+            for rule, n in sorted(self.db_queries.items()): lines.append(f'votesphere_db_queries_total{{route="{rule}"}} {n}')
+            lines += ["# HELP votesphere_db_connect_seconds Time to acquire a MySQL connection.",
+                      "# TYPE votesphere_db_connect_seconds histogram"]
+            lines += self.connect_time.lines("votesphere_db_connect_seconds", 'pool="portal"')
+            lines += ["# HELP votesphere_db_connect_failures_total Failed connection attempts.",
+                      "# TYPE votesphere_db_connect_failures_total counter",
+                      f"votesphere_db_connect_failures_total {self.connect_failures}",
+                      "# HELP votesphere_portal_errors_total Errors caught inside route handlers.",
+                      "# TYPE votesphere_portal_errors_total counter"]
+            for where, n in sorted(self.errors.items()): lines.append(f'votesphere_portal_errors_total{{where="{where}"}} {n}')
+        sessions = self.count_sessions()
+        if sessions is not None:
+            lines += ["# HELP votesphere_active_sessions Voters with a heartbeat in the last 15 seconds.",
+                      "# TYPE votesphere_active_sessions gauge", f"votesphere_active_sessions {sessions}"]
+        return "\n".join(lines) + "\n"
+
+    def count_sessions(self):
+        # Only evaluated when metrics are scraped, never on the voting routes
+        try: return self.active_sessions() if self.active_sessions else None
+        except Exception as e:
+            self.record_error("active_sessions", e)
+            return None
+
+    def route_rows(self):
+        with self.lock:
+            counts = {}
+            for (rule, _, status), n in self.requests.items():
+                total, failed = counts.get(rule, (0, 0))
+                counts[rule] = (total + n, failed + (n if status.startswith("5") else 0))
+            return [(rule, counts.get(rule, (0, 0)), h.quantile(0.5) * 1000, h.quantile(0.95) * 1000, h.quantile(0.99) * 1000,
+                     self.db_time[rule].sum / h.count * 1000 if h.count else 0.0)
+                    for rule, h in sorted(self.latency.items())]
+
+
+class TimedCursor:
+    def __init__(self, cursor, metrics):
+        self._cursor = cursor
+        self._metrics = metrics
+
+    def execute(self, *args, **kwargs):
+        start = time.perf_counter()
+        try: return self._cursor.execute(*args, **kwargs)
+        finally: self._metrics.add_db_time(time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+
+class TimedConnection:
+    """Thin proxy over a mysql.connector connection that charges SQL time to the current request."""
+
+    def __init__(self, conn, metrics):
+        self._conn = conn
+        self._metrics = metrics
+
+    def cursor(self, *args, **kwargs):
+        return TimedCursor(self._conn.cursor(*args, **kwargs), self._metrics)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+metrics = PortalMetrics()
+
+ADMIN_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><meta http-equiv="refresh" content="5"><title>VoteSphere Portal Metrics</title>
+<style>
+body { font-family: Segoe UI, Arial, sans-serif; background: #0f172a; color: #e2e8f0; padding: 24px; }
+h1 { color: #3498db; } table { border-collapse: collapse; width: 100%; margin-bottom: 24px; }
+th, td { padding: 8px 12px; border-bottom: 1px solid #334155; text-align: right; }
+th:first-child, td:first-child { text-align: left; } th { color: #94a3b8; text-transform: uppercase; font-size: 12px; }
+.card { display: inline-block; background: #1e293b; border-radius: 8px; padding: 12px 20px; margin: 0 12px 16px 0; }
+.card b { display: block; font-size: 24px; color: white; }
+</style></head><body>
+<h1>Portal Metrics</h1>
+<div class="card">Active sessions<b>{{ sessions if sessions is not none else "n/a" }}</b></div>
+<div class="card">In flight<b>{{ m.in_flight }}</b></div>
+<div class="card">DB connect p95<b>{{ "%.1f"|format(m.connect_time.quantile(0.95) * 1000) }} ms</b></div>
+<div class="card">Connect failures<b>{{ m.connect_failures }}</b></div>
+<table><tr><th>Route</th><th>Requests</th><th>5xx</th><th>p50 ms</th><th>p95 ms</th><th>p99 ms</th><th>avg DB ms</th></tr>
+{% for rule, (total, failed), p50, p95, p99, db in rows %}
+<tr><td>{{ rule }}</td><td>{{ total }}</td><td>{{ failed }}</td><td>{{ "%.1f"|format(p50) }}</td><td>{{ "%.1f"|format(p95) }}</td><td>{{ "%.1f"|format(p99) }}</td><td>{{ "%.2f"|format(db) }}</td></tr>
+{% endfor %}
+</table>
+<table><tr><th>Handled errors</th><th>Count</th></tr>
+{% for where, n in m.errors|dictsort %}<tr><td>{{ where }}</td><td>{{ n }}</td></tr>{% else %}<tr><td>none</td><td>0</td></tr>{% endfor %}
+</table>
+<p><a href="/metrics" style="color:#3498db">Prometheus format</a></p>
+</body></html>"""
+
+
+def _local_only():
+    if request.remote_addr not in ALLOWED_HOSTS: abort(403)
+
+
+def init_app(app, active_sessions=None):
+    metrics.active_sessions = active_sessions
+
+    @app.before_request
+    def _metrics_begin():
+        metrics.begin()
+
+    @app.after_request
+    def _metrics_finish(response):
+        metrics.finish(response.status_code)
+        return response
+
+    @app.teardown_request
+    def _metrics_teardown(exc):
+        if exc is not None:
+            metrics.record_error("unhandled", exc)
+            metrics.finish(500)  # no-op when after_request already ran
+
+    @app.route("/metrics")
+    def prometheus_metrics():
+        _local_only()
+        return Response(metrics.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+    @app.route("/admin/metrics")
+    def metrics_page():
+        _local_only()
+        return render_template_string(ADMIN_PAGE, m=metrics, rows=metrics.route_rows(), sessions=metrics.count_sessions())
+
+    return metrics
\ No newline at end of file
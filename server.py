@@ -1,11 +1,14 @@
 from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, send_file
 import sqlite3
 import io
+import json
 from datetime import datetime, timedelta
 import uuid
+import assets
 
 app = Flask(__name__)
 app.secret_key = "vote_sphere_secret_key"
+assets.init_app(app)
 DB_NAME = "votesphere.db"
 
 
@@ -15,6 +18,25 @@ def get_db_connection():
     return conn
 
 
+receipts_ready = False
+
+
+def init_db(conn):
+    # Runs on the first ballot rather than under __main__, so the table also exists when served by WSGI
+    global receipts_ready
+    if receipts_ready: return
+    conn.execute("CREATE TABLE IF NOT EXISTS ballot_receipts (voter_id INTEGER PRIMARY KEY, idempotency_key TEXT, receipt TEXT, created_at DATETIME DEFAULT CURRENT_TIMESTAMP)")
+    conn.commit()
+    receipts_ready = True
+
+
+def find_receipt(conn, user_id, key):
+    """The receipt stored with a ballot cast under this idempotency key, if any."""
+    if not key: return None
+    row = conn.execute("SELECT receipt FROM ballot_receipts WHERE voter_id = ? AND idempotency_key = ?", (user_id, key)).fetchone()
+    return json.loads(row['receipt']) if row else None
+
+
 def is_election_active(conn):
     status = conn.execute("SELECT value FROM system_config WHERE key='election_status'").fetchone()
     if not status or status['value'] != 'active':
@@ -151,29 +173,42 @@ def vote():
         return redirect(url_for('login'))
 
 
-    user_check = conn.execute('SELECT voted FROM users WHERE id = ?', (session['user_id'],)).fetchone()
-    if user_check['voted']:
-        session.clear()
-        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-            return jsonify({"status": "error", "message": "You have already voted."})
-        flash("You have already voted.", "success")
-        return redirect(url_for('login'))
-
     if request.method == 'POST':
+        # Same key on every retry of one submission (see vote.js)
+        key = request.headers.get('X-Idempotency-Key', '')[:64] or None
+        ballot = request.form.to_dict()
         try:
-            for position, candidate_id in request.form.items():
+            init_db(conn)
+            # Claim the ballot: the conditional update is checked at POST time, so a double-tap or
+            # a second device gets 0 rows here instead of a second set of votes
+            claimed = conn.execute("UPDATE users SET voted = 1 WHERE id = ? AND voted = 0", (session['user_id'],)).rowcount
+            if not claimed:
+                conn.rollback()
+                receipt = find_receipt(conn, session['user_id'], key)
+                session.clear()
+                if receipt is None:
+                    return jsonify({"status": "error", "message": "You have already voted."})
+                return jsonify({"status": "success", "message": "Vote Submitted Successfully!", "receipt": receipt})
+
+            names = {}
+            if ballot:
+                rows = conn.execute(f"SELECT id, name FROM candidates WHERE id IN ({', '.join(['?'] * len(ballot))})",
+                                    tuple(ballot.values())).fetchall()
+                names = {str(row['id']): row['name'] for row in rows}
+            for position, candidate_id in ballot.items():
                 conn.execute("INSERT INTO votes (voter_id, candidate_id, position) VALUES (?, ?, ?)",
                              (session['user_id'], candidate_id, position))
                 conn.execute("UPDATE candidates SET votes = votes + 1 WHERE id = ?", (candidate_id,))
 
-            conn.execute("UPDATE users SET voted = 1 WHERE id = ?", (session['user_id'],))
-            conn.commit()
+            receipt = [[position, names.get(str(candidate_id), "")] for position, candidate_id in ballot.items()]
+            conn.execute("INSERT INTO ballot_receipts (voter_id, idempotency_key, receipt) VALUES (?, ?, ?)",
+                         (session['user_id'], key, json.dumps(receipt)))
             conn.execute("INSERT INTO audit_trail (user, action) VALUES (?, ?)",
                          (f"Mobile_User_{session['user_id']}", "Submitted votes via Mobile"))
             conn.commit()
 
             session.clear()
-            return jsonify({"status": "success", "message": "Vote Submitted Successfully!"})
+            return jsonify({"status": "success", "message": "Vote Submitted Successfully!", "receipt": receipt})
 
         except Exception as e:
             conn.rollback()
@@ -181,6 +216,13 @@ def vote():
         finally:
             conn.close()
 
+    user_check = conn.execute('SELECT voted FROM users WHERE id = ?', (session['user_id'],)).fetchone()
+    if user_check['voted']:
+        session.clear()
+        conn.close()
+        flash("You have already voted.", "success")
+        return redirect(url_for('login'))
+
 
     positions_raw = conn.execute("SELECT DISTINCT position FROM candidates ORDER BY position").fetchall()
     positions = [row['position'] for row in positions_raw]
@@ -0,0 +1,23 @@
+import os
+import sys
+import time
+
+_start = time.perf_counter()
+_marks = []
+ENABLED = os.environ.get("VOTESPHERE_STARTUP_TIMING") == "1"
+HEAVY_MODULES = ("requests", "flask", "reportlab", "mysql.connector")
+
+
+def mark(label):
+    _marks.append((label, time.perf_counter() - _start))
+
+
+def report(title="Startup timing"):
+    if not ENABLED: return
+    print(f"{title}:")
+    prev = 0.0
+    for label, t in _marks:
+        print(f"  {label:<32} {t * 1000:8.1f} ms  (+{(t - prev) * 1000:.1f} ms)")
+        prev = t
+    loaded = [m for m in HEAVY_MODULES if m in sys.modules]
+    print(f"  heavy modules loaded: {', '.join(loaded) or 'none'}")
\ No newline at end of file
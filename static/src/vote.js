@@ -0,0 +1,110 @@
+function toggleSidebar() {
+    document.getElementById('sidebar').classList.toggle('active');
+    document.querySelector('.overlay-bg').classList.toggle('active');
+}
+
+let heartbeatInterval = setInterval(() => fetch('/heartbeat', { method: 'POST' }), 5000);
+
+function confirmLogout() {
+    if(confirm("Logout? Unsubmitted choices will be lost.")) window.location.href = "/logout";
+}
+
+function attemptLogout() { window.location.href = "/logout"; }
+
+// --- TIMER LOGIC WITH URGENT ANIMATION ---
+let timeLeft = parseInt(document.body.dataset.remaining, 10) || 0;
+const desktopTimer = document.getElementById("desktopTimer");
+
+function updateTimer() {
+    if (timeLeft < 0) { endElection(); return; }
+
+    const h = Math.floor(timeLeft / 3600);
+    const m = Math.floor((timeLeft % 3600) / 60);
+    const s = timeLeft % 60;
+    const display = `${h.toString().padStart(2,'0')}:${m.toString().padStart(2,'0')}:${s.toString().padStart(2,'0')}`;
+
+    desktopTimer.innerText = display;
+    if(document.getElementById("mobileTimer")) document.getElementById("mobileTimer").innerText = display;
+
+    // URGENT STATE: 10 Minutes (600 Seconds)
+    if (timeLeft <= 600) {
+        desktopTimer.classList.add('urgent-timer');
+    } else {
+        desktopTimer.classList.remove('urgent-timer');
+    }
+
+    timeLeft--;
+}
+
+function endElection() {
+    desktopTimer.innerText = "CLOSED";
+    document.querySelectorAll('.btn-vote').forEach(btn => btn.disabled = true);
+    document.getElementById("mainContainer").style.opacity = "0.5";
+    alert("The voting window has closed.");
+}
+
+setInterval(updateTimer, 1000);
+updateTimer();
+
+// One key per ballot page: retries of the same submission send it again and get the original receipt back
+const submissionKey = Date.now().toString(36) + Math.random().toString(36).slice(2, 12);
+
+function postVote(formData, attempt = 0) {
+    return fetch('/vote', { method: 'POST', body: formData,
+                            headers: { 'X-Requested-With': 'XMLHttpRequest', 'X-Idempotency-Key': submissionKey }})
+        .then(r => { if (!r.ok) throw new Error(r.status); return r.json(); })
+        .catch(err => {
+            if (attempt >= 3) throw err;
+            return new Promise(done => setTimeout(done, 1000 * (attempt + 1))).then(() => postVote(formData, attempt + 1));
+        });
+}
+
+function processVote() {
+    const form = document.getElementById('voteForm');
+    const positions = [...new Set([...form.querySelectorAll('input[type="radio"]')].map(i => i.name))];
+    const missing = [];
+    const selectedSummary = [];
+
+    positions.forEach(pos => {
+        const selected = form.querySelector(`input[name="${pos}"]:checked`);
+        if (!selected) missing.push(pos);
+        else selectedSummary.push(`• ${pos}: ${selected.getAttribute('data-name')}`);
+    });
+
+    if (missing.length > 0) {
+        alert("Missing Votes:\n\n" + missing.join("\n"));
+        return;
+    }
+
+    if (!confirm("Final Confirmation:\n\n" + selectedSummary.join("\n") + "\n\nSubmit ballot?")) return;
+
+    document.getElementById('loadingOverlay').style.display = 'flex';
+
+    setTimeout(() => {
+        const formData = new FormData(form);
+        postVote(formData)
+        .then(data => {
+            document.getElementById('loadingOverlay').style.display = 'none';
+            if (data.status === "success") {
+                const receipt = data.receipt ? data.receipt.map(([pos, name]) => `• ${pos}: ${name}`) : selectedSummary;
+                const receiptHtml = receipt.map(s => `<div style='text-align:left; border-bottom:1px solid #eee; padding:8px; font-size:14px; color:#333;'>${s}</div>`).join("");
+                document.querySelector('#successModal .modal-content').innerHTML = `
+                    <div style="font-size: 40px; color:#2ecc71;">✓</div>
+                    <h2 style="color:#1e293b;">Ballot Recorded</h2>
+                    <p style="color:#e74c3c; font-weight:bold;">📸 Take a screenshot of this receipt.</p>
+                    <div style="max-height:250px; overflow-y:auto; background:#f8fafc; padding:15px; border-radius:10px; margin:15px 0; border:1px solid #ddd;">
+                        ${receiptHtml}
+                    </div>
+                    <button class="btn-vote" style="background:#334155; width:100%;" onclick="attemptLogout()">LOGOUT & EXIT</button>
+                `;
+                document.getElementById('successModal').style.display = 'flex';
+            } else {
+                alert(data.message);
+            }
+        })
+        .catch(() => {
+            document.getElementById('loadingOverlay').style.display = 'none';
+            alert("Could not reach the server. Please check your connection and submit again.");
+        });
+    }, 2000);
+}
\ No newline at end of file
@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QFormLayout, QLineEdit, QComboBox, QFileDialog)
 from PyQt6.QtGui import QFont, QPixmap, QRegularExpressionValidator
 from PyQt6.QtCore import Qt, QRegularExpression
+from view.common import theme
 
 
 class AddCandidateDialog(QDialog):
@@ -234,7 +235,7 @@ class ManageCandidates(QWidget):
         self.load_candidates()
 
     def setup_ui(self):
-        self.setStyleSheet("background: transparent;")
+        self.setStyleSheet(theme.PAGE_BACKGROUND)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
@@ -427,39 +428,13 @@ class ManageCandidates(QWidget):
 
                 edit_btn = QPushButton("Edit")
                 edit_btn.setFixedSize(60, 30)
-                edit_btn.setStyleSheet("""
-                    QPushButton {
-                        background: #3498db;
-                        color: white;
-                        padding: 6px 10px;
-                        border-radius: 5px;
-                        border: 1px solid rgba(255,255,255,0.3);
-                        font-weight: bold;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background: #2980b9;
-                    }
-                """)
+                theme.role(edit_btn, "row-action", tone="blue")
                 edit_btn.clicked.connect(lambda checked, cid=id: self.edit_candidate(cid))
                 actions_layout.addWidget(edit_btn)
 
                 delete_btn = QPushButton("Delete")
                 delete_btn.setFixedSize(60, 30)
-                delete_btn.setStyleSheet("""
-                    QPushButton {
-                        background: #e74c3c;
-                        color: white;
-                        padding: 6px 10px;
-                        border-radius: 5px;
-                        border: 1px solid rgba(255,255,255,0.3);
-                        font-weight: bold;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background: #c0392b;
-                    }
-                """)
+                theme.role(delete_btn, "row-action", tone="red")
                 delete_btn.clicked.connect(lambda checked, cid=id: self.delete_candidate(cid))
                 actions_layout.addWidget(delete_btn)
 
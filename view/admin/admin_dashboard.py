@@ -6,12 +6,9 @@ from PyQt6.QtGui import (QFont, QPainter, QColor, QBrush, QPixmap, QPen,
                          QConicalGradient, QPainterPath, QPolygonF, QLinearGradient,
                          QIntValidator)  # Added QIntValidator
 from PyQt6.QtCore import Qt, QTimer, QDateTime, QRectF, QPointF, QDate
+from view.common import animation_clock, pixmap_cache, theme
 
-from view.admin.admin_candidates import ManageCandidates
-from view.admin.admin_voters import ManageVoters
-from view.admin.admin_results import ResultsDashboard, ExportResultsDialog
-from view.admin.admin_settings import SettingsWindow
-from view.admin.admin_audit import AuditLogViewer
+from view.admin.admin_results import ExportResultsDialog, start_export
 
 
 # ELECTION SETUP DIALOG
@@ -116,9 +113,7 @@ class SidebarShimmerButton(QPushButton):
         # Animation variables
         self._shimmer_pos = -100
         self._is_hovering = False
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._animate)
-        self._timer.setInterval(16)
+        self._timer = animation_clock.ticker(self, self._animate, 16)
 
         self.setStyleSheet("""
             QPushButton {
@@ -197,9 +192,7 @@ class RotatingFrame(QFrame):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
 
-        self.title_lbl = QLabel(title)
-        self.title_lbl.setStyleSheet(
-            f"font-weight: bold; color: {color_hex}; font-size: 28px; background: transparent; border: none;")
+        self.title_lbl = theme.role(QLabel(title), "stat-title", tone=theme.tone(color_hex))
         self.title_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.title_lbl)
 
@@ -207,15 +200,12 @@ class RotatingFrame(QFrame):
         self.value_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.value_lbl)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.setInterval(20)
+        self.timer = animation_clock.ticker(self, self.animate, 20)
         self.timer.start()
 
     def set_color(self, color_hex):
         self.base_color = QColor(color_hex)
-        self.title_lbl.setStyleSheet(
-            f"font-weight: bold; color: {color_hex}; font-size: 28px; background: transparent; border: none;")
+        theme.set_state(self.title_lbl, tone=theme.tone(color_hex))
         self.update()
 
     def animate(self):
@@ -281,9 +271,7 @@ class BallotDropFrame(RotatingFrame):
         self.drop_opacity = 0
         self.is_dropping = False
 
-        self.drop_timer = QTimer(self)
-        self.drop_timer.timeout.connect(self.animate_drop)
-        self.drop_timer.setInterval(20)
+        self.drop_timer = animation_clock.ticker(self, self.animate_drop, 20)
 
     def trigger_drop(self):
         if not self.is_dropping:
@@ -341,9 +329,7 @@ class UrgentTimerFrame(QFrame):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
 
-        self.title_lbl = QLabel(title)
-        self.title_lbl.setStyleSheet(
-            "font-weight: bold; color: #f1c40f; font-size: 28px; background: transparent; border: none;")
+        self.title_lbl = theme.role(QLabel(title), "stat-title", tone="yellow")
         self.title_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.title_lbl)
 
@@ -351,21 +337,17 @@ class UrgentTimerFrame(QFrame):
         self.value_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.value_lbl)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.setInterval(50)
+        self.timer = animation_clock.ticker(self, self.animate, 50)
 
     def set_urgent(self, is_urgent):
         if is_urgent:
             self.current_color = QColor("#e74c3c")
-            self.title_lbl.setStyleSheet(
-                "font-weight: bold; color: #e74c3c; font-size: 28px; background: transparent; border: none;")
+            theme.set_state(self.title_lbl, tone="red")
             self.title_lbl.setText("⚠️ ENDING")
             self.timer.setInterval(30)
         else:
             self.current_color = QColor("#f1c40f")
-            self.title_lbl.setStyleSheet(
-                "font-weight: bold; color: #f1c40f; font-size: 28px; background: transparent; border: none;")
+            theme.set_state(self.title_lbl, tone="yellow")
             self.title_lbl.setText("⏳ Time Left")
             self.timer.setInterval(50)
 
@@ -438,6 +420,8 @@ class UrgentTimerFrame(QFrame):
 
 # TOP CANDIDATES GRAPH
 class TopCandidatesGraph(QWidget):
+    RANK_COLORS = [(241, 196, 15), (52, 152, 219), (231, 76, 60)]
+
     def __init__(self, db):
         super().__init__()
         self.db = db
@@ -447,15 +431,21 @@ class TopCandidatesGraph(QWidget):
 
         self.bar_height = 35
         self.margin_top = 40
+        self.text_width = 180
         self.setMinimumHeight(200)
         self.setStyleSheet("background: transparent;")
 
         self.fade_value = 255
         self.fade_direction = -5
 
-        self.anim_timer = QTimer(self)
-        self.anim_timer.timeout.connect(self.animate_step)
-        self.anim_timer.start(16)
+        # Static parts (title, headers, names, bar tracks) live in a pixmap that is
+        # only redrawn when the set of rows or the width changes.
+        self.shape = None
+        self.rows = []
+        self.chrome = None
+
+        self.anim_timer = animation_clock.ticker(self, self.animate_step, 16)
+        self.anim_timer.start()
 
         self.update_data()
 
@@ -463,6 +453,12 @@ class TopCandidatesGraph(QWidget):
         self.animated_votes.clear()
         self.update()
 
+    def bar_x(self):
+        return self.text_width + 10
+
+    def bar_width(self):
+        return self.width() - self.text_width - 60
+
     def animate_step(self):
         self.fade_value += self.fade_direction
         if self.fade_value <= 100:
@@ -473,123 +469,117 @@ class TopCandidatesGraph(QWidget):
             self.fade_direction = -5
 
         for key, target in self.target_votes.items():
-            if key not in self.animated_votes:
-                self.animated_votes[key] = 0.0
-
-            current = self.animated_votes[key]
-
+            current = self.animated_votes.get(key, 0.0)
             if abs(target - current) > 0.1:
-                diff = target - current
-                self.animated_votes[key] += diff * 0.1
+                self.animated_votes[key] = current + (target - current) * 0.1
             else:
                 self.animated_votes[key] = float(target)
 
-        self.update()
+        # Only the bar column changes between frames
+        self.update(self.bar_x(), 0, self.width() - self.bar_x(), self.height())
 
     def update_data(self):
         try:
-            self.raw_data = []
-
             cursor = self.db.conn.cursor()
-            cursor.execute("SELECT DISTINCT position FROM candidates ORDER BY position")
-            positions = [row[0] for row in cursor.fetchall()]
-
-            for pos in positions:
-                cursor.execute(
-                    "SELECT name, votes, position FROM candidates WHERE position=? ORDER BY votes DESC LIMIT 3", (pos,))
-                results = cursor.fetchall()
-                for res in results:
-                    name, votes, position = res
-                    self.raw_data.append(res)
-
-                    key = f"{name}_{position}"
-                    self.target_votes[key] = votes
+            cursor.execute("SELECT name, votes, position FROM candidates ORDER BY position, votes DESC")
+            data, per_position = [], {}
+            for name, votes, position in cursor.fetchall():
+                if per_position.get(position, 0) >= 3: continue
+                per_position[position] = per_position.get(position, 0) + 1
+                data.append((name, votes, position))
+
+            self.raw_data = data
+            self.target_votes = {f"{name}_{position}": votes for name, votes, position in data}
+
+            shape = tuple((name, position) for name, _, position in data)
+            if shape != self.shape:
+                self.shape = shape
+                self.layout_rows()
+        except Exception as e:
+            print(f"Graph error: {e}")
 
-                    if key not in self.animated_votes:
-                        self.animated_votes[key] = 0.0
+    def layout_rows(self):
+        self.rows = []
+        current_y = self.margin_top
+        last_pos = ""
+        rank_counter = 0
+        for name, _, position in self.raw_data:
+            if position != last_pos:
+                current_y += 35
+                last_pos = position
+                rank_counter = 0
+            rank_counter += 1
+            self.rows.append((f"{name}_{position}", rank_counter, current_y))
+            current_y += self.bar_height + 10
 
-            self.raw_data.sort(key=lambda x: (x[2], -x[1]))
+        total_h = self.margin_top + (len(self.raw_data) * (self.bar_height + 10)) + (len(set(p for _, _, p in self.raw_data)) * 30) + 50
+        self.setMinimumHeight(max(200, total_h))
+        self.chrome = None
+        self.update()
 
-            total_h = self.margin_top + (len(self.raw_data) * (self.bar_height + 10)) + (len(positions) * 30) + 50
-            self.setMinimumHeight(max(200, total_h))
+    def resizeEvent(self, event):
+        self.chrome = None
+        super().resizeEvent(event)
 
-        except Exception as e:
-            print(f"Graph error: {e}")
+    def render_chrome(self):
+        ratio = self.devicePixelRatioF()
+        self.chrome = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        self.chrome.setDevicePixelRatio(ratio)
+        self.chrome.fill(Qt.GlobalColor.transparent)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+        painter = QPainter(self.chrome)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setPen(QColor("white"))
-
         font = painter.font()
         font.setPixelSize(16)
         font.setBold(True)
         painter.setFont(font)
         painter.drawText(0, 0, self.width(), 30, Qt.AlignmentFlag.AlignLeft, "🏆 Current Leaders per Position (Top 3)")
 
-        if not self.raw_data: return
-
-        max_votes = 1
-        if self.target_votes:
-            max_votes = max(self.target_votes.values())
-        if max_votes == 0: max_votes = 1
-
-        text_width = 180
-        available_width = self.width() - text_width - 60
-        current_y = self.margin_top
-
         font.setPixelSize(13)
         painter.setFont(font)
-
-        last_pos = ""
-        rank_counter = 0
-
-        for name, real_votes, position in self.raw_data:
-            if position != last_pos:
-                current_y += 15
+        for (name, _, position), (_, rank, y) in zip(self.raw_data, self.rows):
+            if rank == 1:
                 painter.setPen(QColor("#f1c40f"))
-                painter.drawText(0, current_y, text_width, self.bar_height // 2, Qt.AlignmentFlag.AlignLeft,
+                painter.drawText(0, y - 20, self.text_width, self.bar_height // 2, Qt.AlignmentFlag.AlignLeft,
                                  position.upper())
-                current_y += 20
-                last_pos = position
-                rank_counter = 0
-
-            rank_counter += 1
             painter.setPen(QColor("white"))
-            painter.drawText(0, current_y + 5, text_width, self.bar_height,
-                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, f"{rank_counter}. {name}")
-
-            # Background bar
-            bar_x = text_width + 10
+            painter.drawText(0, y + 5, self.text_width, self.bar_height,
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, f"{rank}. {name}")
             painter.setBrush(QBrush(QColor(255, 255, 255, 30)))
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(bar_x, current_y, available_width, self.bar_height, 4, 4)
+            painter.drawRoundedRect(self.bar_x(), y, self.bar_width(), self.bar_height, 4, 4)
+        painter.end()
 
-            key = f"{name}_{position}"
-            display_votes = self.animated_votes.get(key, 0.0)
+    def paintEvent(self, event):
+        if self.chrome is None: self.render_chrome()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.chrome)
+        if not self.rows: return
 
-            bar_w = max(5, int((display_votes / max_votes) * available_width))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        font = painter.font()
+        font.setPixelSize(13)
+        font.setBold(True)
+        painter.setFont(font)
 
-            if rank_counter == 1:
-                bar_color = QColor(241, 196, 15, self.fade_value)
-            elif rank_counter == 2:
-                bar_color = QColor(52, 152, 219, self.fade_value)
-            elif rank_counter == 3:
-                bar_color = QColor(231, 76, 60, self.fade_value)
-            else:
-                bar_color = QColor("#3498db")
+        max_votes = max(self.target_votes.values()) or 1
+        bar_x, available_width = self.bar_x(), self.bar_width()
+        top, bottom = event.rect().top(), event.rect().bottom()
 
-            painter.setBrush(QBrush(bar_color))
-            painter.drawRoundedRect(bar_x, current_y, bar_w, self.bar_height, 4, 4)
+        for key, rank, y in self.rows:
+            if y + self.bar_height < top or y > bottom: continue
+            display_votes = self.animated_votes.get(key, 0.0)
+            bar_w = max(5, int((display_votes / max_votes) * available_width))
 
-            # Draw Number
-            num_x = bar_x + bar_w + 10
-            painter.setPen(QColor("white"))
-            painter.drawText(num_x, current_y, 50, self.bar_height,
-                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-                             str(int(display_votes)))
+            r, g, b = self.RANK_COLORS[rank - 1] if rank <= 3 else (52, 152, 219)
+            painter.setBrush(QBrush(QColor(r, g, b, self.fade_value if rank <= 3 else 255)))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(bar_x, y, bar_w, self.bar_height, 4, 4)
 
-            current_y += self.bar_height + 10
+            painter.setPen(QColor("white"))
+            painter.drawText(bar_x + bar_w + 10, y, 50, self.bar_height,
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, str(int(display_votes)))
 
 
 # ADMIN DASHBOARD
@@ -648,10 +638,7 @@ class AdminDashboard(QMainWindow):
         # Logo
         logo_label = QLabel()
         try:
-            logo_pixmap = QPixmap("logo.png")
-            logo_pixmap = logo_pixmap.scaled(120, 120, Qt.AspectRatioMode.KeepAspectRatio,
-                                             Qt.TransformationMode.SmoothTransformation)
-            logo_label.setPixmap(logo_pixmap)
+            logo_label.setPixmap(pixmap_cache.scaled("logo.png", 120))
         except:
             logo_label.setText("🗳️")
             logo_label.setFont(QFont("Arial", 50))
@@ -702,8 +689,10 @@ class AdminDashboard(QMainWindow):
 
         # Main content
         main_content = QWidget()
+        # Scoped to this widget: a selectorless rule here would outrank the app stylesheet on every page
+        main_content.setObjectName("mainContent")
         main_content.setStyleSheet("""
-            QWidget {
+            QWidget#mainContent {
                 background: qlineargradient(
                     x1:0, y1:0, x2:1, y2:1,
                     stop:0 #2c3e50,
@@ -723,20 +712,38 @@ class AdminDashboard(QMainWindow):
         self.dashboard_page = self.create_dashboard_page()
         self.stacked_widget.addWidget(self.dashboard_page)
 
-        self.candidates_page = ManageCandidates(self.db)
-        self.stacked_widget.addWidget(self.candidates_page)
-
-        self.voters_page = ManageVoters(self.db)
-        self.stacked_widget.addWidget(self.voters_page)
-
-        self.results_page = ResultsDashboard(self.db)
-        self.stacked_widget.addWidget(self.results_page)
-
-        self.audit_page = AuditLogViewer(self.db)
-        self.stacked_widget.addWidget(self.audit_page)
-
-        self.settings_page = SettingsWindow(self.db)
-        self.stacked_widget.addWidget(self.settings_page)
+        # Remaining pages are built on first visit (see open_page)
+        self.candidates_page = self.voters_page = self.results_page = self.audit_page = self.settings_page = None
+        self.pending_pages = {1, 2, 3, 4, 5}
+        for _ in self.pending_pages:
+            self.stacked_widget.addWidget(QWidget())
+
+    def build_page(self, index):
+        if index == 1:
+            from view.admin.admin_candidates import ManageCandidates
+            self.candidates_page = ManageCandidates(self.db); return self.candidates_page
+        elif index == 2:
+            from view.admin.admin_voters import ManageVoters
+            self.voters_page = ManageVoters(self.db); return self.voters_page
+        elif index == 3:
+            from view.admin.admin_results import ResultsDashboard
+            self.results_page = ResultsDashboard(self.db); return self.results_page
+        elif index == 4:
+            from view.admin.admin_audit import AuditLogViewer
+            self.audit_page = AuditLogViewer(self.db); return self.audit_page
+        elif index == 5:
+            from view.admin.admin_settings import SettingsWindow
+            self.settings_page = SettingsWindow(self.db); return self.settings_page
+
+    def open_page(self, index):
+        page = self.stacked_widget.widget(index)
+        if index in self.pending_pages:
+            self.pending_pages.discard(index)
+            self.stacked_widget.removeWidget(page); page.deleteLater()
+            page = self.build_page(index)
+            self.stacked_widget.insertWidget(index, page)
+        self.stacked_widget.setCurrentIndex(index)
+        return page
 
     def create_dashboard_page(self):
         widget = QWidget()
@@ -759,25 +766,25 @@ class AdminDashboard(QMainWindow):
 
         # Total Voters
         self.total_voters_label = QLabel("0")
-        self.total_voters_label.setStyleSheet(self.get_stat_label_style())
+        theme.role(self.total_voters_label, "stat")
         self.voters_frame = RotatingFrame("👥 Total Voters", self.total_voters_label, "#3498db")
         stats_layout.addWidget(self.voters_frame)
 
         # Votes Cast
         self.votes_cast_label = QLabel("0")
-        self.votes_cast_label.setStyleSheet(self.get_stat_label_style())
+        theme.role(self.votes_cast_label, "stat")
         self.votes_frame = BallotDropFrame("🗳️ Votes Cast", self.votes_cast_label, "#2ecc71")
         stats_layout.addWidget(self.votes_frame)
 
         # Status
         self.status_label = QLabel("INACTIVE")
-        self.status_label.setStyleSheet(self.get_stat_label_style())
+        theme.role(self.status_label, "stat")
         self.status_frame = RotatingFrame("📊 Status", self.status_label, "#e74c3c")
         stats_layout.addWidget(self.status_frame)
 
         # Timer
         self.timer_label = QLabel("--:--:--")
-        self.timer_label.setStyleSheet(self.get_stat_label_style())
+        theme.role(self.timer_label, "stat", compact=False)
         self.timer_frame = UrgentTimerFrame("⏳ Time Left", self.timer_label)
         stats_layout.addWidget(self.timer_frame)
 
@@ -830,12 +837,6 @@ class AdminDashboard(QMainWindow):
         layout.addLayout(controls_layout)
         return widget
 
-    def get_stat_label_style(self):
-        return """
-            font-size: 50px; font-weight: bold; color: white;
-            background: transparent; border: none;
-        """
-
     def get_button_style(self, color):
         return f"""
             QPushButton {{
@@ -882,23 +883,19 @@ class AdminDashboard(QMainWindow):
         self.check_election_status()
 
     def show_candidates(self):
-        self.stacked_widget.setCurrentIndex(1);
-        self.candidates_page.load_candidates()
+        self.open_page(1).load_candidates()
 
     def show_voters(self):
-        self.stacked_widget.setCurrentIndex(2);
-        self.voters_page.load_voters()
+        self.open_page(2).load_voters()
 
     def show_results(self):
-        self.stacked_widget.setCurrentIndex(3);
-        self.results_page.load_results()
+        self.open_page(3).load_results()
 
     def show_audit(self):
-        self.stacked_widget.setCurrentIndex(4)
-        self.audit_page.load_logs()
+        self.open_page(4).load_logs()
 
     def show_settings(self):
-        self.stacked_widget.setCurrentIndex(5)
+        self.open_page(5)
 
     def update_timer_display(self):
         status = self.db.get_config('election_status')
@@ -934,10 +931,10 @@ class AdminDashboard(QMainWindow):
 
             if days > 0:
                 self.timer_label.setText(f"{days}Day {hours:02}:{minutes:02}:{seconds:02}")
-                self.timer_label.setStyleSheet(self.get_stat_label_style().replace("60px", "36px"))
+                theme.set_state(self.timer_label, compact=True)
             else:
                 self.timer_label.setText(f"{hours:02}:{minutes:02}:{seconds:02}")
-                self.timer_label.setStyleSheet(self.get_stat_label_style())
+                theme.set_state(self.timer_label, compact=False)
 
     def check_election_status(self):
         status = self.db.get_config('election_status')
@@ -977,6 +974,7 @@ class AdminDashboard(QMainWindow):
 
             # Reset Votes Logic
             cursor.execute("DELETE FROM votes")
+            cursor.execute("DELETE FROM ballot_receipts")
             cursor.execute("UPDATE candidates SET votes = 0")
             cursor.execute("UPDATE users SET voted = 0")
             self.db.conn.commit()
@@ -995,6 +993,8 @@ class AdminDashboard(QMainWindow):
 
             target_time = QDateTime.currentDateTime().addSecs(duration)
             self.db.update_config('election_target_time', target_time.toString(Qt.DateFormat.ISODate))
+            # Ballot journal replay only counts records from this point on (models/ballot_journal.py)
+            self.db.update_config('election_started', QDateTime.currentDateTime().toString(Qt.DateFormat.ISODate))
 
             self.db.update_config('election_status', 'active')
             self.db.log_audit("admin", "Started Election")
@@ -1014,12 +1014,13 @@ class AdminDashboard(QMainWindow):
             self.db.update_config('election_target_time', "")
             self.check_election_status()
 
+            # The report is built on a worker thread so the dashboard stays live while the election closes
             try:
                 filename = f"Election_Results_Final_{QDateTime.currentDateTime().toString('yyyyMMdd_HHmmss')}.pdf"
-                exporter = ExportResultsDialog(self.db)
-                exporter.generate_pdf(filename)
-                QMessageBox.information(self, "Time's Up",
-                                        f"Election ended automatically.\nResults saved to:\n{filename}")
+                self.export_worker = start_export(
+                    self.db, filename, self,
+                    lambda f: QMessageBox.information(self, "Time's Up", f"Election ended automatically.\nResults saved to:\n{f}"),
+                    lambda e: print(f"Auto-export failed: {e}"))
             except Exception as e:
                 print(f"Auto-export failed: {e}")
             return
@@ -1038,9 +1039,10 @@ class AdminDashboard(QMainWindow):
 
             if file_path:
                 try:
-                    exporter = ExportResultsDialog(self.db)
-                    exporter.generate_pdf(file_path)
-                    QMessageBox.information(self, "Success", f"Election stopped.\nReport saved to:\n{file_path}")
+                    self.export_worker = start_export(
+                        self.db, file_path, self,
+                        lambda f: QMessageBox.information(self, "Success", f"Election stopped.\nReport saved to:\n{f}"),
+                        lambda e: QMessageBox.critical(self, "Export Error", f"Failed to save PDF:\n{e}"))
                 except Exception as e:
                     QMessageBox.critical(self, "Export Error", f"Failed to save PDF:\n{e}")
             else:
@@ -3,14 +3,130 @@ from datetime import datetime
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QTableWidget, QTableWidgetItem, QHeaderView,
                              QDialog, QRadioButton, QMessageBox, QScrollArea, QFrame,
-                             QFileDialog, QAbstractItemView)
+                             QFileDialog, QAbstractItemView, QProgressDialog)
 from PyQt6.QtGui import QFont, QColor, QBrush
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt6 import sip
+
+
+def load_results(db):
+    # Read on the caller's (GUI) thread: the DB connection must not be shared with the worker
+    cursor = db.conn.cursor()
+    election_name = db.get_config('election_name') or "Election Results"
+    cursor.execute("SELECT position, name, grade, votes FROM candidates ORDER BY position, votes DESC")
+    return election_name, cursor.fetchall()
+
+
+def group_results(rows):
+    # Rows arrive ordered by position, votes DESC, so the first row of a position carries its top count
+    sections = []
+    for pos, name, grade, votes in rows:
+        if not sections or sections[-1][0] != pos:
+            sections.append((pos, votes, []))
+        top = sections[-1][1]
+        sections[-1][2].append((name, grade, votes, votes > 0 and votes == top))
+    return sections
+
+
+def build_results_pdf(filename, election_name, rows, progress=None):
+    # reportlab is heavy to import, so only load it when a PDF is actually exported
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    doc = SimpleDocTemplate(filename, pagesize=letter)
+    elements = []
+    styles = getSampleStyleSheet()
+
+    try:
+        logo = Image("logo1.png", width=150, height=150)
+        logo.hAlign = 'CENTER'
+        elements.append(logo)
+        elements.append(Spacer(1, 10))
+    except Exception as e:
+        print(f"Logo not found or error: {e}")
+
+    title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=24, alignment=1, spaceAfter=20,
+                                 textColor=colors.darkblue)
+    elements.append(Paragraph(election_name, title_style))
+
+    subtitle_style = ParagraphStyle('Subtitle', parent=styles['Normal'], fontSize=12, alignment=1, spaceAfter=30)
+    elements.append(
+        Paragraph(f"Official Results - Generated on {datetime.now().strftime('%B %d, %Y')}", subtitle_style))
+
+    section_style = ParagraphStyle('Position', parent=styles['Heading2'], textColor=colors.darkblue, spaceBefore=12,
+                                   spaceAfter=6, keepWithNext=1)
+    base_style = [('BACKGROUND', (0, 0), (-1, 0), colors.darkblue), ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                  ('ALIGN', (0, 0), (-1, -1), 'CENTER'), ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                  ('FONTSIZE', (0, 0), (-1, 0), 12), ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                  ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke), ('GRID', (0, 0), (-1, -1), 1, colors.black)]
+
+    sections = group_results(rows)
+    for done, (pos, _, candidates) in enumerate(sections, 1):
+        data = [['Candidate Name', 'Grade', 'Votes', 'Status']]
+        style = list(base_style)
+        for i, (name, grade, votes, winner) in enumerate(candidates, 1):
+            data.append([name, grade, str(votes), "WINNER" if winner else ""])
+            if winner:
+                style += [('BACKGROUND', (0, i), (-1, i), colors.lightgreen), ('TEXTCOLOR', (0, i), (-1, i), colors.black),
+                          ('FONTNAME', (0, i), (-1, i), 'Helvetica-Bold')]
+        # One table per position: reportlab splits it across pages and repeats the header row
+        table = Table(data, colWidths=[190, 90, 70, 100], repeatRows=1)
+        table.setStyle(TableStyle(style))
+        elements.append(Paragraph(str(pos), section_style))
+        elements.append(table)
+        if progress: progress(done, len(sections) + 1)
+
+    elements.append(Spacer(1, 30))
+    footer_style = ParagraphStyle('Footer', parent=styles['Normal'], fontSize=10, textColor=colors.grey)
+    elements.append(
+        Paragraph("This document is an official record generated by VoteSphere. It is read-only. Created By: Reynaldo M. Seroje", footer_style))
+    doc.build(elements)
+    if progress: progress(len(sections) + 1, len(sections) + 1)
+
+
+class ResultsExportWorker(QThread):
+    progress = pyqtSignal(int, int)
+    done = pyqtSignal(str)
+    failed = pyqtSignal(str)
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    def __init__(self, filename, election_name, rows, parent=None):
+        super().__init__(parent)
+        self.filename = filename
+        self.election_name = election_name
+        self.rows = rows
+
+    def run(self):
+        try:
+            build_results_pdf(self.filename, self.election_name, self.rows, self.progress.emit)
+            self.done.emit(self.filename)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+# Running export threads. They are not parented to the window that started them:
+# closing that window mid-export would destroy a QThread that is still running.
+running_exports = set()
+
+
+def start_export(db, filename, parent, on_done, on_failed):
+    election_name, rows = load_results(db)
+    worker = ResultsExportWorker(filename, election_name, rows)
+    running_exports.add(worker)
+    progress = QProgressDialog("Generating results PDF...", None, 0, 0, parent)
+    progress.setWindowTitle("Exporting Results")
+    progress.setWindowModality(Qt.WindowModality.NonModal)
+    progress.setMinimumDuration(300)
+    # The parent may be gone by the time the PDF is written; only call back into it while it exists
+    worker.progress.connect(lambda done, total: sip.isdeleted(progress) or (progress.setMaximum(total), progress.setValue(done)))
+    worker.done.connect(lambda f: sip.isdeleted(parent) or on_done(f))
+    worker.failed.connect(lambda e: sip.isdeleted(parent) or on_failed(e))
+    worker.finished.connect(lambda: sip.isdeleted(progress) or progress.close())
+    worker.finished.connect(lambda: running_exports.discard(worker))
+    worker.finished.connect(worker.deleteLater)
+    worker.start()
+    return worker
 
 
 class ExportResultsDialog(QDialog):
@@ -53,75 +169,17 @@ class ExportResultsDialog(QDialog):
                                                   "PDF Files (*.pdf)")
         if not filename: return
 
-        try:
-            self.generate_pdf(filename)
-            self.db.log_audit("admin", "Exported election results to PDF")
-            QMessageBox.information(self, "Success", f"Results exported successfully to:\n{filename}")
-            self.accept()
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export file:\n{str(e)}")
+        for btn in self.findChildren(QPushButton): btn.setEnabled(False)
+        self.worker = start_export(self.db, filename, self, self.export_done, self.export_failed)
 
-    def generate_pdf(self, filename):
-        cursor = self.db.conn.cursor()
-        election_name = self.db.get_config('election_name') or "Election Results"
+    def export_done(self, filename):
+        self.db.log_audit("admin", "Exported election results to PDF")
+        QMessageBox.information(self, "Success", f"Results exported successfully to:\n{filename}")
+        self.accept()
 
-        cursor.execute("SELECT position, name, grade, votes FROM candidates ORDER BY position, votes DESC")
-        rows = cursor.fetchall()
-
-        doc = SimpleDocTemplate(filename, pagesize=letter)
-        elements = []
-        styles = getSampleStyleSheet()
-
-        try:
-            logo = Image("logo1.png", width=150, height=150)
-            logo.hAlign = 'CENTER'
-            elements.append(logo)
-            elements.append(Spacer(1, 10))
-        except Exception as e:
-            print(f"Logo not found or error: {e}")
-
-        title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=24, alignment=1, spaceAfter=20,
-                                     textColor=colors.darkblue)
-        elements.append(Paragraph(election_name, title_style))
-
-        subtitle_style = ParagraphStyle('Subtitle', parent=styles['Normal'], fontSize=12, alignment=1, spaceAfter=30)
-        elements.append(
-            Paragraph(f"Official Results - Generated on {datetime.now().strftime('%B %d, %Y')}", subtitle_style))
-
-        data = [['Position', 'Candidate Name', 'Grade', 'Votes', 'Status']]
-        position_max_votes = {}
-        for row in rows:
-            pos, _, _, v = row
-            if pos not in position_max_votes:
-                position_max_votes[pos] = v
-            else:
-                position_max_votes[pos] = max(position_max_votes[pos], v)
-
-        for row in rows:
-            status = "WINNER" if row[3] > 0 and row[3] == position_max_votes[row[0]] else ""
-            data.append([row[0], row[1], row[2], str(row[3]), status])
-
-        table = Table(data, colWidths=[120, 150, 80, 60, 100])
-        style = TableStyle(
-            [('BACKGROUND', (0, 0), (-1, 0), colors.darkblue), ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-             ('ALIGN', (0, 0), (-1, -1), 'CENTER'), ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-             ('FONTSIZE', (0, 0), (-1, 0), 12), ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-             ('BACKGROUND', (0, 1), (-1, -1), colors.whitesmoke), ('GRID', (0, 0), (-1, -1), 1, colors.black)])
-
-        for i, row in enumerate(data):
-            if i == 0: continue
-            if row[4] == "WINNER":
-                style.add('BACKGROUND', (0, i), (-1, i), colors.lightgreen)
-                style.add('TEXTCOLOR', (0, i), (-1, i), colors.black)
-                style.add('FONTNAME', (0, i), (-1, i), 'Helvetica-Bold')
-
-        table.setStyle(style)
-        elements.append(table)
-        elements.append(Spacer(1, 30))
-        footer_style = ParagraphStyle('Footer', parent=styles['Normal'], fontSize=10, textColor=colors.grey)
-        elements.append(
-            Paragraph("This document is an official record generated by VoteSphere. It is read-only. Created By: Reynaldo M. Seroje", footer_style))
-        doc.build(elements)
+    def export_failed(self, error):
+        for btn in self.findChildren(QPushButton): btn.setEnabled(True)
+        QMessageBox.critical(self, "Export Error", f"Failed to export file:\n{error}")
 
 
 class ResultsDashboard(QWidget):
@@ -161,91 +219,106 @@ class ResultsDashboard(QWidget):
         self.scroll_area.setWidget(self.results_container)
         layout.addWidget(self.scroll_area)
 
+        self.position_frames = {}
+        self.no_data_label = QLabel("No active candidates or positions found.")
+        self.no_data_label.setStyleSheet("color: white; font-size: 18px; padding: 20px;")
+        self.no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_data_label.hide()
+        self.results_layout.addWidget(self.no_data_label)
+
         self.update_label = QLabel("Last updated: --")
         self.update_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.update_label.setStyleSheet("color: rgba(255,255,255,0.7); font-weight: bold; padding: 10px;")
         layout.addWidget(self.update_label)
 
-    def load_results(self):
-        scroll_pos = self.scroll_area.verticalScrollBar().value()
-
-        while self.results_layout.count():
-            item = self.results_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
+    def build_position_frame(self, position):
+        position_frame = QFrame()
+        position_frame.setStyleSheet(
+            "QFrame { background: rgba(0,0,0,0.1); border-radius: 15px; border: 1px solid rgba(255,255,255,0.2); }")
+        frame_layout = QVBoxLayout(position_frame)
+        frame_layout.setContentsMargins(15, 15, 15, 15)
+        frame_layout.setSpacing(10)
+
+        pos_title = QLabel(f"🏆 {position}")
+        pos_title.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        pos_title.setStyleSheet("color: #f1c40f; border: none; background: transparent;")
+        frame_layout.addWidget(pos_title)
+
+        table = QTableWidget()
+        table.setColumnCount(3)
+        table.setHorizontalHeaderLabels(["Rank", "Candidate Name", "Total Votes"])
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        table.verticalHeader().setDefaultSectionSize(40)
+
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+
+        table.setStyleSheet(
+            "QTableWidget { background: rgba(0,0,0,0.2); border: none; gridline-color: rgba(255,255,255,0.1); color: white; font-size: 14px; } QHeaderView::section { background: rgba(255,255,255,0.15); color: white; padding: 0px; height: 35px; border: none; font-weight: bold; } QTableWidget::item { padding-left: 10px; }")
+
+        frame_layout.addWidget(table)
+        return position_frame, table
+
+    def fill_position_table(self, table, candidates_data):
+        old_rows = table.rowCount()
+        if old_rows != len(candidates_data):
+            table.setRowCount(len(candidates_data))
+            for i in range(old_rows, len(candidates_data)):
+                rank_item = QTableWidgetItem()
+                rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                vote_item = QTableWidgetItem()
+                vote_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                table.setItem(i, 0, rank_item)
+                table.setItem(i, 1, QTableWidgetItem())
+                table.setItem(i, 2, vote_item)
+            total_height = 35 + (len(candidates_data) * 40) + 5
+            table.setMinimumHeight(total_height)
+            table.setMaximumHeight(total_height)
+
+        for i, (name, votes) in enumerate(candidates_data):
+            for col, text in enumerate((str(i + 1), name, str(votes))):
+                item = table.item(i, col)
+                if item.text() != text:
+                    item.setText(text)
+                if i == 0 and votes > 0:
+                    item.setBackground(QColor(241, 196, 15, 50))
+                    item.setForeground(QBrush(QColor("#f0efeb")))
+                else:
+                    item.setBackground(QBrush(Qt.BrushStyle.NoBrush))
+                    item.setForeground(QBrush(QColor("white")))
 
+    def load_results(self):
         try:
             cursor = self.db.conn.cursor()
             cursor.execute("SELECT DISTINCT position FROM candidates ORDER BY position")
             positions = [row[0] for row in cursor.fetchall()]
 
+            for position in [p for p in self.position_frames if p not in positions]:
+                frame, _ = self.position_frames.pop(position)
+                self.results_layout.removeWidget(frame)
+                frame.deleteLater()
+
+            self.no_data_label.setVisible(not positions)
             if not positions:
-                no_data = QLabel("No active candidates or positions found.")
-                no_data.setStyleSheet("color: white; font-size: 18px; padding: 20px;")
-                no_data.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.results_layout.addWidget(no_data)
                 return
 
-            for position in positions:
-                position_frame = QFrame()
-                position_frame.setStyleSheet(
-                    "QFrame { background: rgba(0,0,0,0.1); border-radius: 15px; border: 1px solid rgba(255,255,255,0.2); }")
-                frame_layout = QVBoxLayout(position_frame)
-                frame_layout.setContentsMargins(15, 15, 15, 15)
-                frame_layout.setSpacing(10)
-
-                pos_title = QLabel(f"🏆 {position}")
-                pos_title.setFont(QFont("Arial", 18, QFont.Weight.Bold))
-                pos_title.setStyleSheet("color: #f1c40f; border: none; background: transparent;")
-                frame_layout.addWidget(pos_title)
+            for index, position in enumerate(positions):
+                if position not in self.position_frames:
+                    self.position_frames[position] = self.build_position_frame(position)
+                    self.results_layout.insertWidget(index, self.position_frames[position][0])
+                frame, table = self.position_frames[position]
+                if self.results_layout.indexOf(frame) != index:
+                    self.results_layout.removeWidget(frame)
+                    self.results_layout.insertWidget(index, frame)
 
                 cursor.execute("SELECT name, votes FROM candidates WHERE position = ? ORDER BY votes DESC", (position,))
-                candidates_data = cursor.fetchall()
-
-                table = QTableWidget()
-                table.setColumnCount(3)
-                table.setHorizontalHeaderLabels(["Rank", "Candidate Name", "Total Votes"])
-                table.verticalHeader().setVisible(False)
-                table.setRowCount(len(candidates_data))
-                table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-                table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-                table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-                row_height = 40
-                table.verticalHeader().setDefaultSectionSize(row_height)
-                header_height = 35
-                total_height = header_height + (len(candidates_data) * row_height) + 5
-                table.setMinimumHeight(total_height)
-                table.setMaximumHeight(total_height)
-
-                table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-                table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-                table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-
-                table.setStyleSheet(
-                    f"QTableWidget {{ background: rgba(0,0,0,0.2); border: none; gridline-color: rgba(255,255,255,0.1); color: white; font-size: 14px; }} QHeaderView::section {{ background: rgba(255,255,255,0.15); color: white; padding: 0px; height: {header_height}px; border: none; font-weight: bold; }} QTableWidget::item {{ padding-left: 10px; }}")
-
-                max_votes = candidates_data[0][1] if candidates_data else 0
-                for i, (name, votes) in enumerate(candidates_data):
-                    rank_item = QTableWidgetItem(str(i + 1))
-                    rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    table.setItem(i, 0, rank_item)
-                    table.setItem(i, 1, QTableWidgetItem(name))
-                    vote_item = QTableWidgetItem(str(votes))
-                    vote_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    table.setItem(i, 2, vote_item)
-
-                    if i == 0 and votes > 0:
-                        for col in range(3):
-                            item = table.item(i, col)
-                            item.setBackground(QColor(241, 196, 15, 50))
-                            item.setForeground(QBrush(QColor("#f0efeb")))
-
-                frame_layout.addWidget(table)
-                self.results_layout.addWidget(position_frame)
+                self.fill_position_table(table, cursor.fetchall())
 
             self.update_label.setText(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-            self.scroll_area.verticalScrollBar().setValue(scroll_pos)
-
         except Exception as e:
-            print(f"Error loading results: {e}")
\ No newline at end of file
+            print(f"Error loading results: {e}")
@@ -1,7 +1,9 @@
-import os, sys, random
+import os, sys
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+from view.common import animation_clock, pixmap_cache
+from view.common.particles import SnowField
 
 def resource_path(relative_path):
     try: base_path = sys._MEIPASS
@@ -12,24 +14,19 @@ class SnowFallBackground(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.snowflakes = [{'x': random.randint(0, 3000), 'y': random.randint(-50, 2000), 'size': random.randint(1, 3), 'speed': random.uniform(0.5, 1.5)} for _ in range(80)]
-        self.timer = QTimer(self); self.timer.timeout.connect(self.update_snow); self.timer.start(30)
-    def update_snow(self):
-        for f in self.snowflakes:
-            f['y'] += f['speed']
-            if f['y'] > self.height(): f['y'] = -10; f['x'] = random.randint(0, self.width())
-        self.update()
+        self.field = SnowField(40, sizes=(1, 2, 3), speed=(0.5, 1.5), color=QColor(100, 200, 255, 40))
+        self.timer = animation_clock.ticker(self, self.update_snow, 30, particles=True); self.timer.start()
+    def resizeEvent(self, event): self.field.resize(self.width(), self.height()); super().resizeEvent(event)
+    def update_snow(self): self.field.step(); self.update()
     def paintEvent(self, event):
-        p = QPainter(self); p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setBrush(QColor(100, 200, 255, 40)); p.setPen(Qt.PenStyle.NoPen)
-        for f in self.snowflakes: p.drawEllipse(int(f['x']), int(f['y']), f['size'], f['size'])
+        p = QPainter(self); p.setRenderHint(QPainter.RenderHint.Antialiasing); self.field.paint(p)
 
 class SidebarShimmerButton(QPushButton):
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self._shimmer_pos, self._is_hovering, self._is_active = -100, False, False
-        self._timer = QTimer(self); self._timer.timeout.connect(self.update); self._timer.setInterval(16)
+        self._timer = animation_clock.ticker(self, self.update, 16)
         self.setStyleSheet("QPushButton { background: transparent; color: white; text-align: left; padding: 15px 25px; border-radius: 10px; margin: 4px 8px; font-size: 14px; font-weight: 500; border: none; }")
     def set_active(self, active):
         self._is_active = active
@@ -60,7 +57,7 @@ class RotatingFrame(QFrame):
         self.value_lbl = QLabel("0"); self.value_lbl.setStyleSheet("color: white; font-size: 48px; font-weight: bold; background: transparent; border:none;")
         self.value_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.title_lbl); layout.addWidget(self.value_lbl)
-        self.timer = QTimer(self); self.timer.timeout.connect(self.animate); self.timer.start(20)
+        self.timer = animation_clock.ticker(self, self.animate, 20); self.timer.start()
     def animate(self): self.angle -= 4; self.update()
     def paintEvent(self, event):
         p = QPainter(self); p.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -74,7 +71,7 @@ class TopCandidatesGraph(QWidget):
     def __init__(self):
         super().__init__()
         self.setMinimumHeight(350); self.data = []; self.target_votes = {}; self.animated_votes = {}
-        self.anim_timer = QTimer(self); self.anim_timer.timeout.connect(self.animate_step); self.anim_timer.start(16)
+        self.anim_timer = animation_clock.ticker(self, self.animate_step, 16); self.anim_timer.start()
     def animate_step(self):
         for k, v in self.target_votes.items():
             if k not in self.animated_votes: self.animated_votes[k] = 0.0
@@ -106,14 +103,15 @@ class AdminDashboard(QMainWindow):
         self.setWindowTitle("VoteSphere - Admin Dashboard"); self.setMinimumSize(1280, 800)
         self.setStyleSheet("QMainWindow { background-color: #0f172a; }")
         self.sidebar_buttons = []; self.setup_ui()
+    def resizeEvent(self, event): self.snow.resize(self.width(), self.height()); super().resizeEvent(event)
     def setup_ui(self):
         central = QWidget(); self.setCentralWidget(central)
         main_layout = QHBoxLayout(central); main_layout.setContentsMargins(0, 0, 0, 0); main_layout.setSpacing(0)
         self.snow = SnowFallBackground(central)
         sidebar = QFrame(); sidebar.setFixedWidth(260); sidebar.setStyleSheet("QFrame { background: #1e293b; border-right: 1px solid #334155; }")
         sidebar_layout = QVBoxLayout(sidebar)
-        logo = QLabel(); path = resource_path("assets/logo.png")
-        if os.path.exists(path): logo.setPixmap(QPixmap(path).scaled(140, 140, Qt.AspectRatioMode.KeepAspectRatio))
+        logo = QLabel(); pix = pixmap_cache.scaled("assets/logo.png", 140)
+        if not pix.isNull(): logo.setPixmap(pix)
         sidebar_layout.addWidget(logo, 0, Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignTop)
         sidebar_layout.addSpacing(20)
         menus = ["📊 Dashboard", "👥 Candidates", "👤 Voters", "📈 Results", "🛡️ Audit Log", "⚙️ Settings"]
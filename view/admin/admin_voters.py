@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QAbstractItemView, QComboBox)
 from PyQt6.QtCore import Qt, QRegularExpression
 from PyQt6.QtGui import QFont, QBrush, QColor, QRegularExpressionValidator
+from view.common import theme
 
 
 class AddVoterDialog(QDialog):
@@ -288,7 +289,7 @@ class ManageVoters(QWidget):
         self.load_voters()
 
     def setup_ui(self):
-        self.setStyleSheet("background: transparent;")
+        self.setStyleSheet(theme.PAGE_BACKGROUND)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
@@ -478,13 +479,13 @@ class ManageVoters(QWidget):
 
                 edit_btn = QPushButton("Edit")
                 edit_btn.setFixedSize(60, 30)
-                edit_btn.setStyleSheet(self.get_action_btn_style("#3498db", "#2980b9"))
+                theme.role(edit_btn, "row-action", tone="blue")
                 edit_btn.clicked.connect(lambda checked, v_id=vid, v_data=voter: self.edit_voter(v_id, v_data))
                 actions_layout.addWidget(edit_btn)
 
                 delete_btn = QPushButton("Delete")
                 delete_btn.setFixedSize(60, 30)
-                delete_btn.setStyleSheet(self.get_action_btn_style("#e74c3c", "#c0392b"))
+                theme.role(delete_btn, "row-action", tone="red")
                 delete_btn.clicked.connect(lambda checked, v_id=vid: self.delete_voter(v_id))
                 actions_layout.addWidget(delete_btn)
 
@@ -498,15 +499,6 @@ class ManageVoters(QWidget):
         finally:
             if cursor: cursor.close()
 
-    def get_action_btn_style(self, color, hover):
-        return f"""
-            QPushButton {{
-                background: {color}; color: white; padding: 6px 10px;
-                border-radius: 4px; border: 1px solid rgba(255,255,255,0.3);
-                font-size: 12px; font-weight: bold;
-            }}
-            QPushButton:hover {{ background: {hover}; }}
-        """
 
     def add_voter(self):
         if self.db.get_config('election_status') == 'active':
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
 from PyQt6.QtGui import QFont, QColor
 from PyQt6.QtCore import Qt
+from view.common import theme
 
 class AuditLogView(QWidget):
     def __init__(self):
@@ -18,8 +19,7 @@ class AuditLogView(QWidget):
         header_layout.addWidget(title)
         header_layout.addStretch()
 
-        self.live_indicator = QLabel("● LIVE")
-        self.live_indicator.setStyleSheet("color: #2ecc71; font-size: 18px; font-weight: bold;")
+        self.live_indicator = theme.role(QLabel("● LIVE"), "live", dim=False)
         header_layout.addWidget(self.live_indicator)
         layout.addLayout(header_layout)
 
@@ -54,7 +54,4 @@ class AuditLogView(QWidget):
         layout.addWidget(self.table)
 
     def set_live_style(self, visible):
-        if visible:
-            self.live_indicator.setStyleSheet("color: #2ecc71; font-size: 18px; font-weight: bold;")
-        else:
-            self.live_indicator.setStyleSheet("color: rgba(46, 204, 113, 0.2); font-size: 18px; font-weight: bold;")
\ No newline at end of file
+        theme.set_state(self.live_indicator, dim=not visible)
\ No newline at end of file
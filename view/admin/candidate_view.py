@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QComboBox, QFileDialog)
 from PyQt6.QtGui import QFont, QPixmap, QRegularExpressionValidator
 from PyQt6.QtCore import Qt, QRegularExpression
+from view.common import theme
 
 
 class AddCandidateDialog(QDialog):
@@ -109,7 +110,7 @@ class ManageCandidatesView(QWidget):
         self.setup_ui()
 
     def setup_ui(self):
-        self.setStyleSheet("background: transparent;")
+        self.setStyleSheet(theme.PAGE_BACKGROUND)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
 
@@ -2,8 +2,8 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QTableWidget, QTableWidgetItem, QHeaderView,
                              QScrollArea, QFrame, QComboBox, QAbstractItemView, QSizePolicy, QDialog, QRadioButton,
                              QPushButton)
-from PyQt6.QtGui import QFont, QColor, QBrush
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QColor, QBrush, QPainter, QPainterPath
+from PyQt6.QtCore import Qt, QRectF, QVariantAnimation, QEasingCurve
 
 
 class ExportResultsView(QDialog):
@@ -41,6 +41,120 @@ class ExportResultsView(QDialog):
         layout.addLayout(btns)
 
 
+class VoteBar(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumWidth(160)
+        self.display_votes = 0.0
+        self.max_votes = 1
+        self.highlight = False
+        self.anim = QVariantAnimation(self)
+        self.anim.setDuration(600)
+        self.anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.anim.valueChanged.connect(self._on_step)
+
+    def set_votes(self, votes, max_votes, start=None, highlight=False):
+        self.max_votes = max(max_votes, 1)
+        self.highlight = highlight
+        begin = self.display_votes if start is None else float(start)
+        if begin == votes:
+            self.anim.stop()
+            self.display_votes = float(votes)
+            self.update()
+            return
+        self.anim.stop()
+        self.anim.setStartValue(float(begin))
+        self.anim.setEndValue(float(votes))
+        self.anim.start()
+
+    def _on_step(self, value):
+        self.display_votes = value
+        self.update()
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(self.rect()).adjusted(6, 12, -60, -12)
+        track = QPainterPath()
+        track.addRoundedRect(rect, 5, 5)
+        p.fillPath(track, QColor(255, 255, 255, 20))
+        fill_w = rect.width() * min(self.display_votes / self.max_votes, 1.0)
+        if fill_w > 0:
+            fill = QPainterPath()
+            fill.addRoundedRect(QRectF(rect.x(), rect.y(), max(fill_w, 6), rect.height()), 5, 5)
+            p.fillPath(fill, QColor("#f1c40f") if self.highlight else QColor("#2ecc71"))
+        p.setPen(QColor("#f1c40f") if self.highlight else QColor("white"))
+        p.drawText(QRectF(rect.right() + 8, 0, 52, self.height()),
+                   Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, str(round(self.display_votes)))
+
+
+class PositionResultCard(QFrame):
+    def __init__(self, position):
+        super().__init__()
+        self.position = position
+        self.last_votes = {}
+        self.setStyleSheet(
+            "QFrame { background: rgba(255, 255, 255, 0.04); border: 1px solid rgba(255, 255, 255, 0.1); border-radius: 15px; }")
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        layout.setContentsMargins(20, 20, 20, 20)
+
+        lbl = QLabel(position.upper())
+        lbl.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        lbl.setStyleSheet(
+            "color: #f1c40f; border: none; border-left: 4px solid #f1c40f; padding-left: 15px; background: transparent;")
+        layout.addWidget(lbl)
+
+        self.table = QTableWidget(0, 3)
+        self.table.setHorizontalHeaderLabels(["RANK", "CANDIDATE NAME", "TOTAL VOTES"])
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(50)
+        self.table.setShowGrid(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.table.setStyleSheet("""
+            QTableWidget { background: transparent; border: none; color: white; } 
+            QHeaderView::section { background: rgba(255, 255, 255, 0.05); color: #2ecc71; font-weight: bold; border: none; padding: 5px; }
+        """)
+
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+    def resize_rows(self, count):
+        old = self.table.rowCount()
+        if count == old:
+            return
+        self.table.setRowCount(count)
+        for i in range(old, count):
+            self.table.setItem(i, 0, QTableWidgetItem())
+            self.table.setItem(i, 1, QTableWidgetItem())
+            self.table.setCellWidget(i, 2, VoteBar())
+        self.table.setFixedHeight(45 + (count * 50))
+
+    def update_standings(self, candidates):
+        self.resize_rows(len(candidates))
+        top = candidates[0][1] if candidates else 0
+        for i, (name, votes) in enumerate(candidates):
+            is_winner = i == 0 and votes > 0
+            rank_item, name_item = self.table.item(i, 0), self.table.item(i, 1)
+            rank_text = "🏆 WINNER" if is_winner else f"#{i + 1}"
+            if rank_item.text() != rank_text:
+                rank_item.setText(rank_text)
+            if name_item.text() != f"   {name}":
+                name_item.setText(f"   {name}")
+            fg = QBrush(QColor("#f1c40f")) if is_winner else QBrush(QColor("white"))
+            bg = QBrush(QColor(241, 196, 15, 15)) if is_winner else QBrush(Qt.BrushStyle.NoBrush)
+            for item in (rank_item, name_item):
+                item.setForeground(fg)
+                item.setBackground(bg)
+            self.table.cellWidget(i, 2).set_votes(votes, top, self.last_votes.get(name, 0), is_winner)
+        self.last_votes = {name: votes for name, votes in candidates}
+
+
 class ResultsDashboardView(QWidget):
     def __init__(self):
         super().__init__()
@@ -89,48 +203,21 @@ class ResultsDashboardView(QWidget):
         self.results_layout.setSpacing(20)
         self.scroll_area.setWidget(self.results_container)
         layout.addWidget(self.scroll_area)
-
-    def create_position_card(self, position, candidates):
-        card = QFrame()
-        card.setStyleSheet(
-            "QFrame { background: rgba(255, 255, 255, 0.04); border: 1px solid rgba(255, 255, 255, 0.1); border-radius: 15px; }")
-        layout = QVBoxLayout(card)
-        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        layout.setContentsMargins(20, 20, 20, 20)
-
-        lbl = QLabel(position.upper())
-        lbl.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        lbl.setStyleSheet(
-            "color: #f1c40f; border: none; border-left: 4px solid #f1c40f; padding-left: 15px; background: transparent;")
-        layout.addWidget(lbl)
-
-        table = QTableWidget(len(candidates), 3)
-        table.setHorizontalHeaderLabels(["RANK", "CANDIDATE NAME", "TOTAL VOTES"])
-        table.verticalHeader().setVisible(False)
-        table.setShowGrid(False)
-        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        table.setStyleSheet("""
-            QTableWidget { background: transparent; border: none; color: white; } 
-            QHeaderView::section { background: rgba(255, 255, 255, 0.05); color: #2ecc71; font-weight: bold; border: none; padding: 5px; }
-        """)
-
-        header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        table.setFixedHeight(45 + (len(candidates) * 50))
-
-        for i, (name, votes) in enumerate(candidates):
-            rank_text = "🏆 WINNER" if i == 0 and votes > 0 else f"#{i + 1}"
-            table.setItem(i, 0, QTableWidgetItem(rank_text))
-            table.setItem(i, 1, QTableWidgetItem(f"   {name}"))
-            table.setItem(i, 2, QTableWidgetItem(str(votes)))
-            if i == 0 and votes > 0:
-                for col in range(3):
-                    table.item(i, col).setForeground(QBrush(QColor("#f1c40f")))
-                    table.item(i, col).setBackground(QBrush(QColor(241, 196, 15, 15)))
-
-        layout.addWidget(table)
-        return card
\ No newline at end of file
+        self.position_cards = {}
+
+    def sync_position_cards(self, data):
+        for pos in [p for p in self.position_cards if p not in data]:
+            card = self.position_cards.pop(pos)
+            self.results_layout.removeWidget(card)
+            card.deleteLater()
+
+        for index, (pos, candidates) in enumerate(data.items()):
+            card = self.position_cards.get(pos)
+            if card is None:
+                card = PositionResultCard(pos)
+                self.position_cards[pos] = card
+                self.results_layout.insertWidget(index, card)
+            elif self.results_layout.indexOf(card) != index:
+                self.results_layout.removeWidget(card)
+                self.results_layout.insertWidget(index, card)
+            card.update_standings(candidates)
@@ -25,6 +25,30 @@ class ArchiveViewDialog(QDialog):
         layout.addWidget(self.close_btn, 0, Qt.AlignmentFlag.AlignRight)
 
 
+class ProfileReportDialog(QDialog):
+    def __init__(self, text, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("SQL Profile")
+        self.resize(1000, 650)
+        self.setStyleSheet("QDialog { background-color: #1e272e; }")
+        layout = QVBoxLayout(self)
+        self.text = QPlainTextEdit(text)
+        self.text.setReadOnly(True)
+        self.text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text.setFont(QFont("Consolas", 10))
+        self.text.setStyleSheet("QPlainTextEdit { background: rgba(0,0,0,0.3); color: #dfe6e9; border-radius: 12px; padding: 10px; }")
+        layout.addWidget(self.text)
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        self.reset_btn = QPushButton("Reset")
+        self.save_btn = QPushButton("Save to File")
+        self.close_btn = QPushButton("Close")
+        for b in [self.reset_btn, self.save_btn, self.close_btn]:
+            b.setStyleSheet("background: #485460; color: white; font-weight: bold; padding: 10px; border-radius: 8px;")
+            buttons.addWidget(b)
+        layout.addLayout(buttons)
+
+
 class SettingsView(QWidget):
     def __init__(self):
         super().__init__()
@@ -45,6 +69,7 @@ class SettingsView(QWidget):
         self.new_pass = QLineEdit(placeholderText="New Password", echoMode=QLineEdit.EchoMode.Password)
         self.confirm_pass = QLineEdit(placeholderText="Confirm Password", echoMode=QLineEdit.EchoMode.Password)
         self.btn_update_pass = self.create_button("UPDATE PASSWORD", "#27ae60")
+        self.btn_sql_profile = self.create_button("SQL PROFILE REPORT", "#8e44ad")
 
         # Simple Card containers
         c1 = QFrame();
@@ -63,8 +88,12 @@ class SettingsView(QWidget):
         cl3.addWidget(self.new_pass);
         cl3.addWidget(self.confirm_pass);
         cl3.addWidget(self.btn_update_pass)
+        c4 = QFrame();
+        cl4 = QVBoxLayout(c4);
+        cl4.addWidget(QLabel("DIAGNOSTICS"));
+        cl4.addWidget(self.btn_sql_profile)
 
-        for c in [c1, c2, c3]:
+        for c in [c1, c2, c3, c4]:
             c.setStyleSheet(
                 "QFrame { background: rgba(255,255,255,0.05); border-radius: 15px; padding: 20px; } QLabel { color: white; font-weight: bold; }")
             cards_layout.addWidget(c)
@@ -0,0 +1,118 @@
+import os
+import time
+from PyQt6.QtCore import QObject, QTimer
+
+# Kiosk low-power mode: 20 fps cap and no particle effects (snow)
+LOW_POWER = os.environ.get("VOTESPHERE_LOW_POWER") == "1"
+FRAME_MS = 16
+LOW_POWER_FRAME_MS = 50
+
+
+class Ticker:
+    """Drop-in for a widget's private animation QTimer, driven by the shared clock."""
+
+    def __init__(self, clock, widget, callback, interval, particles):
+        self.clock = clock
+        self.widget = widget
+        self.callback = callback
+        self._interval = interval
+        self.particles = particles
+        self.active = False
+        self.due = 0.0
+
+    def start(self, interval=None):
+        if interval is not None: self._interval = interval
+        self.active = True
+        self.due = 0.0
+        self.clock.wake()
+
+    def stop(self):
+        self.active = False
+
+    def setInterval(self, interval):
+        self._interval = interval
+
+    def interval(self):
+        return self._interval
+
+    def isActive(self):
+        return self.active
+
+    def effective_interval(self):
+        return max(self._interval, LOW_POWER_FRAME_MS) if self.clock.low_power else self._interval
+
+    def runnable(self):
+        # Hidden, minimised or fully covered widgets keep their state and resume where they left off
+        if self.particles and self.clock.low_power: return False
+        w = self.widget
+        return w.isVisible() and not w.window().isMinimized() and not w.visibleRegion().isEmpty()
+
+
+class AnimationClock(QObject):
+    """One timer for every decorative animation, so all their repaints land in the same frame."""
+
+    def __init__(self):
+        super().__init__()
+        self.tickers = []
+        self.low_power = LOW_POWER
+        self.timer = QTimer(self)
+        self.timer.setObjectName("animation_clock")
+        self.timer.timeout.connect(self.tick)
+
+    def ticker(self, widget, callback, interval=FRAME_MS, particles=False):
+        t = Ticker(self, widget, callback, interval, particles)
+        self.tickers.append(t)
+        widget.destroyed.connect(lambda *_: self.remove(t))
+        if particles and self.low_power: widget.hide()
+        return t
+
+    def remove(self, ticker):
+        ticker.active = False
+        if ticker in self.tickers: self.tickers.remove(ticker)
+
+    def frame_interval(self):
+        return LOW_POWER_FRAME_MS if self.low_power else FRAME_MS
+
+    def wake(self):
+        if not self.timer.isActive(): self.timer.start(self.frame_interval())
+
+    def set_low_power(self, enabled):
+        self.low_power = enabled
+        for t in self.tickers:
+            if t.particles: t.widget.setVisible(not enabled)
+        if self.timer.isActive(): self.timer.start(self.frame_interval())
+
+    def tick(self):
+        now = time.monotonic() * 1000
+        running = False
+        for t in list(self.tickers):
+            if not t.active: continue
+            running = True
+            if now < t.due - FRAME_MS / 2: continue
+            try:
+                if not t.runnable(): continue
+                step = t.effective_interval()
+                # Stay on the ticker's own cadence on average, but never queue up missed frames
+                t.due = t.due + step if now - t.due < step else now + step
+                t.callback()
+            except RuntimeError:
+                # The C++ widget is gone but destroyed() has not reached us yet
+                self.remove(t)
+        if not running: self.timer.stop()
+
+
+_clock = None
+
+
+def clock():
+    global _clock
+    if _clock is None: _clock = AnimationClock()
+    return _clock
+
+
+def ticker(widget, callback, interval=FRAME_MS, particles=False):
+    return clock().ticker(widget, callback, interval, particles)
+
+
+def set_low_power(enabled):
+    clock().set_low_power(enabled)
\ No newline at end of file
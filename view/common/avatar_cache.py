@@ -0,0 +1,79 @@
+import hashlib
+import threading
+from PyQt6.QtGui import QImage, QPixmap, QPainter, QPainterPath
+from PyQt6.QtCore import Qt
+
+AVATAR_SIZE = 60
+
+
+def image_hash(data):
+    return hashlib.md5(data).hexdigest() if data else None
+
+
+def render_avatar(data, size=AVATAR_SIZE):
+    # QImage + QPainter is safe off the GUI thread; QPixmap is not.
+    src = QImage()
+    if not data or not src.loadFromData(data):
+        return None
+    target = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    target.fill(Qt.GlobalColor.transparent)
+    p = QPainter(target)
+    p.setRenderHint(QPainter.RenderHint.Antialiasing)
+    p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    path = QPainterPath()
+    path.addEllipse(0, 0, size, size)
+    p.setClipPath(path)
+    scaled = src.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
+    p.drawImage((size - scaled.width()) // 2, (size - scaled.height()) // 2, scaled)
+    p.end()
+    return target
+
+
+class AvatarCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pixmaps = {}
+        self._images = {}
+        self._warm_key = None
+        self._worker = None
+
+    def is_warm(self, election_key):
+        return self._warm_key == election_key
+
+    def prewarm(self, election_key, rows):
+        self._warm_key = election_key
+        jobs = [(cid, image_hash(data), data) for cid, data in rows if data]
+        live = {(cid, h) for cid, h, _ in jobs}
+        with self._lock:
+            self._pixmaps = {k: v for k, v in self._pixmaps.items() if k in live}
+            self._images = {k: v for k, v in self._images.items() if k in live}
+            jobs = [job for job in jobs if (job[0], job[1]) not in self._pixmaps]
+        self._worker = threading.Thread(target=self._render_all, args=(jobs,), daemon=True)
+        self._worker.start()
+
+    def _render_all(self, jobs):
+        for cid, h, data in jobs:
+            img = render_avatar(data)
+            if img is not None:
+                with self._lock:
+                    self._images[(cid, h)] = img
+
+    def get(self, cid, img_hash):
+        key = (cid, img_hash)
+        px = self._pixmaps.get(key)
+        if px is None:
+            with self._lock:
+                img = self._images.pop(key, None)
+            if img is not None:
+                px = self._pixmaps[key] = QPixmap.fromImage(img)
+        return px
+
+    def put(self, cid, data):
+        img = render_avatar(data)
+        if img is None:
+            return None
+        px = self._pixmaps[(cid, image_hash(data))] = QPixmap.fromImage(img)
+        return px
+
+
+avatar_cache = AvatarCache()
@@ -0,0 +1,155 @@
+import os
+import sys
+import time
+import threading
+from PyQt6.QtWidgets import QApplication, QLabel
+from PyQt6.QtCore import Qt, QEvent, QTimer
+from PyQt6.QtGui import QFont
+from models import query_profiler
+
+# VOTESPHERE_FRAME_MONITOR=1 logs a summary every few seconds, =overlay also shows it on screen
+MODE = os.environ.get("VOTESPHERE_FRAME_MONITOR", "")
+ENABLED = MODE in ("1", "log", "overlay")
+LOG_FILE = os.environ.get("VOTESPHERE_FRAME_MONITOR_FILE")
+REPORT_INTERVAL = int(os.environ.get("VOTESPHERE_FRAME_MONITOR_INTERVAL", "5000"))
+FRAME_BUDGET = 1 / 60
+PROBE_INTERVAL = 50
+_OWN = "frame_monitor"
+
+
+class Bucket:
+    __slots__ = ("count", "total", "max", "sql", "over")
+
+    def __init__(self):
+        self.count = self.over = 0
+        self.total = self.max = self.sql = 0.0
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max: self.max = elapsed
+        if elapsed > FRAME_BUDGET: self.over += 1
+
+
+class FrameMonitor:
+    def __init__(self):
+        self.timers = {}
+        self.paints = {}
+        self.loop = Bucket()
+        self.current = None
+        self.window_start = time.perf_counter()
+        self.gui_thread = threading.main_thread()
+        self.overlay = None
+        self.probe = None
+
+    def timer_label(self, obj):
+        name = obj.objectName()
+        if name.startswith(_OWN): return None
+        parent = obj.parent()
+        owner = type(parent).__name__ if parent is not None else ""
+        if isinstance(obj, QTimer):
+            if name: return f"{owner}.{name}" if owner else name
+            return f"{owner or 'QTimer'} ({obj.interval()}ms)"
+        return f"{type(obj).__name__}.{name}" if name else type(obj).__name__
+
+    def dispatch(self, notify, receiver, event):
+        etype = event.type()
+        if etype == QEvent.Type.Timer:
+            label, table = self.timer_label(receiver), self.timers
+        elif etype == QEvent.Type.Paint:
+            label = None if receiver.objectName().startswith(_OWN) else type(receiver).__name__
+            table = self.paints
+        else:
+            return notify(receiver, event)
+        if label is None: return notify(receiver, event)
+        bucket = table.get(label)
+        if bucket is None: bucket = table[label] = Bucket()
+        outer, self.current = self.current, bucket
+        start = time.perf_counter()
+        try:
+            return notify(receiver, event)
+        finally:
+            bucket.add(time.perf_counter() - start)
+            self.current = outer
+
+    def add_sql(self, elapsed, sql):
+        # Only SQL run from a timer or paint on the GUI thread blocks a frame
+        if self.current is not None and threading.current_thread() is self.gui_thread:
+            self.current.sql += elapsed
+
+    def start(self):
+        query_profiler.profiler.on_record = self.add_sql
+        self.probe = QTimer()
+        self.probe.setObjectName(_OWN + ".probe")
+        self.probe.setTimerType(Qt.TimerType.PreciseTimer)
+        self.probe.timeout.connect(self.on_probe)
+        self.last_probe = time.perf_counter()
+        self.probe.start(PROBE_INTERVAL)
+        self.reporter = QTimer()
+        self.reporter.setObjectName(_OWN + ".report")
+        self.reporter.timeout.connect(self.publish)
+        self.reporter.start(REPORT_INTERVAL)
+        if MODE == "overlay": self.show_overlay()
+
+    def on_probe(self):
+        now = time.perf_counter()
+        self.loop.add(max(0.0, now - self.last_probe - PROBE_INTERVAL / 1000))
+        self.last_probe = now
+
+    def show_overlay(self):
+        self.overlay = QLabel()
+        self.overlay.setObjectName(_OWN + ".overlay")
+        self.overlay.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint |
+                                    Qt.WindowType.Tool | Qt.WindowType.WindowTransparentForInput)
+        self.overlay.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.overlay.setFont(QFont("Consolas", 9))
+        self.overlay.setStyleSheet("background: rgba(0, 0, 0, 190); color: #2ecc71; padding: 8px;")
+        self.overlay.setText("frame monitor: collecting...")
+        self.overlay.move(10, 10)
+        self.overlay.show()
+
+    def report(self, limit=8):
+        wall = max(time.perf_counter() - self.window_start, 1e-6)
+        loop = self.loop
+        lines = [f"event loop: lag avg {loop.total / loop.count * 1000 if loop.count else 0:.1f} ms, "
+                 f"max {loop.max * 1000:.1f} ms, {loop.over} late ticks > {FRAME_BUDGET * 1000:.0f} ms  ({wall:.1f}s window)"]
+        for title, table in (("timers", self.timers), ("paint", self.paints)):
+            rows = sorted(table.items(), key=lambda kv: kv[1].total, reverse=True)[:limit]
+            busy = sum(b.total for b in table.values())
+            lines.append(f"{title}: {busy / wall * 100:.1f}% of wall time")
+            for label, b in rows:
+                sql = f"  sql {b.sql * 1000:.1f} ms" if b.sql else ""
+                lines.append(f"  {label:<38.38} {b.count / wall:>6.1f}/s  avg {b.total / b.count * 1000:>6.2f} ms  "
+                             f"max {b.max * 1000:>7.2f} ms  {b.over:>4} over{sql}")
+        return "\n".join(lines)
+
+    def publish(self):
+        text = self.report()
+        self.timers, self.paints, self.loop = {}, {}, Bucket()
+        self.window_start = time.perf_counter()
+        if self.overlay is not None:
+            self.overlay.setText(text)
+            self.overlay.adjustSize()
+        stamp = time.strftime("%H:%M:%S")
+        if LOG_FILE:
+            try:
+                with open(LOG_FILE, "a", encoding="utf-8") as f: f.write(f"[{stamp}]\n{text}\n\n")
+            except OSError as e:
+                print(f"Could not write frame monitor log: {e}")
+        else:
+            print(f"[frame monitor {stamp}]\n{text}", file=sys.stderr)
+
+
+monitor = FrameMonitor()
+
+
+class MonitoredApplication(QApplication):
+    def notify(self, receiver, event):
+        return monitor.dispatch(super().notify, receiver, event)
+
+
+def create_application(argv):
+    if not ENABLED: return QApplication(argv)
+    app = MonitoredApplication(argv)
+    monitor.start()
+    return app
\ No newline at end of file
@@ -0,0 +1,108 @@
+from PyQt6.QtWidgets import QFrame, QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
+from PyQt6.QtGui import QImage, QPixmap, QPainter, QColor, QPen
+from PyQt6.QtCore import Qt, QRectF
+
+# Room a GlowCard keeps around its visible body for the glow; a glow radius must fit inside it
+GLOW_MARGIN = 16
+
+_shadows = {}
+
+
+def shadow(color, radius, corner):
+    """Nine-patch source: a rounded rect of `color` blurred by `radius`, rendered once per key.
+
+    The image is 2 * (radius + corner) + 1 pixels square, so each corner patch is
+    radius + corner wide and the middle row/column is the stretchable 1px strip.
+    The rect itself is cut out again so translucent card bodies don't turn solid.
+    """
+    key = (color.rgba(), radius, corner)
+    pix = _shadows.get(key)
+    if pix is None:
+        size = 2 * (radius + corner) + 1
+        src = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        src.fill(Qt.GlobalColor.transparent)
+        p = QPainter(src)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(color)
+        core = QRectF(radius, radius, size - 2 * radius, size - 2 * radius)
+        p.drawRoundedRect(core, corner, corner)
+        p.end()
+        # Blur through a throwaway scene: the same blur QGraphicsDropShadowEffect uses, paid once
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(QPixmap.fromImage(src))
+        blur = QGraphicsBlurEffect()
+        blur.setBlurRadius(radius)
+        blur.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+        item.setGraphicsEffect(blur)
+        scene.addItem(item)
+        out = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        out.fill(Qt.GlobalColor.transparent)
+        p = QPainter(out)
+        scene.render(p, QRectF(0, 0, size, size), QRectF(0, 0, size, size))
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(Qt.GlobalColor.black)
+        p.drawRoundedRect(core, corner, corner)
+        p.end()
+        pix = _shadows[key] = QPixmap.fromImage(out)
+    return pix
+
+
+def draw(painter, rect, color, radius, corner, dx=0, dy=0):
+    """Blit the cached glow for a rounded `rect` as nine pieces; nothing is blurred per paint."""
+    pix = shadow(color, radius, corner)
+    m = radius + corner
+    outer = QRectF(rect).adjusted(-radius + dx, -radius + dy, radius + dx, radius + dy)
+    s = pix.width()
+    xs = [(outer.left(), m, 0, m), (outer.left() + m, outer.width() - 2 * m, m, 1), (outer.right() - m, m, s - m, m)]
+    ys = [(outer.top(), m, 0, m), (outer.top() + m, outer.height() - 2 * m, m, 1), (outer.bottom() - m, m, s - m, m)]
+    for x, w, sx, sw in xs:
+        if w <= 0: continue
+        for y, h, sy, sh in ys:
+            if h <= 0: continue
+            painter.drawPixmap(QRectF(x, y, w, h), pix, QRectF(sx, sy, sw, sh))
+
+
+class GlowCard(QFrame):
+    """Rounded card that paints its own background, border and glow instead of using a
+    stylesheet plus QGraphicsDropShadowEffect (which renders offscreen and re-blurs on every repaint)."""
+
+    def __init__(self, parent=None, corner=12):
+        super().__init__(parent)
+        self.corner = corner
+        self.hovered = False
+        self.hover_border = None
+        self.set_look(QColor(255, 255, 255, 13), QColor("#334155"))
+        # Layouts place children inside contentsRect, so the glow margin never overlaps content
+        self.setContentsMargins(GLOW_MARGIN, GLOW_MARGIN, GLOW_MARGIN, GLOW_MARGIN)
+
+    def set_look(self, background, border, border_width=1, glow=None, glow_radius=GLOW_MARGIN, dx=0, dy=0):
+        self.background, self.border, self.border_width = background, border, border_width
+        self.glow, self.glow_radius, self.glow_offset = glow, min(glow_radius, GLOW_MARGIN - max(abs(dx), abs(dy))), (dx, dy)
+        self.update()
+
+    def body(self):
+        return QRectF(self.rect()).adjusted(GLOW_MARGIN, GLOW_MARGIN, -GLOW_MARGIN, -GLOW_MARGIN)
+
+    def enterEvent(self, event):
+        self.hovered = True
+        if self.hover_border: self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.hovered = False
+        if self.hover_border: self.update()
+        super().leaveEvent(event)
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        body = self.body()
+        if self.glow is not None and self.glow_radius > 0:
+            draw(p, body, self.glow, self.glow_radius, self.corner, *self.glow_offset)
+        half = self.border_width / 2
+        p.setPen(QPen(self.hover_border if self.hovered and self.hover_border else self.border, self.border_width))
+        p.setBrush(self.background)
+        p.drawRoundedRect(body.adjusted(half, half, -half, -half), self.corner, self.corner)
\ No newline at end of file
@@ -1,9 +1,10 @@
 import os
 import sys
-import random
 from PyQt6.QtWidgets import *
 from PyQt6.QtGui import *
 from PyQt6.QtCore import *
+from view.common import animation_clock, pixmap_cache
+from view.common.particles import SnowField
 
 
 def resource_path(relative_path):
@@ -22,9 +23,8 @@ class LoadingScreen(QDialog):
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.angle = 0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.rotate)
-        self.timer.start(15)
+        self.timer = animation_clock.ticker(self, self.rotate, 15)
+        self.timer.start()
         QTimer.singleShot(2000, self.accept)
 
     def rotate(self):
@@ -75,9 +75,8 @@ class ChristmasSnakeFrame(QFrame):
         super().__init__()
         self.setFixedWidth(480)
         self.angle = 0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20)
+        self.timer = animation_clock.ticker(self, self.animate, 20)
+        self.timer.start()
 
     def animate(self):
         self.angle -= 2
@@ -105,27 +104,22 @@ class SnowFallBackground(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.snowflakes = [{'x': random.randint(0, 1920), 'y': random.randint(-50, 1080), 'size': random.randint(1, 3),
-                            'speed': random.uniform(0.5, 1.5)} for _ in range(80)]
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_snow)
-        self.timer.start(30)
+        self.field = SnowField(40, sizes=(1, 2, 3), speed=(0.5, 1.5), color=QColor(100, 200, 255, 40))
+        self.timer = animation_clock.ticker(self, self.update_snow, 30, particles=True)
+        self.timer.start()
+
+    def resizeEvent(self, event):
+        self.field.resize(self.width(), self.height())
+        super().resizeEvent(event)
 
     def update_snow(self):
-        for flake in self.snowflakes:
-            flake['y'] += flake['speed']
-            if flake['y'] > self.height():
-                flake['y'] = -10
-                flake['x'] = random.randint(0, self.width())
+        self.field.step()
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(100, 200, 255, 40))
-        for flake in self.snowflakes:
-            painter.drawEllipse(int(flake['x']), int(flake['y']), flake['size'], flake['size'])
+        self.field.paint(painter)
 
 
 class CustomPopup(QDialog):
@@ -174,12 +168,7 @@ class LoginView(QMainWindow):
 
     def setup_ui(self):
         self.setWindowTitle("VoteSphere - Secure Portal")
-        self.setStyleSheet("QMainWindow { background-color: #0f172a; }")
-
-        bg_path = resource_path("background2.png")
-        if os.path.exists(bg_path):
-            self.setStyleSheet(
-                f"QMainWindow {{ border-image: url({bg_path.replace('\\', '/')}) 0 0 0 0 stretch stretch; }}")
+        # The background is painted from the shared pixmap cache (see paintEvent) so it is decoded once per process
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -195,10 +184,9 @@ class LoginView(QMainWindow):
 
         # 1. Logo
         logo_label = QLabel()
-        logo_path = resource_path("assets/logo.png")
-        if os.path.exists(logo_path):
-            logo_label.setPixmap(QPixmap(logo_path).scaled(160, 160, Qt.AspectRatioMode.KeepAspectRatio,
-                                                           Qt.TransformationMode.SmoothTransformation))
+        logo = pixmap_cache.scaled("assets/logo.png", 160)
+        if not logo.isNull():
+            logo_label.setPixmap(logo)
         else:
             logo_label.setText("🗳️")
             logo_label.setStyleSheet("color: #3498db; font-size: 70px; border: none; background: transparent;")
@@ -266,6 +254,12 @@ class LoginView(QMainWindow):
 
         main_layout.addWidget(self.card)
 
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        bg = pixmap_cache.background("background2.png", self.size())
+        if bg.isNull(): painter.fillRect(self.rect(), QColor("#0f172a"))
+        else: painter.drawPixmap(0, 0, bg)
+
     def resizeEvent(self, event):
         if hasattr(self, 'snow'):
             self.snow.resize(self.width(), self.height())
@@ -274,5 +268,12 @@ class LoginView(QMainWindow):
     def get_credentials(self):
         return self.username_input.text().strip(), self.password_input.text().strip()
 
+    def reset(self):
+        # The window is reused between sessions, so nothing typed by the last user may survive
+        self.username_input.clear()
+        self.password_input.clear()
+        self.login_btn.setEnabled(True)
+        self.username_input.setFocus()
+
     def show_loading(self):
         LoadingScreen(self).exec()
\ No newline at end of file
@@ -1,14 +1,15 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QFrame, QLineEdit, QDialog,
                              QGraphicsOpacityEffect, QSizePolicy, QToolButton)
-from PyQt6.QtCore import Qt, QPropertyAnimation, QRegularExpression, QTimer, QRectF, QPointF
-from PyQt6.QtGui import (QFont, QPixmap, QRegularExpressionValidator, QPainter,
+from PyQt6.QtCore import Qt, QPropertyAnimation, QRegularExpression, QRectF, QPointF
+from PyQt6.QtGui import (QFont, QRegularExpressionValidator, QPainter,
                          QColor, QPen, QConicalGradient, QBrush, QPainterPath, QLinearGradient)
 import uuid
-import random
 from datetime import datetime, timedelta
 
 from models.database import Database
+from view.common import animation_clock, pixmap_cache
+from view.common.particles import SnowField
 from view.admin.admin_dashboard import AdminDashboard
 from view.voter.voter_dashboard import VoterDashboard
 
@@ -56,9 +57,8 @@ class ChristmasSnakeFrame(QFrame):
         self.setFixedWidth(480)
         self.angle = 0
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(20)
+        self.timer = animation_clock.ticker(self, self.animate, 20)
+        self.timer.start()
 
     def animate(self):
         self.angle -= 4
@@ -95,35 +95,22 @@ class SnowFallBackground(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.snowflakes = []
-        for _ in range(150):
-            self.snowflakes.append({
-                'x': random.randint(0, 1920),
-                'y': random.randint(-50, 1080),
-                'size': random.randint(2, 5),
-                'speed': random.randint(1, 3)
-            })
-
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_snow)
-        self.timer.start(30)
+        self.field = SnowField(72, sizes=(2, 3, 4, 5), speed=(1, 3), color=QColor(255, 255, 255, 200))
+        self.timer = animation_clock.ticker(self, self.update_snow, 30, particles=True)
+        self.timer.start()
+
+    def resizeEvent(self, event):
+        self.field.resize(self.width(), self.height())
+        super().resizeEvent(event)
 
     def update_snow(self):
-        for flake in self.snowflakes:
-            flake['y'] += flake['speed']
-            if flake['y'] > self.height():
-                flake['y'] = -10
-                flake['x'] = random.randint(0, self.width())
+        self.field.step()
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(255, 255, 255, 200))
-
-        for flake in self.snowflakes:
-            painter.drawEllipse(flake['x'], flake['y'], flake['size'], flake['size'])
+        self.field.paint(painter)
 
 
 class CustomPopup(QDialog):
@@ -241,7 +228,6 @@ class LoginWindow(QMainWindow):
 
     def setup_ui(self):
         self.setWindowTitle("VoteSphere - Christmas Edition")
-        self.setStyleSheet("QMainWindow { border-image: url(background2.png) 0 0 0 0 stretch stretch; }")
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -263,9 +249,7 @@ class LoginWindow(QMainWindow):
         logo_label.setStyleSheet("background: transparent; border: none;")
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         try:
-            logo_pixmap = QPixmap("logo.png").scaled(180, 180, Qt.AspectRatioMode.KeepAspectRatio,
-                                                     Qt.TransformationMode.SmoothTransformation)
-            logo_label.setPixmap(logo_pixmap)
+            logo_label.setPixmap(pixmap_cache.scaled("logo.png", 180))
         except:
             logo_label.setText("🎄🗳️🎄")
             logo_label.setFont(QFont("Segoe UI Emoji", 80))
@@ -353,6 +337,12 @@ class LoginWindow(QMainWindow):
 
         main_layout.addWidget(card)
 
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        bg = pixmap_cache.background("background2.png", self.size())
+        if bg.isNull(): painter.fillRect(self.rect(), QColor("#0f172a"))
+        else: painter.drawPixmap(0, 0, bg)
+
     def resizeEvent(self, event):
         self.snow.resize(self.width(), self.height())
         super().resizeEvent(event)
@@ -0,0 +1,83 @@
+import random
+from PyQt6.QtGui import QPolygonF, QPen, QColor
+from PyQt6.QtCore import Qt, QPointF
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SnowField:
+    """Falling-snow particles kept in flat arrays and drawn with one drawPoints call per flake size.
+
+    The flake count follows the widget area (density is flakes per megapixel), so a
+    larger window gets more snow but the per-tick cost stays a handful of array ops.
+    """
+
+    def __init__(self, density, sizes=(1, 2, 3), speed=(0.5, 1.5), color=QColor(255, 255, 255, 180),
+                 min_flakes=15, max_flakes=400):
+        self.density = density
+        self.sizes = sizes
+        self.speed = speed
+        self.min_flakes, self.max_flakes = min_flakes, max_flakes
+        self.pens = []
+        for size in sizes:
+            pen = QPen(color, size)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            self.pens.append(pen)
+        self.width = self.height = 0
+        self.count = 0
+        self.groups = []
+
+    def target_count(self, w, h):
+        return max(self.min_flakes, min(self.max_flakes, int(self.density * w * h / 1e6)))
+
+    def resize(self, w, h):
+        count = self.target_count(w, h)
+        self.width, self.height = w, h
+        if count != self.count: self.spawn(count)
+
+    def spawn(self, count):
+        self.count = count
+        per_size = [count // len(self.sizes) + (1 if i < count % len(self.sizes) else 0) for i in range(len(self.sizes))]
+        self.groups = [self.make_group(n) for n in per_size]
+
+    def make_group(self, n):
+        w, h = max(self.width, 1), max(self.height, 1)
+        lo, hi = self.speed
+        if np is None:
+            points = [QPointF(random.uniform(0, w), random.uniform(-50, h)) for _ in range(n)]
+            return [points, [random.uniform(lo, hi) for _ in range(n)], None]
+        if not n: return [QPolygonF(), np.zeros(0), np.zeros((0, 2))]
+        # The polygon's own buffer is the position array, so stepping never copies into Qt
+        poly = QPolygonF()
+        poly.fill(QPointF(), n)
+        ptr = poly.data()
+        ptr.setsize(n * 2 * 8)
+        xy = np.frombuffer(ptr, dtype=np.float64).reshape(n, 2)
+        xy[:, 0] = np.random.uniform(0, w, n)
+        xy[:, 1] = np.random.uniform(-50, h, n)
+        return [poly, np.random.uniform(lo, hi, n), xy]
+
+    def step(self):
+        w, h = self.width, self.height
+        for group in self.groups:
+            if np is None:
+                for p, speed in zip(group[0], group[1]):
+                    y = p.y() + speed
+                    if y > h: p.setX(random.uniform(0, w)); y = -10
+                    p.setY(y)
+                continue
+            xy, speed = group[2], group[1]
+            xy[:, 1] += speed
+            wrapped = xy[:, 1] > h
+            n = int(wrapped.sum())
+            if n:
+                xy[wrapped, 1] = -10
+                xy[wrapped, 0] = np.random.uniform(0, w, n)
+
+    def paint(self, painter):
+        for pen, group in zip(self.pens, self.groups):
+            painter.setPen(pen)
+            painter.drawPoints(group[0] if np is not None else QPolygonF(group[0]))
\ No newline at end of file
@@ -0,0 +1,81 @@
+import os
+import sys
+from PyQt6.QtGui import QPixmap, QGuiApplication
+from PyQt6.QtCore import Qt, QFile, QResource
+
+RESOURCE_FILE = "assets/votesphere.rcc"   # built by build_resources.py
+RESOURCE_ROOT = ":/votesphere"
+# Downscaled background variants compiled into the bundle (common kiosk/lab screen widths)
+BACKGROUND_WIDTHS = (1366, 1920)
+BACKGROUNDS = ("background.png", "background1.png", "background2.png")
+LOGO_SIZE = 360
+LOGOS = ("logo.png", "logo1.png", "logo2.png", "assets/logo.png")
+
+_registered = None
+_decoded = {}
+_scaled = {}
+
+
+def resource_path(relative_path):
+    try:
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path).replace("\\", "/")
+
+
+def variant_name(name, width):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}-{width}{'.jpg' if name in BACKGROUNDS else ext}"
+
+
+def register_resources():
+    global _registered
+    if _registered is None:
+        path = resource_path(RESOURCE_FILE)
+        _registered = os.path.exists(path) and QResource.registerResource(path)
+    return _registered
+
+
+def screen_width():
+    screen = QGuiApplication.primaryScreen()
+    return int(screen.size().width() * screen.devicePixelRatio()) if screen else 1920
+
+
+def source(name):
+    """Best file for `name`: a compiled, pre-scaled variant if the bundle has one, else the original on disk."""
+    if register_resources():
+        if name in BACKGROUNDS:
+            target = screen_width()
+            widths = [w for w in BACKGROUND_WIDTHS if w >= target] or [max(BACKGROUND_WIDTHS)]
+            path = f"{RESOURCE_ROOT}/{variant_name(name, min(widths))}"
+        else:
+            path = f"{RESOURCE_ROOT}/{variant_name(name, LOGO_SIZE) if name in LOGOS else name}"
+        if QFile.exists(path): return path
+    return resource_path(name)
+
+
+def pixmap(name):
+    # Decoded once per process; logout -> login reuses the same QPixmap
+    pix = _decoded.get(name)
+    if pix is None:
+        pix = _decoded[name] = QPixmap(source(name))
+    return pix
+
+
+def scaled(name, width, height=None, mode=Qt.AspectRatioMode.KeepAspectRatio):
+    key = (name, width, height or width, mode)
+    pix = _scaled.get(key)
+    if pix is None:
+        base = pixmap(name)
+        if base.isNull(): return base
+        pix = base.scaled(width, height or width, mode, Qt.TransformationMode.SmoothTransformation)
+        # Windows are resized a lot; only keep the latest couple of sizes per image
+        stale = [k for k in _scaled if k[0] == name and k[3] == mode]
+        for k in stale[:-1]: del _scaled[k]
+        _scaled[key] = pix
+    return pix
+
+
+def background(name, size):
+    return scaled(name, size.width(), size.height(), Qt.AspectRatioMode.IgnoreAspectRatio)
\ No newline at end of file
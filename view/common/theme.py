@@ -0,0 +1,73 @@
+from PyQt6.QtWidgets import QApplication
+
+# One stylesheet for the whole app, parsed once at startup. Widgets that are built in bulk
+# (trend cards, candidate labels, table action buttons, stat titles) get a "role" property
+# and flip state through dynamic properties instead of each carrying its own CSS string.
+STYLESHEET = """
+QFrame[role="trend-card"] { background: rgba(255,255,255,0.05); border-radius: 8px; }
+QLabel[role="trend-title"] { color: #3498db; font-weight: bold; border: none; }
+QLabel[role="trend-empty"] { color: #64748b; font-style: italic; border: none; }
+QLabel[role="trend-rank"] { color: white; font-weight: bold; border: none; }
+QLabel[role="trend-name"] { color: #cbd5e1; border: none; }
+QLabel[role="trend-votes"] { color: #3498db; font-weight: bold; border: none; }
+
+QLabel[role="card-name"] { font-weight: bold; color: white; border: none; }
+QLabel[role="card-grade"] { color: #94a3b8; border: none; }
+QLabel[role="card-check"] { color: #3498db; font-weight: bold; font-size: 20px; border: none; }
+QLabel[role="card-avatar"] { font-size: 24px; color: #94a3b8; background: rgba(255,255,255,0.05); border-radius: 30px; }
+
+QLabel[role="countdown-title"] { font-size: 11px; font-weight: bold; color: #3498db; background: transparent; }
+QLabel[role="countdown-title"][urgent="true"] { color: #e74c3c; }
+
+QLabel[role="live"] { color: #2ecc71; font-size: 18px; font-weight: bold; }
+QLabel[role="live"][dim="true"] { color: rgba(46, 204, 113, 0.2); }
+
+QLabel[role="stat"] { font-size: 50px; font-weight: bold; color: white; background: transparent; border: none; }
+QLabel[role="stat"][compact="true"] { font-size: 36px; }
+QLabel[role="stat-title"] { font-weight: bold; color: #f1c40f; font-size: 28px; background: transparent; border: none; }
+QLabel[role="stat-title"][tone="blue"] { color: #3498db; }
+QLabel[role="stat-title"][tone="green"] { color: #2ecc71; }
+QLabel[role="stat-title"][tone="red"] { color: #e74c3c; }
+
+QPushButton[role="row-action"] { color: white; padding: 6px 10px; border-radius: 5px; border: 1px solid rgba(255,255,255,0.3); font-size: 12px; font-weight: bold; }
+QPushButton[role="row-action"][tone="blue"] { background: #3498db; }
+QPushButton[role="row-action"][tone="blue"]:hover { background: #2980b9; }
+QPushButton[role="row-action"][tone="red"] { background: #e74c3c; }
+QPushButton[role="row-action"][tone="red"]:hover { background: #c0392b; }
+"""
+
+# A parent's own stylesheet outranks the application one, so pages must not blanket every
+# child with "background: transparent"; this keeps it to the widgets that paint a background.
+PAGE_BACKGROUND = "QFrame, QScrollBar, QAbstractItemView { background: transparent; }"
+
+TONES = {"#3498db": "blue", "#2ecc71": "green", "#27ae60": "green", "#e74c3c": "red", "#f1c40f": "yellow"}
+
+
+def install(app=None):
+    app = app or QApplication.instance()
+    app.setStyleSheet(STYLESHEET)
+
+
+def role(widget, name, **props):
+    # Set before the widget is first shown, so it is polished once with the final state
+    widget.setProperty("role", name)
+    for key, value in props.items(): widget.setProperty(key, value)
+    return widget
+
+
+def set_state(widget, **props):
+    """Change dynamic properties; re-polishes only when something actually changed."""
+    changed = False
+    for key, value in props.items():
+        if widget.property(key) != value:
+            widget.setProperty(key, value)
+            changed = True
+    if changed:
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+    return changed
+
+
+def tone(color_hex):
+    return TONES.get(color_hex.lower(), "yellow")
\ No newline at end of file
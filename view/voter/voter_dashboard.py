@@ -1,11 +1,13 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
                              QFrame, QLabel, QPushButton, QScrollArea,
                              QButtonGroup, QRadioButton, QDialog, QSizePolicy,
-                             QApplication, QSplitter, QGraphicsDropShadowEffect)
+                             QApplication, QSplitter)
 from PyQt6.QtGui import (QPixmap, QPainter, QBrush, QPen, QFont, QColor,
                          QPainterPath, QLinearGradient)
 from PyQt6.QtCore import Qt, QTimer, QDateTime, QRectF, QPointF
-import random
+from view.common import animation_clock, pixmap_cache
+from view.common.particles import SnowField
+from view.common.glow import GlowCard
 
 
 #  SNOWFALL ANIMATION
@@ -13,33 +15,22 @@ class SnowFallOverlay(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.snowflakes = []
-        for _ in range(60):
-            self.snowflakes.append({
-                'x': random.randint(0, 1200),
-                'y': random.randint(-50, 800),
-                'size': random.randint(2, 5),
-                'speed': random.randint(1, 3)
-            })
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_snow)
-        self.timer.start(30)
+        self.field = SnowField(60, sizes=(2, 3, 4, 5), speed=(1, 3), color=QColor(255, 255, 255, 180))
+        self.timer = animation_clock.ticker(self, self.update_snow, 30, particles=True)
+        self.timer.start()
+
+    def resizeEvent(self, event):
+        self.field.resize(self.width(), self.height())
+        super().resizeEvent(event)
 
     def update_snow(self):
-        for flake in self.snowflakes:
-            flake['y'] += flake['speed']
-            if flake['y'] > self.height():
-                flake['y'] = -10
-                flake['x'] = random.randint(0, self.width())
+        self.field.step()
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(255, 255, 255, 180))
-        for flake in self.snowflakes:
-            painter.drawEllipse(flake['x'], flake['y'], flake['size'], flake['size'])
+        self.field.paint(painter)
 
 
 #  SIDEBAR BUTTON
@@ -52,9 +43,7 @@ class GlowPositionButton(QPushButton):
 
         self._hover_alpha = 0
         self._is_hovering = False
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._animate)
-        self._timer.setInterval(16)
+        self._timer = animation_clock.ticker(self, self._animate, 16)
 
     def enterEvent(self, event):
         self._is_hovering = True;
@@ -129,9 +118,7 @@ class BallotSubmitAnimation(QWidget):
         self.hide()
         self.paper_y = 0;
         self.paper_alpha = 255
-        self.timer = QTimer(self);
-        self.timer.timeout.connect(self.animate_step);
-        self.timer.setInterval(16)
+        self.timer = animation_clock.ticker(self, self.animate_step, 16)
 
     def start_animation(self):
         self.paper_y = -150;
@@ -198,9 +185,8 @@ class UrgentTimerFrame(QFrame):
         self.current_color = QColor("#27ae60")
         self.glow_alpha = 100;
         self.glow_dir = 5
-        self.timer = QTimer(self);
-        self.timer.timeout.connect(self.animate);
-        self.timer.start(50)
+        self.timer = animation_clock.ticker(self, self.animate, 50)
+        self.timer.start()
 
         layout = QVBoxLayout(self);
         layout.setSpacing(0);
@@ -492,6 +478,7 @@ class VoterDashboard(QMainWindow):
 
         self.selected_candidates = {}
         self.button_groups = {}
+        self.cand_panels = {}
         self.clean_exit = False
 
         self.setup_ui()
@@ -508,18 +495,14 @@ class VoterDashboard(QMainWindow):
         except:
             return "Student"
 
-    # GLOW HELPER
-    def apply_glow_effect(self, frame, is_selected):
-        shadow = QGraphicsDropShadowEffect(self)
+    # GLOW HELPER (cached glow pixmap painted by GlowCard, no per-card blur effect)
+    def style_candidate_card(self, card, is_selected):
         if is_selected:
-            shadow.setBlurRadius(40);
-            shadow.setColor(QColor("#27ae60"));
-            shadow.setOffset(0, 0)
+            card.set_look(QColor(39, 174, 96, 51), QColor("#27ae60"), 2, glow=QColor("#27ae60"))
         else:
-            shadow.setBlurRadius(15);
-            shadow.setColor(QColor(0, 0, 0, 80));
-            shadow.setOffset(3, 3)
-        frame.setGraphicsEffect(shadow)
+            card.set_look(QColor(255, 255, 255, 26), QColor("#bdc3c7"), 2, glow=QColor(0, 0, 0, 80), glow_radius=10, dx=3, dy=3)
+        card.hover_border = QColor("#3498db")
+        card.lbl_check.setVisible(is_selected)
 
     def check_voting_status(self):
         try:
@@ -587,9 +570,7 @@ class VoterDashboard(QMainWindow):
         logo = QLabel()
         logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         try:
-            p = QPixmap("logo.png").scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio,
-                                           Qt.TransformationMode.SmoothTransformation)
-            logo.setPixmap(p)
+            logo.setPixmap(pixmap_cache.scaled("logo.png", 100))
         except:
             logo.setText("🎄");
             logo.setFont(QFont("Arial", 40))
@@ -805,28 +786,26 @@ class VoterDashboard(QMainWindow):
 
     def load_candidates(self, position):
         self.lbl_current_pos.setText(position)
-        while self.layout_cand.count():
-            item = self.layout_cand.takeAt(0)
-            w = item.widget()
-            if w: w.deleteLater()
+        for pos, panel in self.cand_panels.items(): panel.setVisible(pos == position)
+        if position in self.cand_panels: return
 
         try:
             cursor = self.db.conn.cursor()
             cursor.execute("SELECT id, name, grade, image FROM candidates WHERE position=?", (position,))
             candidates = cursor.fetchall()
-            if not candidates: self.layout_cand.addWidget(QLabel("No candidates found.")); return
+            panel = QWidget()
+            panel_layout = QVBoxLayout(panel)
+            panel_layout.setContentsMargins(0, 0, 0, 0)
+            self.cand_panels[position] = panel
+            self.layout_cand.addWidget(panel)
+            if not candidates: panel_layout.addWidget(QLabel("No candidates found.")); return
             if position not in self.button_groups: self.button_groups[position] = QButtonGroup(self)
             group = self.button_groups[position]
             for cid, name, grade, img_data in candidates:
-                card = QFrame();
+                card = GlowCard();
                 card.setObjectName("candCard");
                 card.setCursor(Qt.CursorShape.PointingHandCursor)
                 is_selected = (position in self.selected_candidates and self.selected_candidates[position] == cid)
-                self.apply_glow_effect(card, is_selected)
-                border_col = "#27ae60" if is_selected else "#bdc3c7"
-                bg_col = "rgba(39, 174, 96, 0.2)" if is_selected else "rgba(255, 255, 255, 0.1)"
-                card.setStyleSheet(
-                    f"QFrame#candCard {{ background-color: {bg_col}; border: 2px solid {border_col}; border-radius: 12px; }} QFrame#candCard:hover {{ border: 2px solid #3498db; }}")
 
                 layout = QHBoxLayout(card);
                 layout.setContentsMargins(15, 10, 15, 10);
@@ -877,19 +856,19 @@ class VoterDashboard(QMainWindow):
                 layout.addLayout(info);
                 layout.addStretch()
 
-                if is_selected:
-                    lbl_check = QLabel("🎄");
-                    lbl_check.setStyleSheet("font-size: 20px; border:none; background: transparent;")
-                    layout.addWidget(lbl_check)
-                self.layout_cand.addWidget(card)
+                card.lbl_check = QLabel("🎄");
+                card.lbl_check.setStyleSheet("font-size: 20px; border:none; background: transparent;")
+                layout.addWidget(card.lbl_check)
+                self.style_candidate_card(card, is_selected)
+                panel_layout.addWidget(card)
         except:
             pass
 
     def on_select(self, checked, pos, cid, frame):
+        self.style_candidate_card(frame, checked)
         if checked:
             self.selected_candidates[pos] = cid;
-            self.update_summary();
-            self.load_candidates(pos)
+            self.update_summary()
 
     def update_summary(self):
         count = len(self.selected_candidates)
@@ -957,6 +936,14 @@ class VoterDashboard(QMainWindow):
     def finalize(self):
         try:
             c = self.db.conn.cursor();
+            # Claim first; 0 rows means this account already voted from another device
+            c.execute("UPDATE users SET voted=1 WHERE id=? AND voted=0", (self.user_id,));
+            if c.rowcount == 0:
+                self.db.conn.rollback()
+                self.submit_animation.stop_animation()
+                CustomPopup.show_warning(self, "Already Voted", "A ballot was already submitted for this account.")
+                self.logout(force=True)
+                return
             receipt_list = []
             for p, id in self.selected_candidates.items():
                 c.execute("INSERT INTO votes (voter_id, candidate_id, position) VALUES (?,?,?)", (self.user_id, id, p))
@@ -965,8 +952,6 @@ class VoterDashboard(QMainWindow):
                 n = c.fetchone()[0]
                 receipt_list.append((p, n))
 
-            c.execute("UPDATE users SET voted=1 WHERE id=?", (self.user_id,));
-
             # AUDIT LOGGING
             if hasattr(self.db, 'log_audit'):
                 self.db.log_audit(self.user_name, "Submitted Vote")
@@ -1,11 +1,14 @@
 import os
 import sys
-import random
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
                              QFrame, QLabel, QPushButton, QScrollArea,
-                             QButtonGroup, QRadioButton, QDialog, QGraphicsDropShadowEffect, QSplitter)
-from PyQt6.QtGui import (QPixmap, QPainter, QBrush, QPen, QFont, QColor, QPainterPath, QLinearGradient)
-from PyQt6.QtCore import Qt, QTimer, QRectF, QPointF
+                             QButtonGroup, QRadioButton, QDialog, QSplitter)
+from PyQt6.QtGui import (QPainter, QBrush, QPen, QFont, QColor, QPainterPath, QLinearGradient)
+from PyQt6.QtCore import Qt, QRectF, QPointF
+from view.common import animation_clock, pixmap_cache
+from view.common.particles import SnowField
+from view.common.glow import GlowCard
+from view.common import theme
 
 def resource_path(relative_path):
     try:
@@ -18,26 +21,22 @@ class SnowFallBackground(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.snowflakes = [{'x': random.randint(0, 1920), 'y': random.randint(-50, 1080), 'size': random.randint(1, 3), 'speed': random.uniform(0.5, 1.5)} for _ in range(80)]
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_snow)
-        self.timer.start(30)
+        self.field = SnowField(40, sizes=(1, 2, 3), speed=(0.5, 1.5), color=QColor(100, 200, 255, 40))
+        self.timer = animation_clock.ticker(self, self.update_snow, 30, particles=True)
+        self.timer.start()
+
+    def resizeEvent(self, event):
+        self.field.resize(self.width(), self.height())
+        super().resizeEvent(event)
 
     def update_snow(self):
-        for flake in self.snowflakes:
-            flake['y'] += flake['speed']
-            if flake['y'] > self.height():
-                flake['y'] = -10
-                flake['x'] = random.randint(0, self.width())
+        self.field.step()
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(100, 200, 255, 40))
-        for flake in self.snowflakes:
-            painter.drawEllipse(int(flake['x']), int(flake['y']), flake['size'], flake['size'])
+        self.field.paint(painter)
 
 class GlowPositionButton(QPushButton):
     def __init__(self, text, parent=None):
@@ -47,9 +46,7 @@ class GlowPositionButton(QPushButton):
         self.setFixedHeight(50)
         self._hover_alpha = 0
         self._is_hovering = False
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._animate)
-        self._timer.setInterval(16)
+        self._timer = animation_clock.ticker(self, self._animate, 16)
 
     def enterEvent(self, event):
         self._is_hovering = True
@@ -104,9 +101,7 @@ class BallotSubmitAnimation(QWidget):
         self.hide()
         self.paper_y = 0
         self.paper_alpha = 255
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate_step)
-        self.timer.setInterval(16)
+        self.timer = animation_clock.ticker(self, self.animate_step, 16)
 
     def start_animation(self):
         self.paper_y = -150
@@ -166,15 +161,13 @@ class UrgentTimerFrame(QFrame):
         self.current_color = QColor("#3498db")
         self.glow_alpha = 100
         self.glow_dir = 5
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(50)
+        self.timer = animation_clock.ticker(self, self.animate, 50)
+        self.timer.start()
         layout = QVBoxLayout(self)
         layout.setSpacing(0)
         layout.setContentsMargins(0, 5, 0, 5)
-        self.lbl_title = QLabel("TIME REMAINING")
+        self.lbl_title = theme.role(QLabel("TIME REMAINING"), "countdown-title", urgent=False)
         self.lbl_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_title.setStyleSheet("font-size: 11px; font-weight: bold; color: #3498db; background: transparent;")
         self.lbl_time = QLabel("--:--")
         self.lbl_time.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.lbl_time.setStyleSheet("font-size: 32px; font-weight: bold; color: white; background: transparent;")
@@ -186,7 +179,7 @@ class UrgentTimerFrame(QFrame):
 
     def set_urgent(self, urgent):
         self.current_color = QColor("#e74c3c") if urgent else QColor("#3498db")
-        self.lbl_title.setStyleSheet(f"font-size: 11px; font-weight: bold; color: {self.current_color.name()}; background: transparent;")
+        theme.set_state(self.lbl_title, urgent=bool(urgent))
         self.timer.setInterval(20 if urgent else 50)
 
     def animate(self):
@@ -208,12 +201,44 @@ class UrgentTimerFrame(QFrame):
         painter.setPen(pen)
         painter.drawPath(path)
 
+class CandidateCard(GlowCard):
+    def __init__(self, cid, name, grade, avatar=None, on_select=None, parent=None):
+        super().__init__(parent)
+        self.cid = cid
+        self.on_select = on_select
+        self.selected = None
+        self.setObjectName("candCard")
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        lay = QHBoxLayout(self)
+        img_lbl = QLabel(); img_lbl.setFixedSize(60, 60)
+        if avatar: img_lbl.setPixmap(avatar)
+        else: img_lbl.setText("?"); img_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter); theme.role(img_lbl, "card-avatar")
+        lay.addWidget(img_lbl)
+        inf = QVBoxLayout()
+        inf.addWidget(theme.role(QLabel(name), "card-name"))
+        inf.addWidget(theme.role(QLabel(grade), "card-grade"))
+        lay.addLayout(inf); lay.addStretch()
+        self.chk = theme.role(QLabel("✓"), "card-check")
+        lay.addWidget(self.chk)
+        self.set_selected(False)
+
+    def set_selected(self, selected):
+        if selected == self.selected: return
+        self.selected = selected
+        if selected: self.set_look(QColor(52, 152, 219, 26), QColor("#3498db"), glow=QColor("#3498db"))
+        else: self.set_look(QColor(255, 255, 255, 13), QColor("#334155"), glow=QColor(0, 0, 0, 80), glow_radius=10, dx=3, dy=3)
+        self.chk.setVisible(selected)
+
+    def mousePressEvent(self, event):
+        if self.on_select: self.on_select(self.cid)
+        super().mousePressEvent(event)
+
 class VoteReceiptDialog(QDialog):
     def __init__(self, candidate_list, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Vote Receipt")
         self.setFixedSize(420, 600)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+        self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -270,7 +295,7 @@ class CustomPopup(QDialog):
     def __init__(self, parent, title, message, icon_type="info", ok_text="OK", cancel_text="Cancel"):
         super().__init__(parent)
         self.setFixedSize(400, 280)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+        self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         color = "#3498db"
         icon = "ℹ"
@@ -320,6 +345,23 @@ class CustomPopup(QDialog):
             bl.addWidget(o)
         fl.addLayout(bl)
 
+    @staticmethod
+    def run(p, t, m, icon_type, ok="OK", no="Cancel"):
+        # Parented to the dashboard, which a kiosk keeps all day, so free each popup once answered
+        d = CustomPopup(p, t, m, icon_type, ok, no)
+        accepted = d.exec() == QDialog.DialogCode.Accepted
+        d.deleteLater()
+        return accepted
+
+    @staticmethod
+    def show_info(p, t, m, ok="OK"): CustomPopup.run(p, t, m, "success", ok)
+
+    @staticmethod
+    def show_warning(p, t, m): CustomPopup.run(p, t, m, "warning")
+
+    @staticmethod
+    def ask_question(p, t, m, ok="Yes", no="No"): return CustomPopup.run(p, t, m, "question", ok, no)
+
 class VoterDashboardView(QMainWindow):
     def __init__(self, user_name):
         super().__init__()
@@ -340,8 +382,8 @@ class VoterDashboardView(QMainWindow):
         self.sl = QVBoxLayout(self.sidebar)
         self.logo = QLabel()
         self.logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        path = resource_path("assets/logo.png")
-        if os.path.exists(path): self.logo.setPixmap(QPixmap(path).scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        logo = pixmap_cache.scaled("assets/logo.png", 100)
+        if not logo.isNull(): self.logo.setPixmap(logo)
         else: self.logo.setText("✓"); self.logo.setFont(QFont("Arial", 40)); self.logo.setStyleSheet("color: #3498db;")
         self.sl.addWidget(self.logo)
         self.lbl_welcome = QLabel(f"Welcome,\n{self.user_name}")
@@ -401,7 +443,8 @@ class VoterDashboardView(QMainWindow):
         self.leaders_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         ls = QScrollArea()
         ls.setWidgetResizable(True)
-        ls.setStyleSheet("background: transparent; border: none;")
+        # Scoped, so the trend cards' shared background isn't overridden from here
+        ls.setStyleSheet("QScrollArea, QScrollArea > QWidget, QScrollArea > QWidget > QWidget, QScrollArea QScrollBar { background: transparent; border: none; }")
         ls.setWidget(self.leaders_widget)
         lw.addWidget(ls)
         splitter.addWidget(cand_frame)
@@ -411,13 +454,20 @@ class VoterDashboardView(QMainWindow):
         self.main_layout.addWidget(content)
         self.submit_animation = BallotSubmitAnimation(central)
 
+    def set_voter(self, user_name):
+        self.user_name = user_name
+        self.lbl_welcome.setText(f"Welcome,\n{user_name}")
+
+    def reset(self):
+        self.submit_animation.stop_animation()
+        self.lbl_current_pos.setText("Position View")
+        self.lbl_summary.setText("0 selected")
+        self.btn_submit.setText("SUBMIT BALLOT")
+        self.btn_submit.setEnabled(True)
+        self.timer_frame.update_time("--:--")
+        self.timer_frame.set_urgent(False)
+
     def resizeEvent(self, event):
         self.submit_animation.resize(self.width(), self.height())
         self.snow.resize(self.width(), self.height())
-        super().resizeEvent(event)
-
-    def apply_glow(self, frame, selected):
-        shadow = QGraphicsDropShadowEffect(self)
-        if selected: shadow.setBlurRadius(40); shadow.setColor(QColor("#3498db")); shadow.setOffset(0, 0)
-        else: shadow.setBlurRadius(15); shadow.setColor(QColor(0, 0, 0, 80)); shadow.setOffset(3, 3)
-        frame.setGraphicsEffect(shadow)
\ No newline at end of file
+        super().resizeEvent(event)
\ No newline at end of file